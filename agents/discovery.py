@@ -4,7 +4,7 @@ from typing import Optional
 
 from adapters.base_adapter import BaseApplicationAdapter, DiscoveryResult
 from models.app_profile import ApplicationProfile
-from rag.retriever import TestKnowledgeRetriever
+from rag.retriever import get_shared_retriever
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -33,7 +33,7 @@ class DiscoveryAgent:
         """
         self.adapter = adapter
         self.app_profile = app_profile
-        self.knowledge_retriever = TestKnowledgeRetriever()
+        self.knowledge_retriever = get_shared_retriever()
 
         self.last_discovery: Optional[DiscoveryResult] = None
 
@@ -7,7 +7,7 @@ from adapters.base_adapter import BaseApplicationAdapter
 from models.app_profile import ApplicationProfile
 from models.test_case import TestCase
 from models.test_result import TestResult
-from rag.retriever import TestKnowledgeRetriever
+from rag.retriever import get_shared_retriever
 from hitl.feedback_collector import FeedbackCollector
 from utils.logger import get_logger
 
@@ -39,7 +39,7 @@ class TestExecutorAgent:
         """
         self.adapter = adapter
         self.app_profile = app_profile
-        self.knowledge_retriever = TestKnowledgeRetriever()
+        self.knowledge_retriever = get_shared_retriever()
         self.feedback_collector = FeedbackCollector()
 
         self.test_results: List[TestResult] = []
@@ -9,7 +9,7 @@ from config.llm_config import get_smart_llm
 from config.settings import get_settings
 from models.app_profile import ApplicationProfile
 from models.test_case import TestCase, TestPriority, TestType, TestStep
-from rag.retriever import TestKnowledgeRetriever
+from rag.retriever import get_shared_retriever
 from utils.logger import get_logger
 from utils.helpers import generate_test_id, sanitize_filename
 
@@ -34,7 +34,7 @@ class TestGeneratorAgent:
         self.app_profile = app_profile
         self.settings = get_settings()
         self.llm = get_smart_llm()
-        self.knowledge_retriever = TestKnowledgeRetriever()
+        self.knowledge_retriever = get_shared_retriever()
 
         self.generated_tests: List[TestCase] = []
 
@@ -8,7 +8,7 @@ from config.llm_config import get_smart_llm
 from models.app_profile import ApplicationProfile
 from models.test_case import TestCase, TestPriority, TestType
 from adapters.base_adapter import DiscoveryResult
-from rag.retriever import TestKnowledgeRetriever
+from rag.retriever import get_shared_retriever
 from utils.logger import get_logger
 from utils.helpers import generate_test_id
 
@@ -33,7 +33,7 @@ class TestPlannerAgent:
         """
         self.app_profile = app_profile
         self.llm = get_smart_llm()
-        self.knowledge_retriever = TestKnowledgeRetriever()
+        self.knowledge_retriever = get_shared_retriever()
 
         self.last_plan: Optional[Dict[str, Any]] = None
 
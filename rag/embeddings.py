@@ -74,3 +74,18 @@ class EmbeddingsManager:
             Embedding vector
         """
         return self.embeddings.embed_query(text)
+
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed multiple queries.
+
+        Uses the query-side embedding, which some models compute differently
+        from document embeddings, so each vector matches embed_query().
+
+        Args:
+            texts: List of query texts
+
+        Returns:
+            List of embedding vectors
+        """
+        return [self.embeddings.embed_query(text) for text in texts]
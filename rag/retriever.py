@@ -1,6 +1,8 @@
 """Test knowledge retriever using RAG."""
 
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.documents import Document
 
@@ -11,6 +13,9 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_PATTERN_QUERY = "test patterns for {}"
+_FAILURE_QUERY = "test failure: {}"
+
 
 class TestKnowledgeRetriever:
     """Retrieve relevant test knowledge using RAG."""
@@ -163,6 +168,45 @@ class TestKnowledgeRetriever:
 
         return similar_tests
 
+    def find_similar_tests_batch(
+        self,
+        queries: List[str],
+        k: int = 5,
+        application: Optional[str] = None,
+        test_type: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Find similar test cases for several queries in one batched search.
+
+        Args:
+            queries: Search queries
+            k: Number of results per query
+            application: Filter by application
+            test_type: Filter by test type
+
+        Returns:
+            One list of similar test information per query, in order
+        """
+        filter_dict = {"type": "test_case"}
+        if application:
+            filter_dict["application"] = application
+        if test_type:
+            filter_dict["test_type"] = test_type
+
+        batched = self.vector_store_manager.similarity_search_with_score_batch(
+            [(query, k, filter_dict) for query in queries]
+        )
+
+        logger.debug(f"Found similar tests for {len(queries)} batched queries")
+
+        return [
+            [
+                {"content": doc.page_content, "score": score, "metadata": doc.metadata}
+                for doc, score in hits
+            ]
+            for hits in batched
+        ]
+
     def find_relevant_context(
         self,
         query: str,
@@ -205,7 +249,7 @@ class TestKnowledgeRetriever:
         Returns:
             List of test pattern descriptions
         """
-        query = f"test patterns for {feature}"
+        query = _PATTERN_QUERY.format(feature)
 
         results = self.find_relevant_context(query, k=k, doc_type="test_case")
 
@@ -224,7 +268,7 @@ class TestKnowledgeRetriever:
         Returns:
             List of failure insights
         """
-        query = f"test failure: {error_message}"
+        query = _FAILURE_QUERY.format(error_message)
 
         results = self.vector_store_manager.similarity_search_with_score(
             query,
@@ -243,6 +287,41 @@ class TestKnowledgeRetriever:
 
         return insights
 
+    def search_batch(self, queries: List[Tuple[str, str, int]]) -> List[List[Any]]:
+        """
+        Run several knowledge lookups in one batched search.
+
+        Args:
+            queries: (kind, text, k) tuples, where kind is "feature",
+                "failure" or "similar"
+
+        Returns:
+            One result list per query, shaped like get_test_patterns,
+            get_failure_insights or find_similar_tests respectively
+        """
+        searches = []
+        for kind, text, k in queries:
+            if kind == "feature":
+                searches.append((_PATTERN_QUERY.format(text), k, {"type": "test_case"}))
+            elif kind == "failure":
+                searches.append((_FAILURE_QUERY.format(text), k, {"type": "test_result"}))
+            else:
+                searches.append((text, k, {"type": "test_case"}))
+
+        batched = self.vector_store_manager.similarity_search_with_score_batch(searches)
+
+        results = []
+        for (kind, _, _), hits in zip(queries, batched):
+            if kind == "feature":
+                results.append([doc.page_content for doc, _ in hits])
+            else:
+                results.append([
+                    {"content": doc.page_content, "score": score, "metadata": doc.metadata}
+                    for doc, score in hits
+                ])
+
+        return results
+
     def _test_case_to_text(self, test_case: TestCase) -> str:
         """Convert test case to text representation for embedding."""
         text = f"""
@@ -307,3 +386,56 @@ Duration: {test_result.metrics.duration_seconds:.2f}s
         """Clear the knowledge base."""
         self.vector_store_manager.delete_collection()
         logger.info("Knowledge base cleared")
+
+
+# Shared retrievers by (collection, class), least recently used first
+_SHARED_RETRIEVERS_MAX = 8
+_shared_retrievers: "OrderedDict[Tuple[str, type], TestKnowledgeRetriever]" = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+def get_shared_retriever(
+    collection_name: str = "test_knowledge",
+    retriever_class: type = TestKnowledgeRetriever
+) -> TestKnowledgeRetriever:
+    """
+    Get a process-wide retriever for a collection, opening its store once.
+
+    Code that adds to the knowledge base should write through this instance,
+    so searches see the change: every write bumps the store's version. A
+    store changed any other way (e.g. saved by another process) is picked up
+    after invalidate_shared_retriever().
+
+    Args:
+        collection_name: Vector store collection name
+        retriever_class: Class to instantiate; part of the cache key so a
+            patched or subclassed retriever gets its own instance
+
+    Returns:
+        Shared retriever instance
+    """
+    key = (collection_name, retriever_class)
+
+    with _shared_lock:
+        retriever = _shared_retrievers.get(key)
+        if retriever is not None:
+            _shared_retrievers.move_to_end(key)
+            return retriever
+
+        retriever = retriever_class(collection_name=collection_name)
+        _shared_retrievers[key] = retriever
+        if len(_shared_retrievers) > _SHARED_RETRIEVERS_MAX:
+            _shared_retrievers.popitem(last=False)
+        return retriever
+
+
+def invalidate_shared_retriever(collection_name: str) -> None:
+    """
+    Drop the shared retrievers of a collection so the next call reopens its store.
+
+    Args:
+        collection_name: Vector store collection name
+    """
+    with _shared_lock:
+        for key in [key for key in _shared_retrievers if key[0] == collection_name]:
+            del _shared_retrievers[key]
@@ -1,5 +1,6 @@
 """Vector store management for RAG."""
 
+import itertools
 import pickle
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -14,6 +15,10 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Source of store versions. Drawn from one process-wide counter so a reopened
+# store never reuses a version an earlier instance already handed out
+_versions = itertools.count(1)
+
 
 class VectorStoreManager:
     """Manage vector store for test knowledge base."""
@@ -34,6 +39,9 @@ class VectorStoreManager:
 
         self.vector_store: Optional[VectorStore] = None
 
+        # Replaced on every change to the store so callers can key caches on it
+        self.version = next(_versions)
+
         # Load existing store or create new one
         self._load_or_create_store()
 
@@ -83,6 +91,7 @@ class VectorStoreManager:
 
         try:
             ids = self.vector_store.add_documents(documents)
+            self.version = next(_versions)
             logger.info(f"Added {len(documents)} documents to vector store")
             return ids
         except Exception as e:
@@ -109,6 +118,7 @@ class VectorStoreManager:
 
         try:
             ids = self.vector_store.add_texts(texts, metadatas=metadatas)
+            self.version = next(_versions)
             logger.info(f"Added {len(texts)} texts to vector store")
             return ids
         except Exception as e:
@@ -173,6 +183,37 @@ class VectorStoreManager:
             logger.error(f"Error in similarity search with score: {e}")
             return []
 
+    def similarity_search_with_score_batch(
+        self,
+        searches: List[Tuple[str, int, Optional[Dict[str, Any]]]]
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        Run several scored searches in one call.
+
+        Queries are embedded as similarity_search_with_score() embeds them,
+        so each search returns what the single search would.
+
+        Args:
+            searches: (query, k, filter) tuples
+
+        Returns:
+            One list of (document, score) tuples per search, in order
+        """
+        if not searches:
+            return []
+
+        try:
+            vectors = self.embeddings_manager.embed_queries([query for query, _, _ in searches])
+            results = [
+                self.vector_store.similarity_search_with_score_by_vector(vector, k=k, filter=filter)
+                for vector, (_, k, filter) in zip(vectors, searches)
+            ]
+            logger.debug(f"Batched similarity search ran {len(results)} queries")
+            return results
+        except Exception as e:
+            logger.error(f"Error in batched similarity search: {e}")
+            return [[] for _ in searches]
+
     def save(self) -> None:
         """Save vector store to disk."""
         try:
@@ -189,6 +230,7 @@ class VectorStoreManager:
         store_path = self.store_dir / f"{self.collection_name}.faiss"
         if store_path.exists():
             store_path.unlink()
+            self.version = next(_versions)
             logger.info(f"Deleted vector store: {self.collection_name}")
 
     def get_store(self) -> VectorStore:
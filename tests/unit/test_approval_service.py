@@ -0,0 +1,209 @@
+"""
+Unit Tests for ApprovalService
+
+Tests the approval listings and statistics served from the approval index.
+"""
+
+import json
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from web_ui.services import approval_service
+from web_ui.services.approval_service import ApprovalService
+
+
+def _write_approval(approvals_dir: Path, approval_id: str, status: str = "pending", **fields):
+    requested_at = fields.pop("requested_at", datetime.now())
+    data = {
+        "id": approval_id,
+        "approval_type": "test_plan",
+        "item_id": f"plan-{approval_id}",
+        "item_data": {"foo": "bar"},
+        "item_summary": f"Plan {approval_id}",
+        "status": status,
+        "requested_at": requested_at.isoformat(),
+        **fields,
+    }
+    (approvals_dir / f"{approval_id}.json").write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def approvals_dir(tmp_path, monkeypatch):
+    """Point ApprovalService at an empty approvals directory"""
+    approvals = tmp_path / "approvals"
+    approvals.mkdir()
+    monkeypatch.setattr(approval_service, "APPROVALS_DIR", approvals)
+    return approvals
+
+
+@pytest.mark.unit
+class TestApprovalService:
+    """Test ApprovalService listings"""
+
+    def test_pending_approvals(self, approvals_dir):
+        """Test only pending approvals are listed, newest first"""
+        now = datetime.now()
+        _write_approval(approvals_dir, "A1", requested_at=now - timedelta(minutes=5))
+        _write_approval(approvals_dir, "A2", requested_at=now)
+        _write_approval(approvals_dir, "A3", status="approved", approved_at=now.isoformat())
+
+        pending = ApprovalService.get_pending_approvals()
+
+        assert [p["id"] for p in pending] == ["A2", "A1"]
+        assert pending[0]["type"] == "test_plan"
+        assert pending[0]["is_expired"] is False
+
+    def test_unchanged_approvals_are_not_revalidated(self, approvals_dir):
+        """Test repeat listings reuse parsed approvals instead of rebuilding models"""
+        _write_approval(approvals_dir, "A1")
+        ApprovalService.get_pending_approvals()
+
+        with patch.object(approval_service, "Approval") as mock_approval:
+            pending = ApprovalService.get_pending_approvals()
+            stats = ApprovalService.get_statistics()
+
+        mock_approval.assert_not_called()
+        assert [p["id"] for p in pending] == ["A1"]
+        assert stats["pending"] == 1
+
+    def test_approve_updates_listings(self, approvals_dir):
+        """Test an approval leaves the pending list and is counted as approved"""
+        _write_approval(approvals_dir, "A1")
+        assert len(ApprovalService.get_pending_approvals()) == 1
+
+        result = ApprovalService.approve_approval("A1", approved_by="tester")
+
+        assert result["success"] is True
+        assert ApprovalService.get_pending_approvals() == []
+        assert ApprovalService.get_statistics()["approved"] == 1
+
+    def test_statistics(self, approvals_dir):
+        """Test status counts, type counts, average time and recent list"""
+        now = datetime.now()
+        _write_approval(approvals_dir, "A1", requested_at=now - timedelta(seconds=30))
+        _write_approval(
+            approvals_dir, "A2", status="approved",
+            requested_at=now - timedelta(seconds=20), approved_at=(now - timedelta(seconds=10)).isoformat(),
+        )
+        _write_approval(
+            approvals_dir, "A3", status="rejected",
+            requested_at=now - timedelta(seconds=10), approved_at=now.isoformat(),
+        )
+        (approvals_dir / "broken.json").write_text("{", encoding="utf-8")
+
+        stats = ApprovalService.get_statistics()
+
+        assert stats["total"] == 3
+        assert (stats["pending"], stats["approved"], stats["rejected"]) == (1, 1, 1)
+        assert stats["modified"] == stats["timeout"] == 0
+        assert stats["by_type"] == {"test_plan": 3}
+        assert stats["average_approval_time"] == pytest.approx(10.0)
+        assert [r["id"] for r in stats["recent_approvals"]] == ["A3", "A2", "A1"]
+
+    def test_recent_approvals_keep_newest_ten(self, approvals_dir):
+        """Test the recent list is capped at the 10 newest approvals"""
+        now = datetime.now()
+        for i in range(15):
+            _write_approval(approvals_dir, f"A{i:02d}", requested_at=now - timedelta(minutes=i))
+
+        stats = ApprovalService.get_statistics()
+
+        assert stats["total"] == 15
+        assert [r["id"] for r in stats["recent_approvals"]] == [f"A{i:02d}" for i in range(10)]
+
+    def test_pending_sorted_by_time_not_text(self, approvals_dir):
+        """Test pending order follows requested_at across microsecond precision"""
+        base = datetime(2024, 1, 1, 12, 0, 0)
+        _write_approval(approvals_dir, "A1", requested_at=base)
+        _write_approval(approvals_dir, "A2", requested_at=base + timedelta(microseconds=500))
+        _write_approval(approvals_dir, "A3", requested_at=base - timedelta(microseconds=1))
+
+        pending = ApprovalService.get_pending_approvals()
+
+        assert [p["id"] for p in pending] == ["A2", "A1", "A3"]
+        assert pending[1]["requested_at"] == "2024-01-01T12:00:00"
+
+    def test_statistics_reused_until_approvals_change(self, approvals_dir):
+        """Test unchanged approvals reuse the previous statistics"""
+        _write_approval(approvals_dir, "A1")
+        first = ApprovalService.get_statistics()
+        first["recent_approvals"].clear()
+
+        with patch.object(ApprovalService, "_compute_statistics") as mock_compute:
+            second = ApprovalService.get_statistics()
+        mock_compute.assert_not_called()
+        assert [r["id"] for r in second["recent_approvals"]] == ["A1"]
+
+        _write_approval(approvals_dir, "A2", status="approved")
+        assert ApprovalService.get_statistics()["total"] == 2
+
+        (approvals_dir / "A1.json").unlink()
+        stats = ApprovalService.get_statistics()
+        assert (stats["total"], stats["pending"]) == (1, 0)
+
+    def test_get_approval(self, approvals_dir):
+        """Test details come from the index and missing ids give None"""
+        _write_approval(approvals_dir, "A1")
+        ApprovalService.get_pending_approvals()
+
+        with patch.object(approval_service, "Approval") as mock_approval:
+            details = ApprovalService.get_approval("A1")
+
+        mock_approval.assert_not_called()
+        assert details["id"] == "A1"
+        assert details["item_data"] == {"foo": "bar"}
+        assert ApprovalService.get_approval("missing") is None
+
+    def test_get_approval_returns_copies(self, approvals_dir):
+        """Test mutating returned details leaves the indexed approval untouched"""
+        _write_approval(approvals_dir, "A1", item_data={"steps": ["open"]}, context={"env": "qa"})
+
+        details = ApprovalService.get_approval("A1")
+        details["item_data"]["steps"].append("close")
+        details["context"]["env"] = "prod"
+
+        again = ApprovalService.get_approval("A1")
+        assert again["item_data"] == {"steps": ["open"]}
+        assert again["context"] == {"env": "qa"}
+
+    def test_modify_does_not_share_item_data(self, approvals_dir):
+        """Test modified_item is independent of item_data's nested values"""
+        _write_approval(approvals_dir, "A1", item_data={"steps": ["open"], "keep": 1})
+        ApprovalService.modify_approval("A1", approved_by="tester", modifications={"keep": 2})
+
+        details = ApprovalService.get_approval("A1")
+        details["modified_item"]["steps"].append("close")
+
+        assert ApprovalService.get_approval("A1")["item_data"] == {"steps": ["open"], "keep": 1}
+
+    def test_modify_merges_item_data(self, approvals_dir):
+        """Test modifications override item_data keys without touching item_data"""
+        _write_approval(approvals_dir, "A1", item_data={"foo": "bar", "keep": 1})
+
+        result = ApprovalService.modify_approval("A1", approved_by="tester", modifications={"foo": "baz"})
+
+        assert result["success"] is True
+        details = ApprovalService.get_approval("A1")
+        assert details["status"] == "modified"
+        assert details["modified_item"] == {"foo": "baz", "keep": 1}
+        assert details["item_data"] == {"foo": "bar", "keep": 1}
+
+    def test_expired_approval_times_out_once(self, approvals_dir):
+        """Test an expired approval is written as timed out once, then refused unchanged"""
+        _write_approval(
+            approvals_dir, "A1", requested_at=datetime.now() - timedelta(seconds=120), timeout_seconds=60,
+        )
+
+        assert ApprovalService.approve_approval("A1", approved_by="tester") == {
+            'error': 'Approval expired', 'status': 400,
+        }
+        assert ApprovalService.get_approval("A1")["status"] == "timeout"
+
+        with patch.object(approval_service, "save_json") as mock_save:
+            result = ApprovalService.modify_approval("A1", approved_by="tester", modifications={})
+
+        mock_save.assert_not_called()
+        assert result == {'error': 'Approval already timeout', 'status': 400}
+        assert ApprovalService.approve_approval("missing", approved_by="tester")["status"] == 404
@@ -0,0 +1,230 @@
+"""
+Unit Tests for Generation Tools
+
+Tests ScriptGeneratorTool and CodeTemplateManagerTool.
+"""
+
+import pytest
+from tools.generation.script_generator import ScriptGeneratorTool
+from tools.generation.code_template_manager import CodeTemplateManagerTool
+from tools.base import ToolStatus
+
+
+@pytest.fixture
+def login_test_case():
+    """Test case covering the common step actions"""
+    return {
+        "name": "User Login Test",
+        "description": "Verify login",
+        "steps": [
+            {"step_number": 1, "action": "navigate", "target": ""},
+            {"step_number": 2, "action": "fill", "target": "#username"},
+            {"step_number": 3, "action": "click", "target": "#submit",
+             "expected_result": "Dashboard shown"},
+            {"step_number": 4, "action": "verify", "target": ".welcome"},
+            {"step_number": 5, "action": "hover", "target": "#menu"},
+        ],
+    }
+
+
+@pytest.mark.unit
+class TestScriptGeneratorTool:
+    """Test ScriptGeneratorTool"""
+
+    @pytest.fixture
+    def generator_tool(self):
+        """Create script generator tool"""
+        return ScriptGeneratorTool()
+
+    def test_tool_metadata(self, generator_tool):
+        """Test tool metadata"""
+        metadata = generator_tool.metadata
+
+        assert metadata.name == "script_generator"
+        assert "generation" in metadata.tags
+
+    def test_playwright_script(self, generator_tool, login_test_case):
+        """Test Playwright script generation"""
+        result = generator_tool.execute(
+            test_case=login_test_case,
+            framework="playwright",
+            app_profile={"base_url": "https://example.com"},
+        )
+
+        assert result.is_success()
+        script = result.data["script_content"]
+        assert result.data["filename"] == "test_user_login_test.py"
+        assert "def test_user_login_test(page: Page):" in script
+        assert 'page.goto("https://example.com")' in script
+        assert 'page.fill("#username", "test_value")' in script
+        assert 'page.click("#submit")' in script
+        assert "# Expected: Dashboard shown" in script
+        assert 'expect(page.locator(".welcome")).to_be_visible()' in script
+        assert '# TODO: Implement action "hover" on "#menu"' in script
+        assert result.metadata["step_count"] == 5
+
+    def test_selenium_script(self, generator_tool, login_test_case):
+        """Test Selenium script generation"""
+        result = generator_tool.execute(test_case=login_test_case, framework="selenium")
+
+        assert result.is_success()
+        script = result.data["script_content"]
+        assert "driver = webdriver.Chrome()" in script
+        assert "element.send_keys(\"test_value\")" in script
+        assert script.endswith("    finally:\n        driver.quit()\n")
+        assert "from selenium import webdriver" in result.data["imports"]
+
+    def test_robot_script(self, generator_tool, login_test_case):
+        """Test Robot Framework script generation"""
+        result = generator_tool.execute(test_case=login_test_case, framework="robot")
+
+        assert result.is_success()
+        script = result.data["script_content"]
+        assert result.data["filename"] == "test_user_login_test.robot"
+        assert "    Click Element    #submit\n" in script
+        assert "    # TODO: hover on #menu\n" in script
+
+    def test_no_steps_placeholder(self, generator_tool):
+        """Test placeholder body when no steps are given"""
+        result = generator_tool.execute(
+            test_case={"name": "Empty", "description": ""},
+            framework="playwright",
+        )
+
+        assert result.is_success()
+        assert "# TODO: Add test steps" in result.data["script_content"]
+
+    def test_unhashable_targets(self, generator_tool):
+        """Test list and dict step targets render uncached in every framework"""
+        test_case = {
+            "name": "Odd Targets",
+            "steps": [
+                {"step_number": 1, "action": "click", "target": ["#a", "#b"]},
+                {"step_number": 2, "action": "hover", "target": {"css": "#menu"}},
+            ],
+        }
+
+        scripts = {
+            framework: generator_tool.execute(test_case=test_case, framework=framework)
+            for framework in ("playwright", "selenium", "robot")
+        }
+
+        assert all(result.is_success() for result in scripts.values())
+        assert "page.click(\"['#a', '#b']\")" in scripts["playwright"].data["script_content"]
+        assert "# TODO: Implement action \"hover\" on \"{'css': '#menu'}\"" in scripts["playwright"].data["script_content"]
+        assert "['#a', '#b']" in scripts["selenium"].data["script_content"]
+        assert "{'css': '#menu'}" in scripts["robot"].data["script_content"]
+
+    def test_execute_many_preserves_order(self, generator_tool, login_test_case):
+        """Test batch generation (serial and process pool) keeps input order"""
+        for count in (3, 20):
+            cases = [dict(login_test_case, name=f"Case {i}") for i in range(count)]
+            cases[1] = {}
+
+            results = generator_tool.execute_many(cases, framework="playwright", parallel=True)
+
+            assert len(results) == count
+            assert results[0].data["filename"] == "test_case_0.py"
+            assert results[1].status == ToolStatus.FAILURE
+            assert results[-1].data["filename"] == f"test_case_{count - 1}.py"
+
+    def test_execute_many_reports_worker_errors_per_case(self, generator_tool, login_test_case):
+        """Test a case that cannot reach a worker fails alone"""
+        cases = [dict(login_test_case, name=f"Case {i}") for i in range(16)]
+        cases[2] = dict(login_test_case, unpicklable=lambda: None)
+
+        results = generator_tool.execute_many(cases, framework="playwright", parallel=True)
+
+        assert results[2].status == ToolStatus.ERROR
+        assert results[2].metadata["exception_type"]
+        assert all(r.is_success() for i, r in enumerate(results) if i != 2)
+
+    def test_empty_test_case(self, generator_tool):
+        """Test empty test case is rejected"""
+        result = generator_tool.execute(test_case={}, framework="playwright")
+
+        assert result.status == ToolStatus.FAILURE
+        assert "test_case cannot be empty" in result.error
+
+    def test_unsupported_framework(self, generator_tool, login_test_case):
+        """Test unsupported framework is rejected"""
+        result = generator_tool.execute(test_case=login_test_case, framework="cypress")
+
+        assert result.status == ToolStatus.FAILURE
+        assert result.error == (
+            "Unsupported framework: cypress. "
+            "Supported: ['playwright', 'selenium', 'pytest', 'robot']"
+        )
+
+
+@pytest.mark.unit
+class TestCodeTemplateManagerTool:
+    """Test CodeTemplateManagerTool"""
+
+    @pytest.fixture
+    def template_tool(self):
+        """Create code template manager tool"""
+        return CodeTemplateManagerTool()
+
+    def test_render_template(self, template_tool):
+        """Test template rendering with full context"""
+        result = template_tool.execute(
+            template_type="action",
+            framework="playwright",
+            context={"action": "click", "selector": "#submit"},
+        )
+
+        assert result.is_success()
+        assert result.data["template"] == 'page.click("#submit")'
+        assert "from playwright.sync_api import Page, expect" in result.data["imports"]
+
+    def test_render_template_missing_keys(self, template_tool):
+        """Test missing context keys are left as placeholders"""
+        result = template_tool.execute(
+            template_type="test_function",
+            framework="playwright",
+            context={"test_name": "login"},
+        )
+
+        assert result.is_success()
+        assert "def test_login(page: Page):" in result.data["template"]
+        assert "{description}" in result.data["template"]
+
+    def test_template_not_found(self, template_tool):
+        """Test missing template combination"""
+        result = template_tool.execute(template_type="teardown", framework="robot")
+
+        assert result.status == ToolStatus.FAILURE
+        assert "Template not found" in result.error
+
+    def test_invalid_template_type(self, template_tool):
+        """Test invalid template type"""
+        result = template_tool.execute(template_type="bogus", framework="playwright")
+
+        assert result.status == ToolStatus.FAILURE
+        assert result.error == (
+            "Invalid template_type: bogus. Valid types: "
+            "['test_function', 'import', 'setup', 'teardown', 'fixture', 'action']"
+        )
+
+    def test_render_is_memoized(self, template_tool):
+        """Test repeated renders with the same context hit the cache"""
+        CodeTemplateManagerTool._render_cached.cache_clear()
+        context = {"action": "fill", "selector": "#email"}
+
+        first = template_tool.execute(template_type="action", framework="playwright", context=context)
+        second = template_tool.execute(template_type="action", framework="playwright", context=context)
+
+        assert first.data["template"] == second.data["template"] == 'page.fill("#email")'
+        assert CodeTemplateManagerTool._render_cached.cache_info().hits == 1
+
+    def test_render_unhashable_context(self, template_tool):
+        """Test unhashable context values bypass the cache"""
+        result = template_tool.execute(
+            template_type="action",
+            framework="playwright",
+            context={"action": "click", "selector": ["#a"]},
+        )
+
+        assert result.is_success()
+        assert result.data["template"] == "page.click(\"['#a']\")"
@@ -0,0 +1,177 @@
+"""
+Unit Tests for JsonDirIndex
+
+Tests the parsed-record cache behind the approvals and feedback listings.
+"""
+
+import json
+import os
+import pytest
+from unittest.mock import patch
+from web_ui.services import json_index
+from web_ui.services.json_index import JsonDirIndex
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.mark.unit
+class TestJsonDirIndex:
+    """Test JsonDirIndex"""
+
+    def test_lists_json_files(self, tmp_path):
+        """Test every *.json file is parsed and other files are ignored"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        _write(tmp_path / "b.json", {"id": "b"})
+        (tmp_path / "notes.txt").write_text("x")
+
+        index = JsonDirIndex(tmp_path)
+
+        assert sorted(r["id"] for r in index.values()) == ["a", "b"]
+
+    def test_unchanged_files_are_not_reparsed(self, tmp_path):
+        """Test a second read reuses parsed records"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        index = JsonDirIndex(tmp_path)
+        index.values()
+
+        with patch.object(json_index, "load_json") as mock_load:
+            assert index.values() == [{"id": "a"}]
+
+        mock_load.assert_not_called()
+
+    def test_changed_added_and_removed_files(self, tmp_path):
+        """Test in-place rewrites, new files and deletions are picked up"""
+        _write(tmp_path / "a.json", {"id": "a", "status": "pending"})
+        _write(tmp_path / "b.json", {"id": "b"})
+        index = JsonDirIndex(tmp_path)
+        index.values()
+
+        _write(tmp_path / "a.json", {"id": "a", "status": "approved"})
+        _write(tmp_path / "c.json", {"id": "c"})
+        os.remove(tmp_path / "b.json")
+
+        records = {r["id"]: r for r in index.values()}
+        assert sorted(records) == ["a", "c"]
+        assert records["a"]["status"] == "approved"
+
+    def test_replaced_file_with_same_size_and_mtime(self, tmp_path):
+        """Test a file atomically replaced by one of equal size and mtime is re-read"""
+        target = tmp_path / "a.json"
+        _write(target, {"id": "a", "status": "pending"})
+        index = JsonDirIndex(tmp_path)
+        assert index.get("a.json")["status"] == "pending"
+        mtime_ns = target.stat().st_mtime_ns
+
+        replacement = tmp_path / "a.json.tmp"
+        _write(replacement, {"id": "a", "status": "expired"})
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        os.replace(replacement, target)
+
+        assert index.values()[0]["status"] == "expired"
+        assert index.get("a.json")["status"] == "expired"
+
+    def test_generation_tracks_changes(self, tmp_path):
+        """Test the scan generation only moves when records change"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        index = JsonDirIndex(tmp_path)
+        generation, _ = index.scan()
+
+        assert index.scan()[0] == generation
+
+        _write(tmp_path / "b.json", {"id": "b"})
+        added, _ = index.scan()
+        assert added != generation
+
+        os.remove(tmp_path / "a.json")
+        removed, items = index.scan()
+        assert removed != added
+        assert [record for _, record in items] == [{"id": "b"}]
+
+        index.invalidate(tmp_path / "b.json")
+        assert index.scan()[0] != removed
+
+    def test_get_single_file(self, tmp_path):
+        """Test get() reuses an unchanged record and re-reads a changed one"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        index = JsonDirIndex(tmp_path)
+        index.values()
+
+        with patch.object(json_index, "load_json") as mock_load:
+            assert index.get("a.json") == {"id": "a"}
+        mock_load.assert_not_called()
+
+        _write(tmp_path / "a.json", {"id": "a", "status": "approved"})
+        assert index.get("a.json")["status"] == "approved"
+
+        os.remove(tmp_path / "a.json")
+        with pytest.raises(FileNotFoundError):
+            index.get("a.json")
+        assert index.values() == []
+
+    def test_invalidate_forces_reparse(self, tmp_path):
+        """Test invalidate() re-reads a file even if its stat is unchanged"""
+        path = tmp_path / "a.json"
+        _write(path, {"v": 1})
+        index = JsonDirIndex(tmp_path)
+        index.values()
+
+        st = path.stat()
+        _write(path, {"v": 2})
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        index.invalidate(path)
+
+        assert index.values() == [{"v": 2}]
+
+    def test_bad_files_reported_each_read(self, tmp_path):
+        """Test unreadable files go to on_error on every read and are skipped"""
+        (tmp_path / "bad.json").write_text("{")
+        _write(tmp_path / "ok.json", {"id": "ok"})
+        errors = []
+        index = JsonDirIndex(tmp_path, on_error=lambda path, e: errors.append(path.name))
+
+        assert index.values() == [{"id": "ok"}]
+        assert index.values() == [{"id": "ok"}]
+        assert errors == ["bad.json", "bad.json"]
+
+    def test_missing_directory(self, tmp_path):
+        """Test a missing directory lists as empty"""
+        assert JsonDirIndex(tmp_path / "missing").items() == []
+
+    def test_snapshot_warm_start(self, tmp_path):
+        """Test a new index reads unchanged records from the snapshot"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        _write(tmp_path / "b.json", {"id": "b"})
+        snapshot = tmp_path / ".index_snapshot"
+        JsonDirIndex(tmp_path, snapshot=snapshot).values()
+        _write(tmp_path / "b.json", {"id": "b", "status": "approved"})
+
+        with patch.object(json_index, "load_json", wraps=json_index.load_json) as mock_load:
+            records = {r["id"]: r for r in JsonDirIndex(tmp_path, snapshot=snapshot).values()}
+
+        assert records["b"]["status"] == "approved"
+        assert [c.args[0] for c in mock_load.call_args_list] == [
+            str(snapshot), str(tmp_path / "b.json")
+        ]
+
+    def test_corrupt_snapshot_is_ignored(self, tmp_path):
+        """Test an unreadable snapshot falls back to reading the files"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        snapshot = tmp_path / ".index_snapshot"
+        snapshot.write_text("{", encoding="utf-8")
+
+        assert JsonDirIndex(tmp_path, snapshot=snapshot).values() == [{"id": "a"}]
+        assert json.loads(snapshot.read_text(encoding="utf-8"))["version"] == json_index._SNAPSHOT_VERSION
+
+    def test_malformed_snapshot_is_ignored(self, tmp_path):
+        """Test well-formed JSON with the wrong shape falls back to reading the files"""
+        _write(tmp_path / "a.json", {"id": "a"})
+        _write(tmp_path / "b.json", {"id": "b"})
+        snapshot = tmp_path / ".index_snapshot"
+        version = json_index._SNAPSHOT_VERSION
+
+        for entries in ([], {"a.json": 5, "b.json": [1, 2]}):
+            _write(snapshot, {"version": version, "entries": entries})
+            records = sorted(JsonDirIndex(tmp_path, snapshot=snapshot).values(), key=lambda r: r["id"])
+            assert records == [{"id": "a"}, {"id": "b"}]
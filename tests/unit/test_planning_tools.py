@@ -156,6 +156,22 @@ Comprehensive testing approach for login feature
         assert result.is_success()
         assert result.metadata["similar_tests_count"] == 1
 
+    @patch('tools.planning.test_plan_generator.get_smart_llm')
+    def test_llm_reused_across_calls(self, mock_get_llm, generator_tool):
+        """Test the LLM and its model name are looked up once per tool"""
+        mock_llm = Mock()
+        mock_llm.model_name = "gpt-test"
+        mock_llm.invoke.return_value = Mock(content="Plan")
+        mock_get_llm.return_value = mock_llm
+
+        for _ in range(2):
+            result = generator_tool.execute(feature_description="Feature", app_name="App")
+            assert result.is_success()
+            assert result.metadata["llm_model"] == "gpt-test"
+
+        mock_get_llm.assert_called_once()
+        assert mock_llm.invoke.call_count == 2
+
     @patch('tools.planning.test_plan_generator.get_smart_llm')
     def test_llm_exception(self, mock_get_llm, generator_tool):
         """Test LLM exception handling"""
@@ -256,6 +272,10 @@ class TestTestCaseExtractorTool:
         assert test_case["application"] == "My App"
         assert test_case["feature"] == "Login"
 
+        ids = [tc["id"] for tc in result.data["test_cases"]]
+        assert len(set(ids)) == len(ids)
+        assert all(test_id.startswith("TEST-") and len(test_id) == 13 for test_id in ids)
+
     def test_empty_llm_response(self, extractor_tool):
         """Test with empty LLM response"""
         result = extractor_tool.execute(
@@ -328,6 +348,77 @@ class TestTestCaseExtractorTool:
         )
 
         assert result.is_success()
+        # Indented numbered steps belong to the test case, not new headers
+        assert result.data["count"] == 1
+        assert len(result.data["test_cases"][0]["steps"]) == 3
+
+    def test_iter_test_cases(self, extractor_tool, sample_llm_response):
+        """Test streamed extraction yields the same test cases lazily"""
+        listed = extractor_tool.execute(
+            llm_response=sample_llm_response,
+            app_name="App",
+            feature="Login"
+        )
+        streamed = extractor_tool.iter_test_cases(
+            llm_response=sample_llm_response,
+            app_name="App",
+            feature="Login"
+        )
+
+        assert not isinstance(streamed, list)
+        assert [tc["name"] for tc in streamed] == [
+            tc["name"] for tc in listed.data["test_cases"]
+        ]
+        with pytest.raises(ValueError, match="cannot be empty"):
+            extractor_tool.iter_test_cases(llm_response="  ", app_name="App", feature="Login")
+
+    def test_test_cases_heading_takes_priority(self, extractor_tool):
+        """Test a '## Test Cases' heading wins over an earlier 'Test Cases:' label"""
+        llm_response = """
+Test Cases:
+### Draft Case
+outline only
+
+## Test Cases
+1. Final Case
+Priority: high
+"""
+        result = extractor_tool.execute(
+            llm_response=llm_response,
+            app_name="App",
+            feature="Login"
+        )
+
+        assert result.is_success()
+        assert [tc["name"] for tc in result.data["test_cases"]] == ["Final Case"]
+        assert result.data["test_cases"][0]["priority"] == "high"
+
+    def test_test_case_fields_any_order(self, extractor_tool):
+        """Test each field resolves to its first occurrence regardless of order"""
+        llm_response = """
+### Checkout Test
+Description: Buy an item
+- Priority: low
+Test Steps:
+- add to cart
+- pay
+Type: e2e
+Preconditions:
+- cart empty
+"""
+        result = extractor_tool.execute(
+            llm_response=llm_response,
+            app_name="App",
+            feature="Checkout"
+        )
+
+        assert result.is_success()
+        test_case = result.data["test_cases"][0]
+        assert test_case["priority"] == "low"
+        assert test_case["type"] == "e2e"
+        assert test_case["description"].startswith("Buy an item")
+        assert test_case["preconditions"] == ["cart empty"]
+        assert [s["action"] for s in test_case["steps"]] == ["add to cart", "pay"]
 
 
 @pytest.mark.unit
@@ -115,6 +115,112 @@ class TestVectorSearchTool:
         assert result.status == ToolStatus.ERROR
         assert "Vector search failed" in result.error
 
+    def test_retriever_class_resolves_lazily(self):
+        """Test the deferred retriever import resolves to the real class"""
+        import tools.rag.vector_search as vector_search
+        from rag.retriever import TestKnowledgeRetriever
+
+        assert vector_search.TestKnowledgeRetriever is TestKnowledgeRetriever
+        with pytest.raises(AttributeError):
+            vector_search.NoSuchName
+
+    @patch('tools.rag.vector_search.TestKnowledgeRetriever')
+    def test_retriever_reused_across_instances(self, mock_retriever_class):
+        """Test tool instances share one retriever per collection"""
+        mock_retriever = Mock()
+        mock_retriever.find_similar_tests.return_value = []
+        mock_retriever_class.return_value = mock_retriever
+
+        for _ in range(2):
+            tool = VectorSearchTool(config={"collection_name": "test_knowledge"})
+            assert tool.execute(query="login", doc_type="test_case").is_success()
+
+        mock_retriever_class.assert_called_once_with(collection_name="test_knowledge")
+
+    @patch('tools.rag.vector_search.TestKnowledgeRetriever')
+    def test_repeated_search_is_cached(self, mock_retriever_class, search_tool):
+        """Test identical searches hit the results cache"""
+        VectorSearchTool.clear_cache()
+        mock_retriever = Mock()
+        mock_retriever.find_similar_tests.return_value = [
+            {"content": "Login test", "score": 0.9, "metadata": {"test_name": "Login"}}
+        ]
+        mock_retriever_class.return_value = mock_retriever
+
+        first = search_tool.execute(query="login", doc_type="test_case")
+        first.data["results"][0]["metadata"]["test_name"] = "mutated"
+        second = search_tool.execute(query="login", doc_type="test_case")
+
+        mock_retriever.find_similar_tests.assert_called_once()
+        assert second.data["results"][0]["metadata"]["test_name"] == "Login"
+        assert second.metadata["cache"]["hits"] == 1
+
+        search_tool.execute(query="login", k=3, doc_type="test_case")
+        assert mock_retriever.find_similar_tests.call_count == 2
+
+    @patch('tools.rag.vector_search.TestKnowledgeRetriever')
+    def test_empty_search_is_not_cached(self, mock_retriever_class, search_tool):
+        """Test searches that found nothing are retried rather than memoized"""
+        VectorSearchTool.clear_cache()
+        mock_retriever = Mock()
+        mock_retriever.find_similar_tests.return_value = []
+        mock_retriever_class.return_value = mock_retriever
+
+        assert search_tool.execute(query="login", doc_type="test_case").data["count"] == 0
+        mock_retriever.find_similar_tests.return_value = [
+            {"content": "Login test", "score": 0.9, "metadata": {}}
+        ]
+        result = search_tool.execute(query="login", doc_type="test_case")
+
+        assert result.data["count"] == 1
+        assert mock_retriever.find_similar_tests.call_count == 2
+
+    @patch('tools.rag.vector_search.TestKnowledgeRetriever')
+    def test_store_change_invalidates_cache(self, mock_retriever_class, search_tool):
+        """Test a new store version bypasses results cached before the change"""
+        VectorSearchTool.clear_cache()
+        mock_retriever = Mock()
+        mock_retriever.vector_store_manager.version = 0
+        mock_retriever.find_similar_tests.return_value = [
+            {"content": "Login test", "score": 0.9, "metadata": {}}
+        ]
+        mock_retriever_class.return_value = mock_retriever
+
+        search_tool.execute(query="login", doc_type="test_case")
+        search_tool.execute(query="login", doc_type="test_case")
+        assert mock_retriever.find_similar_tests.call_count == 1
+
+        mock_retriever.vector_store_manager.version = 1
+        search_tool.execute(query="login", doc_type="test_case")
+        assert mock_retriever.find_similar_tests.call_count == 2
+
+    @patch('tools.rag.vector_search.TestKnowledgeRetriever')
+    def test_execute_batch(self, mock_retriever_class, search_tool):
+        """Test batched search returns one result list per query"""
+        mock_retriever = Mock()
+        mock_retriever.find_similar_tests_batch.return_value = [
+            [{"content": "Login test", "score": 0.9, "metadata": {}}],
+            [],
+        ]
+        mock_retriever_class.return_value = mock_retriever
+
+        result = search_tool.execute_batch(queries=["login", "logout"], k=2, application="my_app")
+
+        assert result.is_success()
+        assert result.data["results"][0][0]["content"] == "Login test"
+        assert result.data["results"][1] == []
+        assert result.data["count"] == 1
+        mock_retriever.find_similar_tests_batch.assert_called_once_with(
+            queries=["login", "logout"], k=2, application="my_app", test_type=None
+        )
+
+    def test_execute_batch_rejects_empty_query(self, search_tool):
+        """Test batched search validates every query"""
+        result = search_tool.execute_batch(queries=["login", "  "])
+
+        assert result.status == ToolStatus.FAILURE
+        assert "Query cannot be empty" in result.error
+
 
 @pytest.mark.unit
 class TestTestPatternRetrieverTool:
@@ -247,6 +353,72 @@ class TestTestPatternRetrieverTool:
         assert result.data["pattern_type"] == "similar"
         assert mock_retriever.find_similar_tests.called
 
+    @patch('tools.rag.pattern_retriever.TestKnowledgeRetriever')
+    def test_retriever_reused_across_calls(self, mock_retriever_class):
+        """Test the retriever for a collection is built once and reused"""
+        mock_retriever = Mock()
+        mock_retriever.get_test_patterns.return_value = ["Pattern"]
+        mock_retriever_class.return_value = mock_retriever
+
+        for _ in range(3):
+            result = TestPatternRetrieverTool().execute(pattern_type="feature", feature="login")
+            assert result.is_success()
+
+        mock_retriever_class.assert_called_once_with(collection_name="test_knowledge")
+        assert mock_retriever.get_test_patterns.call_count == 3
+
+    @patch('tools.rag.pattern_retriever.TestKnowledgeRetriever')
+    def test_execute_batch(self, mock_retriever_class, pattern_tool):
+        """Test batched retrieval issues one search and keeps request order"""
+        mock_retriever = Mock()
+        mock_retriever.search_batch.return_value = [
+            ["Pattern 1"],
+            [{"content": "Similar failure", "score": 0.9, "metadata": {}}],
+        ]
+        mock_retriever_class.return_value = mock_retriever
+
+        results = pattern_tool.execute_batch([
+            {"pattern_type": "feature", "feature": "login"},
+            {"pattern_type": "failure"},
+            {"pattern_type": "failure", "error_message": "Timeout", "k": 5},
+        ])
+
+        assert [r.status for r in results] == [
+            ToolStatus.SUCCESS, ToolStatus.FAILURE, ToolStatus.SUCCESS
+        ]
+        assert results[0].data["patterns"] == ["Pattern 1"]
+        assert results[2].data["pattern_type"] == "failure"
+        assert results[2].metadata["tool"] == "test_pattern_retriever"
+        mock_retriever.search_batch.assert_called_once_with(
+            [("feature", "login", 3), ("failure", "Timeout", 5)]
+        )
+        assert len({r.execution_time for r in results}) == 1
+        assert all(r.metadata["tool"] == "test_pattern_retriever" for r in results)
+
+    def test_execute_batch_unexpected_error(self, pattern_tool):
+        """Test an exception outside the search gives an ERROR result per request"""
+        results = pattern_tool.execute_batch([{"pattern_type": "similar"}, None])
+
+        assert [r.status for r in results] == [ToolStatus.ERROR, ToolStatus.ERROR]
+        assert results[0] is not results[1]
+        assert results[0].metadata["exception_type"] == "AttributeError"
+
+    @patch('tools.rag.pattern_retriever.TestKnowledgeRetriever')
+    def test_execute_multi(self, mock_retriever_class, pattern_tool):
+        """Test all pattern types are retrieved with one batched search"""
+        mock_retriever = Mock()
+        mock_retriever.search_batch.return_value = [["Pattern"], [], []]
+        mock_retriever_class.return_value = mock_retriever
+
+        results = pattern_tool.execute_multi(feature="login", error_message="Timeout")
+
+        assert list(results) == ["feature", "failure", "similar"]
+        assert all(r.is_success() for r in results.values())
+        assert results["feature"].data["patterns"] == ["Pattern"]
+        mock_retriever.search_batch.assert_called_once_with(
+            [("feature", "login", 3), ("failure", "Timeout", 3), ("similar", "login", 3)]
+        )
+
 
 @pytest.mark.unit
 class TestRAGToolsIntegration:
@@ -279,3 +451,85 @@ class TestRAGToolsIntegration:
         tool_names = [t.name for t in rag_tools]
         assert "vector_search" in tool_names
         assert "test_pattern_retriever" in tool_names
+
+
+@pytest.mark.unit
+class TestSharedRetriever:
+    """Test the process-wide retriever cache"""
+
+    def test_reused_until_invalidated(self):
+        """Test the shared retriever is reused until its collection is invalidated"""
+        import rag.retriever as retriever_module
+
+        retriever_class = Mock(side_effect=lambda collection_name: Mock())
+
+        first = retriever_module.get_shared_retriever("kb", retriever_class)
+        assert retriever_module.get_shared_retriever("kb", retriever_class) is first
+
+        retriever_module.invalidate_shared_retriever("kb")
+        second = retriever_module.get_shared_retriever("kb", retriever_class)
+
+        assert second is not first
+        assert retriever_class.call_count == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test a full cache evicts the retriever used longest ago"""
+        import rag.retriever as retriever_module
+
+        retriever_class = Mock(side_effect=lambda collection_name: Mock())
+        limit = retriever_module._SHARED_RETRIEVERS_MAX
+        first = retriever_module.get_shared_retriever("kb0", retriever_class)
+        for i in range(1, limit):
+            retriever_module.get_shared_retriever(f"kb{i}", retriever_class)
+
+        # Touch the oldest entry, then overflow the cache by one
+        assert retriever_module.get_shared_retriever("kb0", retriever_class) is first
+        retriever_module.get_shared_retriever(f"kb{limit}", retriever_class)
+
+        assert retriever_module.get_shared_retriever("kb0", retriever_class) is first
+        assert retriever_class.call_count == limit + 1
+
+
+@pytest.mark.unit
+class TestVectorStoreBatch:
+    """Test batched searches against a small in-memory FAISS store"""
+
+    def test_batch_matches_single_searches(self):
+        """Test batched results equal single searches when queries embed differently from documents"""
+        from langchain_community.vectorstores import FAISS
+        from langchain_core.embeddings import Embeddings
+        from rag.embeddings import EmbeddingsManager
+        from rag.vector_store import VectorStoreManager
+
+        class AsymmetricEmbeddings(Embeddings):
+            """Letter counts, with queries weighted towards vowels"""
+
+            def _vector(self, text, vowel_weight):
+                return [
+                    text.count(c) * (vowel_weight if c in "aeiou" else 1.0)
+                    for c in "abcdefghijklmnopqrstuvwxyz"
+                ]
+
+            def embed_documents(self, texts):
+                return [self._vector(text, 1.0) for text in texts]
+
+            def embed_query(self, text):
+                return self._vector(text, 5.0)
+
+        embeddings = AsymmetricEmbeddings()
+        embeddings_manager = EmbeddingsManager.__new__(EmbeddingsManager)
+        embeddings_manager.embeddings = embeddings
+        manager = VectorStoreManager.__new__(VectorStoreManager)
+        manager.embeddings_manager = embeddings_manager
+        manager.vector_store = FAISS.from_texts(
+            ["login page", "checkout flow", "user logout", "search results", "audio settings"],
+            embeddings,
+        )
+
+        searches = [("login", 2, None), ("queue audio", 3, None), ("checkout", 1, None)]
+        batched = manager.similarity_search_with_score_batch(searches)
+
+        assert batched == [
+            manager.similarity_search_with_score(query, k=k, filter=filter)
+            for query, k, filter in searches
+        ]
@@ -0,0 +1,279 @@
+"""
+Unit Tests for Reporting Tools
+
+Tests ReportGeneratorTool.
+"""
+
+import pytest
+from tools.reporting.report_generator import ReportGeneratorTool
+from tools.reporting.report_writer import ReportWriterTool
+from tools.base import ToolStatus
+
+
+@pytest.fixture
+def test_results():
+    """Mixed results covering each status and duration source"""
+    return [
+        {"test_name": "Login", "status": "passed", "metrics": {"duration_seconds": 1.5}},
+        {"test_name": "Logout", "status": "failed", "duration_seconds": 2.0,
+         "error_message": "Timeout waiting for #logout"},
+        {"test_name": "Search", "status": "skipped"},
+        {"test_name": "Checkout", "status": "error", "metrics": {"duration_seconds": 0.5}},
+        {"test_name": "Profile", "status": "passed", "metrics": {}},
+    ]
+
+
+@pytest.mark.unit
+class TestReportGeneratorTool:
+    """Test ReportGeneratorTool"""
+
+    @pytest.fixture
+    def report_tool(self):
+        """Create report generator tool"""
+        return ReportGeneratorTool()
+
+    def test_tool_metadata(self, report_tool):
+        """Test tool metadata"""
+        metadata = report_tool.metadata
+
+        assert metadata.name == "report_generator"
+        assert "reporting" in metadata.tags
+
+    def test_statistics(self, report_tool, test_results):
+        """Test status counts, pass rate and total duration"""
+        result = report_tool.execute(test_results=test_results, app_name="MyApp", format="json")
+
+        assert result.is_success()
+        assert result.data["statistics"] == {
+            "total": 5,
+            "passed": 2,
+            "failed": 1,
+            "skipped": 1,
+            "error": 1,
+            "pass_rate": "40.0%",
+            "total_duration": 4.0,
+        }
+
+    def test_duration_sources(self, report_tool):
+        """Test metrics duration wins over the top-level field, which is the fallback"""
+        results = [
+            {"status": "passed", "metrics": {"duration_seconds": 1.0}, "duration_seconds": 5.0},
+            {"status": "passed", "metrics": "n/a", "duration_seconds": 2.0},
+            {"status": "passed", "metrics": {}, "duration_seconds": 7.0},
+        ]
+
+        result = report_tool.execute(test_results=results, app_name="MyApp", format="markdown")
+
+        assert result.data["statistics"]["total_duration"] == 3.0
+        assert "- **Duration:** 1.00s" in result.data["report_content"]
+        assert "- **Duration:** 2.00s" in result.data["report_content"]
+        assert "- **Duration:** 0.00s" in result.data["report_content"]
+
+    def test_empty_app_name(self, report_tool, test_results):
+        """Test empty app name is rejected"""
+        result = report_tool.execute(test_results=test_results, app_name=" ")
+
+        assert result.status == ToolStatus.FAILURE
+        assert "app_name cannot be empty" in result.error
+
+    def test_unsupported_format(self, report_tool, test_results):
+        """Test unsupported format is rejected"""
+        result = report_tool.execute(test_results=test_results, app_name="MyApp", format="pdf")
+
+        assert result.status == ToolStatus.FAILURE
+        assert "Unsupported format" in result.error
+
+    def test_stream_rejects_unsupported_format(self, report_tool, test_results):
+        """Test streaming refuses unknown formats instead of falling back to JSON"""
+        import io
+
+        with pytest.raises(ValueError, match="Unsupported format"):
+            report_tool.generate_to_stream(io.StringIO(), test_results, "MyApp", format="pdf")
+
+    def test_html_report(self, report_tool, test_results):
+        """Test HTML report contains every result"""
+        result = report_tool.execute(test_results=test_results, app_name="MyApp", format="html")
+
+        assert result.is_success()
+        html = result.data["report_content"]
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.endswith("</html>\n")
+        assert html.count('<div class="test-item ') == 5
+        assert '<div class="error-message">Timeout waiting for #logout</div>' in html
+        assert '<span class="duration">2.00s</span>' in html
+
+    def test_markdown_report(self, report_tool, test_results):
+        """Test Markdown report contains every result"""
+        result = report_tool.execute(test_results=test_results, app_name="MyApp", format="markdown")
+
+        assert result.is_success()
+        md = result.data["report_content"]
+        assert "| Pass Rate | 40.0% |" in md
+        assert "### ✅ Login\n\n- **Status:** `PASSED`\n- **Duration:** 1.50s\n" in md
+        assert "**Error:**\n```\nTimeout waiting for #logout\n```\n" in md
+
+    def test_html_report_escapes_fields(self, report_tool):
+        """Test result text is HTML-escaped"""
+        results = [{
+            "test_name": "<script>alert(1)</script>",
+            "status": "failed",
+            "error_message": 'Expected "a" & got <b>',
+        }]
+
+        result = report_tool.execute(test_results=results, app_name="R&D", format="html")
+
+        html = result.data["report_content"]
+        assert "<script>" not in html
+        assert "<h3>&lt;script&gt;alert(1)&lt;/script&gt;</h3>" in html
+        assert "Expected &quot;a&quot; &amp; got &lt;b&gt;" in html
+        assert "<title>Test Report - R&amp;D</title>" in html
+
+    def test_json_report(self, report_tool, test_results):
+        """Test JSON report round-trips results and statistics"""
+        import json
+        from datetime import datetime
+
+        test_results[0]["executed_at"] = datetime(2024, 1, 2, 3, 4, 5)
+        result = report_tool.execute(test_results=test_results, app_name="MyApp", format="json")
+
+        report = json.loads(result.data["report_content"])
+        assert report["application"] == "MyApp"
+        assert report["statistics"]["total"] == 5
+        assert report["results"][1]["error_message"] == "Timeout waiting for #logout"
+        assert report["results"][0]["executed_at"] == "2024-01-02 03:04:05"
+
+
+    def test_json_report_without_stats(self, report_tool, test_results):
+        """Test include_stats=False skips the statistics pass entirely"""
+        import json
+        from unittest.mock import patch
+
+        with patch.object(ReportGeneratorTool, "_calculate_statistics") as mock_stats:
+            result = report_tool.execute(
+                test_results=test_results, app_name="MyApp", format="json", include_stats=False
+            )
+
+        mock_stats.assert_not_called()
+        report = json.loads(result.data["report_content"])
+        assert report["statistics"] == {}
+        assert len(report["results"]) == 5
+
+    def test_json_report_large_int(self, report_tool):
+        """Test values beyond orjson's range still serialize"""
+        import json
+
+        results = [{"test_name": "Big", "status": "passed", "run_id": 2 ** 70}]
+        result = report_tool.execute(test_results=results, app_name="MyApp", format="json")
+
+        assert result.is_success()
+        assert json.loads(result.data["report_content"])["results"][0]["run_id"] == 2 ** 70
+
+@pytest.mark.unit
+class TestReportWriterTool:
+    """Test ReportWriterTool"""
+
+    @pytest.fixture
+    def writer_tool(self, tmp_path):
+        """Create report writer tool writing under a temp dir"""
+        return ReportWriterTool(config={"output_dir": str(tmp_path / "reports")})
+
+    def test_write_report(self, writer_tool, tmp_path):
+        """Test report content is written to the output dir"""
+        result = writer_tool.execute(report_content="# Report\n", format="markdown", filename="r.md")
+
+        assert result.is_success()
+        assert result.data["created"] is True
+        assert (tmp_path / "reports" / "r.md").read_text(encoding="utf-8") == "# Report\n"
+        assert result.metadata["file_size"] == 9
+
+    def test_write_non_ascii_report(self, writer_tool, tmp_path):
+        """Test content is written as UTF-8 and sized in characters"""
+        result = writer_tool.execute(report_content="### ✅ Login\n", format="markdown", filename="u.md")
+
+        assert result.is_success()
+        assert (tmp_path / "reports" / "u.md").read_bytes() == "### ✅ Login\n".encode("utf-8")
+        assert result.metadata["file_size"] == 12
+
+    def test_generated_filename(self, writer_tool):
+        """Test default filenames use the format's extension"""
+        result = writer_tool.execute(report_content="# Report", format="markdown")
+
+        assert result.is_success()
+        assert result.data["filename"].startswith("report_")
+        assert result.data["filename"].endswith(".md")
+
+    def test_overwrite_protection(self, writer_tool):
+        """Test existing files are only replaced with overwrite=True"""
+        writer_tool.execute(report_content="first", format="json", filename="r.json")
+
+        refused = writer_tool.execute(report_content="second", format="json", filename="r.json")
+        replaced = writer_tool.execute(report_content="second", format="json", filename="r.json", overwrite=True)
+
+        assert refused.status == ToolStatus.FAILURE
+        assert "File already exists" in refused.error
+        assert replaced.is_success()
+        assert replaced.data["created"] is False
+
+    def test_output_dir_recreated_after_removal(self, writer_tool, tmp_path):
+        """Test a removed output dir is recreated despite the mkdir cache"""
+        import shutil
+
+        assert writer_tool.execute(report_content="a", format="json", filename="a.json").is_success()
+        shutil.rmtree(tmp_path / "reports")
+
+        result = writer_tool.execute(report_content="b", format="json", filename="b.json")
+
+        assert result.is_success()
+        assert (tmp_path / "reports" / "b.json").exists()
+
+    def test_execute_stream(self, writer_tool, test_results):
+        """Test streamed reports are written section by section"""
+        result = writer_tool.execute_stream(
+            test_results=test_results, app_name="MyApp", format="html", filename="r.html"
+        )
+
+        assert result.is_success()
+        with open(result.data["file_path"], encoding="utf-8") as f:
+            html = f.read()
+        assert html.startswith("<!DOCTYPE html>")
+        assert html.count('<div class="test-item ') == 5
+        assert len(html) == result.metadata["file_size"]
+
+    def test_failed_stream_leaves_no_partial_file(self, writer_tool, test_results, tmp_path):
+        """Test a report that fails mid-write is removed so a retry can create it"""
+        broken = test_results + [None]
+
+        failed = writer_tool.execute_stream(
+            test_results=broken, app_name="MyApp", format="markdown", filename="r.md"
+        )
+        assert failed.status == ToolStatus.ERROR
+        assert not (tmp_path / "reports" / "r.md").exists()
+
+        retried = writer_tool.execute_stream(
+            test_results=test_results, app_name="MyApp", format="markdown", filename="r.md"
+        )
+        assert retried.is_success()
+        assert retried.data["created"] is True
+
+    def test_descriptor_closed_when_fdopen_fails(self, writer_tool, tmp_path, monkeypatch):
+        """Test the raw descriptor is closed and the empty file removed if fdopen fails"""
+        import os
+
+        closed = []
+        real_close = os.close
+
+        def failing_fdopen(*args, **kwargs):
+            raise MemoryError("no buffer")
+
+        def recording_close(fd):
+            closed.append(fd)
+            real_close(fd)
+
+        monkeypatch.setattr(os, "fdopen", failing_fdopen)
+        monkeypatch.setattr(os, "close", recording_close)
+
+        result = writer_tool.execute(report_content="# Report", format="markdown", filename="r.md")
+
+        assert result.status == ToolStatus.ERROR
+        assert len(closed) == 1
+        assert not (tmp_path / "reports" / "r.md").exists()
@@ -5,6 +5,7 @@ Tests the base tool classes, ToolRegistry, and tool execution.
 """
 
 import pytest
+from unittest.mock import patch
 from typing import Dict, Any, Optional
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata, ToolRegistry
 from tools import register_tool, get_tool, list_tools
@@ -266,6 +267,35 @@ class TestToolRegistry:
 
         assert "Overwriting tool 'dummy_tool'" in caplog.text
 
+    def test_lazy_registration(self):
+        """Test lazily registered tools are imported on first lookup"""
+        ToolRegistry.register_lazy("dummy_tool", f"{__name__}:DummyTool")
+
+        assert "dummy_tool" not in ToolRegistry._tools
+
+        tool = ToolRegistry.get("dummy_tool")
+
+        assert isinstance(tool, DummyTool)
+        assert "dummy_tool" in ToolRegistry._tools
+        assert [m.name for m in ToolRegistry.list_tools()] == ["dummy_tool"]
+
+    def test_lazy_registration_listed(self):
+        """Test list_tools resolves pending lazy registrations"""
+        ToolRegistry.register_lazy("failing_tool", f"{__name__}:FailingTool")
+
+        assert [m.name for m in ToolRegistry.list_tools()] == ["failing_tool"]
+
+    def test_is_registered(self):
+        """Test registration checks by name and by class"""
+        ToolRegistry.register(DummyTool)
+        ToolRegistry.register_lazy("failing_tool", f"{__name__}:FailingTool")
+
+        assert ToolRegistry.is_registered("dummy_tool")
+        assert ToolRegistry.is_registered(DummyTool)
+        assert ToolRegistry.is_registered("failing_tool")
+        assert not ToolRegistry.is_registered(FailingTool)
+        assert not ToolRegistry.is_registered("configurable_tool")
+
     def test_clear_registry(self):
         """Test clearing the registry"""
         ToolRegistry.register(DummyTool)
@@ -290,6 +320,17 @@ class TestToolHelpers:
         assert len(tools) == 1
         assert tools[0].name == "dummy_tool"
 
+    def test_register_tool_as_decorator(self):
+        """Test register_tool returns the class and skips re-registration"""
+        decorated = register_tool(DummyTool)
+
+        with patch.object(ToolRegistry, "register") as mock_register:
+            assert register_tool(DummyTool) is DummyTool
+
+        assert decorated is DummyTool
+        mock_register.assert_not_called()
+        assert len(list_tools()) == 1
+
     def test_get_tool_helper(self):
         """Test get_tool helper function"""
         register_tool(DummyTool)
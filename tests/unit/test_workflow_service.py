@@ -0,0 +1,126 @@
+"""
+Unit Tests for WorkflowService
+
+Tests the in-memory workflow state behind the workflow monitoring routes.
+"""
+
+import copy
+import json
+import pytest
+from datetime import datetime, timedelta
+
+from web_ui.services.workflow_service import WorkflowService, WORKFLOW_STATE
+
+
+@pytest.fixture(autouse=True)
+def pristine_state():
+    """Restore WORKFLOW_STATE in place after each test"""
+    saved = copy.deepcopy(WORKFLOW_STATE)
+    yield
+    WORKFLOW_STATE.clear()
+    WORKFLOW_STATE.update(saved)
+
+
+@pytest.mark.unit
+class TestWorkflowService:
+    """Test WorkflowService state transitions"""
+
+    def test_idle_status(self):
+        """Test an idle workflow reports no elapsed time and serializes to JSON"""
+        status = WorkflowService.get_status()
+
+        assert status['status'] == 'idle'
+        assert status['elapsed_time'] == 0
+        assert json.loads(json.dumps(status))['stages']['discovery']['status'] == 'pending'
+
+    def test_idle_status_follows_mutators(self):
+        """Test a repeated idle status reflects every change made through the service"""
+        WorkflowService.get_status()
+        WorkflowService.update_status({'app_name': 'shop'})
+        assert WorkflowService.get_status()['app_name'] == 'shop'
+
+        WorkflowService.start_workflow('shop', 'checkout')
+        WorkflowService.complete_workflow()
+        assert WorkflowService.get_status()['status'] == 'completed'
+
+        WorkflowService.reset_workflow()
+        status = WorkflowService.get_status()
+        assert (status['status'], status['app_name']) == ('idle', None)
+
+    def test_status_is_a_fresh_copy(self):
+        """Test each call returns a new dict that follows direct writes to the state"""
+        status = WorkflowService.get_status()
+        status['app_name'] = 'changed'
+        assert WorkflowService.get_status()['app_name'] is None
+
+        WORKFLOW_STATE['app_name'] = 'shop'
+        assert WorkflowService.get_status()['app_name'] == 'shop'
+
+    def test_running_status_elapsed_time(self):
+        """Test elapsed time is measured from start_time while running"""
+        WorkflowService.start_workflow('shop', 'checkout')
+        WORKFLOW_STATE['start_time'] = (datetime.now() - timedelta(seconds=30)).isoformat()
+
+        status = WorkflowService.get_status()
+
+        assert status['status'] == 'in_progress'
+        assert 30 <= status['elapsed_time'] < 40
+        assert WORKFLOW_STATE['elapsed_time'] == 0
+        assert type(status) is dict
+        assert json.loads(json.dumps(status))['app_name'] == 'shop'
+
+    def test_running_status_elapsed_time_is_monotonic(self):
+        """Test a workflow started here reports a small, growing elapsed time"""
+        WorkflowService.start_workflow('shop', 'checkout')
+
+        first = WorkflowService.get_status()['elapsed_time']
+        second = WorkflowService.get_status()['elapsed_time']
+
+        assert 0 <= first <= second < 5
+
+    def test_stage_lifecycle(self):
+        """Test stages record results, completion order and failures"""
+        WorkflowService.start_workflow('shop', 'checkout')
+        WorkflowService.start_stage('discovery')
+        assert WorkflowService.get_status()['current_stage'] == 'discovery'
+
+        WorkflowService.complete_stage('discovery', {'elements_found': 12})
+        WorkflowService.complete_stage('discovery', {'pages_found': 3})
+        WorkflowService.start_stage('planning')
+        WorkflowService.fail_stage('planning', 'boom')
+
+        discovery = WorkflowService.get_stage_details('discovery')
+        assert discovery['status'] == 'completed'
+        assert (discovery['elements_found'], discovery['pages_found']) == (12, 3)
+        assert discovery['duration'] >= 0
+        assert WorkflowService.get_stage_details('planning')['error'] == 'boom'
+
+        stages = WorkflowService.get_all_stages()
+        assert type(stages) is dict
+        assert json.loads(json.dumps(stages))['planning']['status'] == 'failed'
+
+        status = WorkflowService.get_status()
+        assert status['status'] == 'failed'
+        assert status['completed_stages'] == ['discovery']
+
+    def test_unknown_stage_is_ignored(self):
+        """Test mutators ignore stage names outside the workflow"""
+        WorkflowService.start_stage('deploy')
+        WorkflowService.complete_stage('deploy', {})
+        WorkflowService.update_status({'stages': {'deploy': {'status': 'completed'}}})
+
+        assert WorkflowService.get_stage_details('deploy') is None
+        assert 'deploy' not in WorkflowService.get_all_stages()
+        assert WorkflowService.get_status()['current_stage'] is None
+
+    def test_update_status_merges_stages(self):
+        """Test update_status replaces top-level fields and merges stage fields"""
+        WorkflowService.update_status({
+            'app_name': 'shop',
+            'stages': {'execution': {'tests_passed': 4}},
+        })
+
+        execution = WorkflowService.get_stage_details('execution')
+        assert WorkflowService.get_status()['app_name'] == 'shop'
+        assert execution['tests_passed'] == 4
+        assert execution['status'] == 'pending'
@@ -11,6 +11,12 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _register(tool_class: type) -> None:
+    """Register a tool unless its package already registered it on import"""
+    if not ToolRegistry.is_registered(tool_class):
+        ToolRegistry.register(tool_class)
+
+
 def register_all_tools():
     """Register all available tools"""
 
@@ -22,9 +28,9 @@ def register_all_tools():
             ScriptValidatorTool,
         )
 
-        ToolRegistry.register(InputSanitizerTool)
-        ToolRegistry.register(PathValidatorTool)
-        ToolRegistry.register(ScriptValidatorTool)
+        _register(InputSanitizerTool)
+        _register(PathValidatorTool)
+        _register(ScriptValidatorTool)
         logger.debug("Registered validation tools")
     except ImportError as e:
         logger.warning(f"Could not register validation tools: {e}")
@@ -36,8 +42,8 @@ def register_all_tools():
             APIDiscoveryTool,
         )
 
-        ToolRegistry.register(WebDiscoveryTool)
-        ToolRegistry.register(APIDiscoveryTool)
+        _register(WebDiscoveryTool)
+        _register(APIDiscoveryTool)
         logger.debug("Registered discovery tools")
     except ImportError as e:
         logger.warning(f"Could not register discovery tools: {e}")
@@ -49,8 +55,8 @@ def register_all_tools():
             TestPatternRetrieverTool,
         )
 
-        ToolRegistry.register(VectorSearchTool)
-        ToolRegistry.register(TestPatternRetrieverTool)
+        _register(VectorSearchTool)
+        _register(TestPatternRetrieverTool)
         logger.debug("Registered RAG tools")
     except ImportError as e:
         logger.warning(f"Could not register RAG tools: {e}")
@@ -62,8 +68,8 @@ def register_all_tools():
             TestCaseExtractorTool,
         )
 
-        ToolRegistry.register(TestPlanGeneratorTool)
-        ToolRegistry.register(TestCaseExtractorTool)
+        _register(TestPlanGeneratorTool)
+        _register(TestCaseExtractorTool)
         logger.debug("Registered planning tools")
     except ImportError as e:
         logger.warning(f"Could not register planning tools: {e}")
@@ -75,8 +81,8 @@ def register_all_tools():
             CodeTemplateManagerTool,
         )
 
-        ToolRegistry.register(ScriptGeneratorTool)
-        ToolRegistry.register(CodeTemplateManagerTool)
+        _register(ScriptGeneratorTool)
+        _register(CodeTemplateManagerTool)
         logger.debug("Registered generation tools")
     except ImportError as e:
         logger.warning(f"Could not register generation tools: {e}")
@@ -87,7 +93,7 @@ def register_all_tools():
             TestScriptWriterTool,
         )
 
-        ToolRegistry.register(TestScriptWriterTool)
+        _register(TestScriptWriterTool)
         logger.debug("Registered file operation tools")
     except ImportError as e:
         logger.warning(f"Could not register file operation tools: {e}")
@@ -99,8 +105,8 @@ def register_all_tools():
             ResultCollectorTool,
         )
 
-        ToolRegistry.register(TestExecutorTool)
-        ToolRegistry.register(ResultCollectorTool)
+        _register(TestExecutorTool)
+        _register(ResultCollectorTool)
         logger.debug("Registered execution tools")
     except ImportError as e:
         logger.warning(f"Could not register execution tools: {e}")
@@ -112,8 +118,8 @@ def register_all_tools():
             ReportWriterTool,
         )
 
-        ToolRegistry.register(ReportGeneratorTool)
-        ToolRegistry.register(ReportWriterTool)
+        _register(ReportGeneratorTool)
+        _register(ReportWriterTool)
         logger.debug("Registered reporting tools")
     except ImportError as e:
         logger.warning(f"Could not register reporting tools: {e}")
@@ -6,9 +6,10 @@ This ensures consistency and enables tool composition.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
+from typing import Any, Dict, Optional, List, Union
 from pydantic import BaseModel, Field
 from enum import Enum
+import importlib
 import time
 from datetime import datetime
 
@@ -160,6 +161,33 @@ class BaseTool(ABC):
                 }
             )
 
+    def _wrap_batch_execution(self, func, count: int, **kwargs) -> List[ToolResult]:
+        """
+        Batch counterpart of _wrap_execution
+
+        func returns one ToolResult per request. It runs through
+        _wrap_execution, so every result carries the batch's execution time
+        and the tool name, and an exception turns into an ERROR result for
+        each of the count requests.
+
+        Args:
+            func: Function returning a list of ToolResults
+            count: Number of requests in the batch
+            **kwargs: Function arguments
+
+        Returns:
+            List of ToolResults, one per request
+        """
+        batch = self._wrap_execution(func, **kwargs)
+        if batch.status == ToolStatus.ERROR:
+            return [batch.model_copy(deep=True) for _ in range(count)]
+
+        for result in batch.data:
+            result.execution_time = batch.execution_time
+            if "tool" not in result.metadata:
+                result.metadata["tool"] = self.metadata.name
+        return batch.data
+
     def validate_input(self, **kwargs) -> bool:
         """
         Validate input parameters
@@ -194,6 +222,44 @@ class ToolRegistry:
 
     _tools: Dict[str, type] = {}
     _instances: Dict[str, BaseTool] = {}
+    _lazy: Dict[str, str] = {}  # tool name -> "module:ClassName", imported on first lookup
+
+    @classmethod
+    def register_lazy(cls, tool_name: str, import_path: str) -> None:
+        """
+        Register a tool whose module is only imported on first lookup
+
+        Args:
+            tool_name: Name reported by the tool's metadata
+            import_path: Location of the tool class as "package.module:ClassName"
+        """
+        cls._lazy[tool_name] = import_path
+
+    @classmethod
+    def is_registered(cls, tool: Union[str, type]) -> bool:
+        """
+        Check whether a tool is registered
+
+        Args:
+            tool: Tool name (including pending lazy registrations) or tool class
+
+        Returns:
+            bool: True if the tool is registered
+        """
+        if isinstance(tool, str):
+            return tool in cls._tools or tool in cls._lazy
+        return any(registered is tool for registered in cls._tools.values())
+
+    @classmethod
+    def _resolve_lazy(cls, tool_name: str) -> None:
+        """Import and register a lazily registered tool, if one is pending"""
+        import_path = cls._lazy.pop(tool_name, None)
+        if import_path is None or tool_name in cls._tools:
+            return
+
+        module_name, _, class_name = import_path.partition(":")
+        tool_class = getattr(importlib.import_module(module_name), class_name)
+        cls.register(tool_class)
 
     @classmethod
     def register(cls, tool_class: type) -> None:
@@ -264,6 +330,9 @@ class ToolRegistry:
         Returns:
             BaseTool: Tool instance
         """
+        if tool_name not in cls._tools:
+            cls._resolve_lazy(tool_name)
+
         if tool_name not in cls._tools:
             available_tools = ", ".join(cls._tools.keys())
             raise ValueError(
@@ -277,6 +346,9 @@ class ToolRegistry:
     @classmethod
     def get_metadata(cls, tool_name: str) -> ToolMetadata:
         """Get tool metadata without instantiating"""
+        if tool_name not in cls._tools:
+            cls._resolve_lazy(tool_name)
+
         if tool_name not in cls._tools:
             raise ValueError(f"Tool '{tool_name}' not found")
 
@@ -318,6 +390,9 @@ class ToolRegistry:
         """
         tools = []
 
+        for tool_name in list(cls._lazy):
+            cls._resolve_lazy(tool_name)
+
         # Import ApplicationProfile here to avoid circular imports
         from models.app_profile import ApplicationProfile, ApplicationType, TestFramework
 
@@ -361,3 +436,4 @@ class ToolRegistry:
         """Clear all registered tools (mainly for testing)"""
         cls._tools.clear()
         cls._instances.clear()
+        cls._lazy.clear()
@@ -4,9 +4,118 @@ Code Template Manager Tool
 Manages code templates and patterns for test generation.
 """
 
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Mapping, NamedTuple, Tuple
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
 
+_VALID_TEMPLATE_TYPES = frozenset(
+    {"test_function", "import", "setup", "teardown", "fixture", "action"}
+)
+_VALID_FRAMEWORKS = frozenset({"playwright", "selenium", "pytest", "robot"})
+
+# Pre-formatted for error messages only, in the lists' original order and repr
+_VALID_TYPES_STR = str(["test_function", "import", "setup", "teardown", "fixture", "action"])
+_VALID_FRAMEWORKS_STR = str(["playwright", "selenium", "pytest", "robot"])
+
+
+class _KeepMissing(dict):
+    """format_map() context that leaves unknown placeholders as {name}"""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+class _TemplateEntry(NamedTuple):
+    """A built-in template and its flat "<framework>_<type>" key"""
+
+    key: str
+    text: str
+
+
+def _build_templates() -> Dict[str, Mapping[str, _TemplateEntry]]:
+    """Build the built-in framework -> template_type table (called once at import time)"""
+    templates: Dict[str, Dict[str, str]] = {fw: {} for fw in sorted(_VALID_FRAMEWORKS)}
+
+    # Playwright templates
+    templates["playwright"]["test_function"] = '''def test_{test_name}(page: Page):
+    """
+    Test: {description}
+    """
+    {test_body}'''
+
+    templates["playwright"]["import"] = "from playwright.sync_api import Page, expect"
+
+    templates["playwright"]["setup"] = '''@pytest.fixture
+def setup_page(page: Page):
+    page.goto("{base_url}")
+    yield page'''
+
+    templates["playwright"]["action"] = '''page.{action}("{selector}")'''
+
+    # Selenium templates
+    templates["selenium"]["test_function"] = '''def test_{test_name}():
+    """
+    Test: {description}
+    """
+    driver = webdriver.Chrome()
+    try:
+        {test_body}
+    finally:
+        driver.quit()'''
+
+    templates["selenium"]["import"] = """from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC"""
+
+    templates["selenium"]["setup"] = '''driver = webdriver.Chrome()
+wait = WebDriverWait(driver, 10)'''
+
+    templates["selenium"]["teardown"] = "driver.quit()"
+
+    # pytest templates
+    templates["pytest"]["fixture"] = '''@pytest.fixture
+def {fixture_name}():
+    {setup_code}
+    yield
+    {teardown_code}'''
+
+    templates["pytest"]["import"] = "import pytest"
+
+    # Robot Framework templates
+    templates["robot"]["test_function"] = '''{test_name}
+    [Documentation]    {description}
+    {test_steps}'''
+
+    templates["robot"]["import"] = "Library    SeleniumLibrary"
+
+    return {
+        framework: MappingProxyType({
+            template_type: _TemplateEntry(f"{framework}_{template_type}", text)
+            for template_type, text in by_type.items()
+        })
+        for framework, by_type in templates.items()
+    }
+
+
+# Required imports per framework, shared by every template of that framework
+_IMPORT_MAP: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "playwright": (
+        "from playwright.sync_api import Page, expect",
+    ),
+    "selenium": (
+        "from selenium import webdriver",
+        "from selenium.webdriver.common.by import By",
+        "from selenium.webdriver.support.ui import WebDriverWait",
+        "from selenium.webdriver.support import expected_conditions as EC",
+    ),
+    "pytest": (
+        "import pytest",
+    ),
+    "robot": (),
+})
+
 
 class CodeTemplateManagerTool(BaseTool):
     """
@@ -25,9 +134,12 @@ class CodeTemplateManagerTool(BaseTool):
     - Pattern library
     """
 
+    # Built once and shared read-only by all instances
+    _TEMPLATES: Mapping[str, Mapping[str, _TemplateEntry]] = MappingProxyType(_build_templates())
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
-        self._templates = self._load_templates()
+        self._templates = self.__class__._TEMPLATES
 
     @property
     def metadata(self) -> ToolMetadata:
@@ -84,33 +196,37 @@ class CodeTemplateManagerTool(BaseTool):
         framework = framework.lower()
         template_type = template_type.lower()
 
-        valid_types = ["test_function", "import", "setup", "teardown", "fixture", "action"]
-        if template_type not in valid_types:
+        if template_type not in _VALID_TEMPLATE_TYPES:
             return ToolResult(
                 status=ToolStatus.FAILURE,
-                error=f"Invalid template_type: {template_type}. Valid types: {valid_types}",
+                error=f"Invalid template_type: {template_type}. Valid types: {_VALID_TYPES_STR}",
             )
 
-        valid_frameworks = ["playwright", "selenium", "pytest", "robot"]
-        if framework not in valid_frameworks:
+        if framework not in _VALID_FRAMEWORKS:
             return ToolResult(
                 status=ToolStatus.FAILURE,
-                error=f"Invalid framework: {framework}. Valid frameworks: {valid_frameworks}",
+                error=f"Invalid framework: {framework}. Valid frameworks: {_VALID_FRAMEWORKS_STR}",
             )
 
         try:
-            # Get template
-            template_key = f"{framework}_{template_type}"
-            template = self._templates.get(template_key, "")
+            # Get template (framework is validated above, so the table exists)
+            entry = self._templates[framework].get(template_type)
 
-            if not template:
+            if entry is None:
                 return ToolResult(
                     status=ToolStatus.FAILURE,
-                    error=f"Template not found: {template_key}",
+                    error=f"Template not found: {framework}_{template_type}",
                 )
+            template = entry.text
 
-            # Render template with context
-            rendered = self._render_template(template, context)
+            # Render template with context; hashable contexts go through the memo
+            try:
+                ctx_key = tuple((k, type(v), v) for k, v in sorted(context.items()))
+                hash(ctx_key)
+            except TypeError:
+                rendered = self._render_template(template, context)
+            else:
+                rendered = self._render_cached(template, ctx_key)
 
             # Get imports for this framework/type
             imports = self._get_imports_for_template(framework, template_type)
@@ -119,12 +235,12 @@ class CodeTemplateManagerTool(BaseTool):
                 status=ToolStatus.SUCCESS,
                 data={
                     "template": rendered,
-                    "imports": imports,
+                    "imports": list(imports),
                 },
                 metadata={
                     "template_type": template_type,
                     "framework": framework,
-                    "template_key": template_key,
+                    "template_key": entry.key,
                 }
             )
 
@@ -139,91 +255,24 @@ class CodeTemplateManagerTool(BaseTool):
                 }
             )
 
-    def _load_templates(self) -> Dict[str, str]:
-        """Load all templates"""
-        templates = {}
-
-        # Playwright templates
-        templates["playwright_test_function"] = '''def test_{test_name}(page: Page):
-    """
-    Test: {description}
-    """
-    {test_body}'''
-
-        templates["playwright_import"] = "from playwright.sync_api import Page, expect"
-
-        templates["playwright_setup"] = '''@pytest.fixture
-def setup_page(page: Page):
-    page.goto("{base_url}")
-    yield page'''
-
-        templates["playwright_action"] = '''page.{action}("{selector}")'''
-
-        # Selenium templates
-        templates["selenium_test_function"] = '''def test_{test_name}():
-    """
-    Test: {description}
-    """
-    driver = webdriver.Chrome()
-    try:
-        {test_body}
-    finally:
-        driver.quit()'''
-
-        templates["selenium_import"] = """from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC"""
-
-        templates["selenium_setup"] = '''driver = webdriver.Chrome()
-wait = WebDriverWait(driver, 10)'''
-
-        templates["selenium_teardown"] = "driver.quit()"
-
-        # pytest templates
-        templates["pytest_fixture"] = '''@pytest.fixture
-def {fixture_name}():
-    {setup_code}
-    yield
-    {teardown_code}'''
-
-        templates["pytest_import"] = "import pytest"
-
-        # Robot Framework templates
-        templates["robot_test_function"] = '''{test_name}
-    [Documentation]    {description}
-    {test_steps}'''
-
-        templates["robot_import"] = "Library    SeleniumLibrary"
-
-        return templates
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_cached(template: str, ctx_key: Tuple[Tuple[str, type, Any], ...]) -> str:
+        """Memoized render keyed by template and (name, type, value) context items"""
+        return CodeTemplateManagerTool._render_template(
+            template, {k: v for k, _, v in ctx_key}
+        )
 
-    def _render_template(self, template: str, context: Dict[str, Any]) -> str:
+    @staticmethod
+    def _render_template(template: str, context: Dict[str, Any]) -> str:
         """Render template with context variables"""
-        try:
-            return template.format(**context)
-        except KeyError as e:
-            # If a key is missing, return template with available substitutions
-            for key, value in context.items():
-                template = template.replace(f"{{{key}}}", str(value))
+        # Import/teardown templates have no placeholders; skip formatting entirely
+        if "{" not in template:
             return template
 
-    def _get_imports_for_template(self, framework: str, template_type: str) -> List[str]:
+        # Missing keys are kept as {placeholders} rather than raising KeyError
+        return template.format_map(_KeepMissing(context))
+
+    def _get_imports_for_template(self, framework: str, template_type: str) -> Tuple[str, ...]:
         """Get required imports for a template"""
-        import_map = {
-            "playwright": [
-                "from playwright.sync_api import Page, expect",
-            ],
-            "selenium": [
-                "from selenium import webdriver",
-                "from selenium.webdriver.common.by import By",
-                "from selenium.webdriver.support.ui import WebDriverWait",
-                "from selenium.webdriver.support import expected_conditions as EC",
-            ],
-            "pytest": [
-                "import pytest",
-            ],
-            "robot": [],
-        }
-
-        return import_map.get(framework, [])
+        return _IMPORT_MAP.get(framework, ())
@@ -4,10 +4,287 @@ Script Generator Tool
 Generates executable test script code from test cases using templates and LLM.
 """
 
-from typing import Dict, Any, Optional, List
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, wraps
+from operator import itemgetter
+from typing import Dict, Any, Callable, Iterable, Optional, List, Tuple
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
 from utils.helpers import sanitize_filename
 
+_SUPPORTED_FRAMEWORKS = frozenset({"playwright", "selenium", "pytest", "robot"})
+# Error-message form of the list, in its original order and repr
+_SUPPORTED_FRAMEWORKS_STR = str(["playwright", "selenium", "pytest", "robot"])
+
+# Fixed rejection messages. Fresh ToolResults are still built per call:
+# _wrap_execution mutates the returned result, so instances cannot be shared.
+_ERR_EMPTY_TEST_CASE = "test_case cannot be empty"
+_ERR_MISSING_NAME = "test_case must have a name"
+
+# Parallel batches smaller than this are generated in-process; pool startup would dominate
+_PARALLEL_MIN_BATCH = 16
+
+# Required imports per framework; copied into a list at the ToolResult boundary
+_PW_IMPORTS: Tuple[str, ...] = (
+    "from playwright.sync_api import Page, expect",
+)
+_SEL_IMPORTS: Tuple[str, ...] = (
+    "from selenium import webdriver",
+    "from selenium.webdriver.common.by import By",
+    "from selenium.webdriver.support.ui import WebDriverWait",
+    "from selenium.webdriver.support import expected_conditions as EC",
+)
+_ROBOT_IMPORTS: Tuple[str, ...] = ()
+
+# Script headers are split into a docstring skeleton, the fixed imports block and
+# the test-function skeleton; only the two skeletons are formatted per call
+_PW_DOCSTRING_TMPL = '''"""
+Test: {test_name}
+Description: {test_description}
+Framework: Playwright
+Generated by: Agentic AI Regression Suite
+"""
+
+'''
+_PW_IMPORTS_BLOCK = "\n".join(_PW_IMPORTS) + "\n\n\n"
+_PW_DEF_TMPL = '''def test_{safe_name}(page: Page):
+    """
+    Test: {test_name}
+
+    Description: {test_description}
+    """
+'''
+
+_SEL_DOCSTRING_TMPL = '''"""
+Test: {test_name}
+Description: {test_description}
+Framework: Selenium
+Generated by: Agentic AI Regression Suite
+"""
+
+'''
+_SEL_IMPORTS_BLOCK = "\n".join(_SEL_IMPORTS) + "\n\n\n"
+_SEL_DEF_TMPL = '''def test_{safe_name}():
+    """
+    Test: {test_name}
+
+    Description: {test_description}
+    """
+    driver = webdriver.Chrome()
+    wait = WebDriverWait(driver, 10)
+
+    try:
+'''
+
+# Per-step action snippets; {url} falls back to the app base_url when target is empty
+_PW_ACTION_TMPLS = {
+    "navigate": '    page.goto("{url}")\n',
+    "goto": '    page.goto("{url}")\n',
+    "click": '    page.click("{target}")\n',
+    "fill": '    page.fill("{target}", "test_value")\n',
+    "type": '    page.fill("{target}", "test_value")\n',
+    "verify": '    expect(page.locator("{target}")).to_be_visible()\n',
+    "assert": '    expect(page.locator("{target}")).to_be_visible()\n',
+    "wait": '    page.wait_for_selector("{target}")\n',
+}
+_PW_TODO_TMPL = '    # TODO: Implement action "{action}" on "{target}"\n'
+
+_SEL_ACTION_TMPLS = {
+    "navigate": '        driver.get("{url}")\n',
+    "goto": '        driver.get("{url}")\n',
+    "click": (
+        '        element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "{target}")))\n'
+        '        element.click()\n'
+    ),
+    "fill": (
+        '        element = driver.find_element(By.CSS_SELECTOR, "{target}")\n'
+        '        element.send_keys("test_value")\n'
+    ),
+    "type": (
+        '        element = driver.find_element(By.CSS_SELECTOR, "{target}")\n'
+        '        element.send_keys("test_value")\n'
+    ),
+    "verify": (
+        '        element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "{target}")))\n'
+        '        assert element.is_displayed()\n'
+    ),
+    "assert": (
+        '        element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "{target}")))\n'
+        '        assert element.is_displayed()\n'
+    ),
+}
+_SEL_TODO_TMPL = '        # TODO: Implement action "{action}" on "{target}"\n'
+
+_ROBOT_ACTION_TMPLS = {
+    "navigate": '    Go To    {target}\n',
+    "click": '    Click Element    {target}\n',
+    "fill": '    Input Text    {target}    test_value\n',
+    "verify": '    Element Should Be Visible    {target}\n',
+}
+_ROBOT_TODO_TMPL = '    # TODO: {action} on {target}\n'
+
+# Known action names, interned so step lookups hit the identity fast path
+_INTERNED_ACTIONS = frozenset(
+    sys.intern(a) for a in ("navigate", "goto", "click", "fill", "type", "verify", "assert", "wait")
+)
+
+
+
+def _intern_action(action: str) -> str:
+    """Map a known action onto its interned instance; other values pass through"""
+    return sys.intern(action) if action in _INTERNED_ACTIONS else action
+
+
+# Step numbers below this get a precomputed "# Step N: " comment prefix
+_NUMBERED_STEP_PREFIXES = 256
+
+# Step fields read by the generators, in unpacking order
+_STEP_KEYS = ("step_number", "action", "target", "expected_result")
+_get_step_fields = itemgetter(*_STEP_KEYS)
+
+
+def _unpack_step(step: Dict[str, Any]) -> Tuple[Any, str, str, str]:
+    """Return (step_number, action, target, expected_result) with the usual defaults"""
+    try:
+        # Fully populated steps (the common case) take one C-level call
+        step_num, action, target, expected = _get_step_fields(step)
+    except KeyError:
+        get = step.get
+        step_num = get("step_number", 0)
+        action = get("action", "")
+        target = get("target", "")
+        expected = get("expected_result", "")
+    return step_num, _intern_action(action), target, expected
+
+
+def _cached_step_renderer(render: Callable[..., str]) -> Callable[..., str]:
+    """
+    Memoize a per-step renderer
+
+    Repeated steps across a batch share one string. Step targets come from
+    LLM or user JSON and may be lists or dicts, which cannot be cache keys;
+    those steps are rendered uncached.
+    """
+    cached = lru_cache(maxsize=4096)(render)
+
+    @wraps(render)
+    def render_step(*args: Any) -> str:
+        try:
+            return cached(*args)
+        except TypeError:
+            return render(*args)
+
+    return render_step
+
+
+@_cached_step_renderer
+def _render_pw_step(action: str, target: str, base_url: str) -> str:
+    """Render one Playwright step"""
+    tmpl = _PW_ACTION_TMPLS.get(action)
+    if tmpl is None:
+        return _PW_TODO_TMPL.format(action=action, target=target)
+    return tmpl.format(target=target, url=target or base_url)
+
+
+@_cached_step_renderer
+def _render_sel_step(action: str, target: str, base_url: str) -> str:
+    """Render one Selenium step"""
+    tmpl = _SEL_ACTION_TMPLS.get(action)
+    if tmpl is None:
+        return _SEL_TODO_TMPL.format(action=action, target=target)
+    return tmpl.format(target=target, url=target or base_url)
+
+
+@_cached_step_renderer
+def _render_robot_step(action: str, target: str) -> str:
+    """Render one Robot Framework step"""
+    return _ROBOT_ACTION_TMPLS.get(action, _ROBOT_TODO_TMPL).format(action=action, target=target)
+
+
+def _make_steps_renderer(
+    indent: str,
+    render_step: Callable[[str, str, str], str],
+) -> Callable[[Iterable[Dict[str, Any]], str], str]:
+    """
+    Build a step-body renderer specialized for one Python framework
+
+    The indent strings and per-step renderer are bound into the closure at
+    import time, so the per-step loop only does local lookups.
+    """
+    step_prefix = "\n" + indent + "# Step "
+    expected_prefix = indent + "# Expected: "
+    # "# Step N: " comment prefixes for the common small step numbers
+    numbered_prefixes = tuple(f"{step_prefix}{i}: " for i in range(_NUMBERED_STEP_PREFIXES))
+
+    def render_steps(steps: Iterable[Dict[str, Any]], base_url: str) -> str:
+        parts: List[str] = []
+        append = parts.append
+        unpack = _unpack_step
+        for step in steps:
+            step_num, action, target, expected = unpack(step)
+            if type(step_num) is int and 0 <= step_num < _NUMBERED_STEP_PREFIXES:
+                prefix = numbered_prefixes[step_num]
+            else:
+                prefix = f"{step_prefix}{step_num}: "
+            # One string build per step: comment line, action code, optional expectation
+            if expected:
+                append(
+                    f"{prefix}{action}\n"
+                    f"{render_step(action, target, base_url)}"
+                    f"{expected_prefix}{expected}\n"
+                )
+            else:
+                append(f"{prefix}{action}\n{render_step(action, target, base_url)}")
+        return "".join(parts)
+
+    return render_steps
+
+
+_render_pw_steps = _make_steps_renderer("    ", _render_pw_step)
+_render_sel_steps = _make_steps_renderer("        ", _render_sel_step)
+
+
+def _render_robot_steps(steps: Iterable[Dict[str, Any]]) -> str:
+    """Render the Robot Framework step body"""
+    return "".join(
+        _render_robot_step(action, target)
+        for _, action, target, _ in map(_unpack_step, steps)
+    )
+
+
+_SEL_FOOTER = '''
+    finally:
+        driver.quit()
+'''
+
+_ROBOT_LIBRARY_BLOCK = """*** Settings ***
+Library    SeleniumLibrary
+"""
+_ROBOT_SUITE_TMPL = """Suite Setup    Open Browser    {base_url}    chrome
+Suite Teardown    Close Browser
+
+*** Test Cases ***
+{test_name}
+    [Documentation]    {test_description}
+"""
+
+
+@lru_cache(maxsize=1024)
+def _safe_name(test_name: str) -> str:
+    """Sanitized snake_case form of a test name, used for function and file names"""
+    return sanitize_filename(test_name.lower().replace(" ", "_"))
+
+
+def _generate_worker(args: Tuple[Dict[str, Any], str, Optional[Dict[str, Any]]]) -> ToolResult:
+    """Process-pool entry point for execute_many (bound methods pickle poorly)"""
+    test_case, framework, app_profile = args
+    return ScriptGeneratorTool().execute(
+        test_case=test_case,
+        framework=framework,
+        app_profile=app_profile,
+    )
+
 
 class ScriptGeneratorTool(BaseTool):
     """
@@ -72,6 +349,65 @@ class ScriptGeneratorTool(BaseTool):
             app_profile=app_profile,
         )
 
+    def execute_many(
+        self,
+        test_cases: List[Dict[str, Any]],
+        framework: str = "playwright",
+        app_profile: Optional[Dict[str, Any]] = None,
+        parallel: bool = False,
+    ) -> List[ToolResult]:
+        """
+        Generate test scripts for a batch of test cases
+
+        Args:
+            test_cases: Test case dictionaries with name, description, steps
+            framework: Test framework to use
+            app_profile: Application profile with base_url, etc.
+            parallel: Fan batches of _PARALLEL_MIN_BATCH or more out across a
+                process pool. Off by default; pool startup only pays off for
+                large batches.
+
+        Returns:
+            List of ToolResults, in the same order as test_cases. A case that
+            fails in a worker gets its own ERROR result.
+        """
+        if not parallel or len(test_cases) < _PARALLEL_MIN_BATCH:
+            return [
+                self.execute(test_case=tc, framework=framework, app_profile=app_profile)
+                for tc in test_cases
+            ]
+
+        try:
+            executor = ProcessPoolExecutor()
+        except OSError:
+            # Pool unavailable in this environment; fall back to serial generation
+            return self.execute_many(test_cases, framework=framework, app_profile=app_profile)
+
+        results = []
+        with executor:
+            futures = [
+                executor.submit(_generate_worker, (tc, framework, app_profile))
+                for tc in test_cases
+            ]
+            for tc, future in zip(test_cases, futures):
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool:
+                    # A dead worker takes the pool down; finish the rest in-process
+                    results.append(
+                        self.execute(test_case=tc, framework=framework, app_profile=app_profile)
+                    )
+                except Exception as e:
+                    results.append(ToolResult(
+                        status=ToolStatus.ERROR,
+                        error=str(e),
+                        metadata={
+                            "tool": self.metadata.name,
+                            "exception_type": type(e).__name__
+                        }
+                    ))
+        return results
+
     def _generate(
         self,
         test_case: Dict[str, Any],
@@ -84,7 +420,7 @@ class ScriptGeneratorTool(BaseTool):
         if not test_case:
             return ToolResult(
                 status=ToolStatus.FAILURE,
-                error="test_case cannot be empty",
+                error=_ERR_EMPTY_TEST_CASE,
             )
 
         test_name = test_case.get("name", "Unnamed Test")
@@ -94,31 +430,33 @@ class ScriptGeneratorTool(BaseTool):
         if not test_name:
             return ToolResult(
                 status=ToolStatus.FAILURE,
-                error="test_case must have a name",
+                error=_ERR_MISSING_NAME,
             )
 
         framework = framework.lower()
-        supported_frameworks = ["playwright", "selenium", "pytest", "robot"]
 
-        if framework not in supported_frameworks:
+        if framework not in _SUPPORTED_FRAMEWORKS:
             return ToolResult(
                 status=ToolStatus.FAILURE,
-                error=f"Unsupported framework: {framework}. Supported: {supported_frameworks}",
+                error=f"Unsupported framework: {framework}. Supported: {_SUPPORTED_FRAMEWORKS_STR}",
             )
 
         try:
+            # Shared by the script body (test function name) and the filename
+            safe_name = _safe_name(test_name)
+
             # Generate script based on framework
             if framework == "playwright":
                 script_content, imports = self._generate_playwright_script(
-                    test_case, app_profile
+                    test_case, app_profile, safe_name
                 )
             elif framework == "selenium":
                 script_content, imports = self._generate_selenium_script(
-                    test_case, app_profile
+                    test_case, app_profile, safe_name
                 )
             elif framework == "pytest":
                 script_content, imports = self._generate_pytest_script(
-                    test_case, app_profile
+                    test_case, app_profile, safe_name
                 )
             elif framework == "robot":
                 script_content, imports = self._generate_robot_script(
@@ -126,10 +464,9 @@ class ScriptGeneratorTool(BaseTool):
                 )
             else:
                 script_content = f"# Test: {test_name}\n# TODO: Implement for {framework}"
-                imports = []
+                imports = ()
 
             # Generate filename
-            safe_name = sanitize_filename(test_name.lower().replace(" ", "_"))
             if framework == "robot":
                 filename = f"test_{safe_name}.robot"
             else:
@@ -140,7 +477,7 @@ class ScriptGeneratorTool(BaseTool):
                 data={
                     "script_content": script_content,
                     "filename": filename,
-                    "imports": imports,
+                    "imports": list(imports),
                 },
                 metadata={
                     "test_name": test_name,
@@ -166,181 +503,95 @@ class ScriptGeneratorTool(BaseTool):
         self,
         test_case: Dict[str, Any],
         app_profile: Optional[Dict[str, Any]],
-    ) -> tuple[str, List[str]]:
+        safe_name: str,
+    ) -> Tuple[str, Tuple[str, ...]]:
         """Generate Playwright test script"""
 
         test_name = test_case.get("name", "Test")
         test_description = test_case.get("description", "")
         steps = test_case.get("steps", [])
-        safe_name = sanitize_filename(test_name.lower().replace(" ", "_"))
 
         base_url = ""
         if app_profile:
             base_url = app_profile.get("base_url", "")
 
-        imports = [
-            "from playwright.sync_api import Page, expect",
-        ]
+        imports = _PW_IMPORTS
 
-        script = f'''"""
-Test: {test_name}
-Description: {test_description}
-Framework: Playwright
-Generated by: Agentic AI Regression Suite
-"""
-
-from playwright.sync_api import Page, expect
-
-
-def test_{safe_name}(page: Page):
-    """
-    Test: {test_name}
-
-    Description: {test_description}
-    """
-'''
+        parts: List[str] = [
+            _PW_DOCSTRING_TMPL.format(test_name=test_name, test_description=test_description),
+            _PW_IMPORTS_BLOCK,
+            _PW_DEF_TMPL.format(
+                safe_name=safe_name,
+                test_name=test_name,
+                test_description=test_description,
+            ),
+        ]
+        append = parts.append
 
         # Generate step code
         if steps:
-            for step in steps:
-                step_num = step.get("step_number", 0)
-                action = step.get("action", "")
-                target = step.get("target", "")
-                expected = step.get("expected_result", "")
-
-                script += f"\n    # Step {step_num}: {action}\n"
-
-                if action == "navigate" or action == "goto":
-                    url = target if target else base_url
-                    script += f'    page.goto("{url}")\n'
-
-                elif action == "click":
-                    script += f'    page.click("{target}")\n'
-
-                elif action == "fill" or action == "type":
-                    script += f'    page.fill("{target}", "test_value")\n'
-
-                elif action == "verify" or action == "assert":
-                    script += f'    expect(page.locator("{target}")).to_be_visible()\n'
-
-                elif action == "wait":
-                    script += f'    page.wait_for_selector("{target}")\n'
-
-                else:
-                    script += f'    # TODO: Implement action "{action}" on "{target}"\n'
-
-                if expected:
-                    script += f'    # Expected: {expected}\n'
+            append(_render_pw_steps(steps, base_url))
         else:
             # No steps provided, add placeholder
-            script += f'\n    page.goto("{base_url}")\n'
-            script += '    # TODO: Add test steps\n'
+            append(f'\n    page.goto("{base_url}")\n')
+            append('    # TODO: Add test steps\n')
 
-        return script, imports
+        return "".join(parts), imports
 
     def _generate_selenium_script(
         self,
         test_case: Dict[str, Any],
         app_profile: Optional[Dict[str, Any]],
-    ) -> tuple[str, List[str]]:
+        safe_name: str,
+    ) -> Tuple[str, Tuple[str, ...]]:
         """Generate Selenium test script"""
 
         test_name = test_case.get("name", "Test")
         test_description = test_case.get("description", "")
         steps = test_case.get("steps", [])
-        safe_name = sanitize_filename(test_name.lower().replace(" ", "_"))
 
         base_url = ""
         if app_profile:
             base_url = app_profile.get("base_url", "")
 
-        imports = [
-            "from selenium import webdriver",
-            "from selenium.webdriver.common.by import By",
-            "from selenium.webdriver.support.ui import WebDriverWait",
-            "from selenium.webdriver.support import expected_conditions as EC",
-        ]
-
-        script = f'''"""
-Test: {test_name}
-Description: {test_description}
-Framework: Selenium
-Generated by: Agentic AI Regression Suite
-"""
-
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-
+        imports = _SEL_IMPORTS
 
-def test_{safe_name}():
-    """
-    Test: {test_name}
-
-    Description: {test_description}
-    """
-    driver = webdriver.Chrome()
-    wait = WebDriverWait(driver, 10)
-
-    try:
-'''
+        parts: List[str] = [
+            _SEL_DOCSTRING_TMPL.format(test_name=test_name, test_description=test_description),
+            _SEL_IMPORTS_BLOCK,
+            _SEL_DEF_TMPL.format(
+                safe_name=safe_name,
+                test_name=test_name,
+                test_description=test_description,
+            ),
+        ]
+        append = parts.append
 
         # Generate step code
         if steps:
-            for step in steps:
-                step_num = step.get("step_number", 0)
-                action = step.get("action", "")
-                target = step.get("target", "")
-                expected = step.get("expected_result", "")
-
-                script += f"\n        # Step {step_num}: {action}\n"
-
-                if action == "navigate" or action == "goto":
-                    url = target if target else base_url
-                    script += f'        driver.get("{url}")\n'
-
-                elif action == "click":
-                    script += f'        element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "{target}")))\n'
-                    script += '        element.click()\n'
-
-                elif action == "fill" or action == "type":
-                    script += f'        element = driver.find_element(By.CSS_SELECTOR, "{target}")\n'
-                    script += '        element.send_keys("test_value")\n'
-
-                elif action == "verify" or action == "assert":
-                    script += f'        element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, "{target}")))\n'
-                    script += '        assert element.is_displayed()\n'
-
-                else:
-                    script += f'        # TODO: Implement action "{action}" on "{target}"\n'
-
-                if expected:
-                    script += f'        # Expected: {expected}\n'
+            append(_render_sel_steps(steps, base_url))
         else:
-            script += f'\n        driver.get("{base_url}")\n'
-            script += '        # TODO: Add test steps\n'
+            append(f'\n        driver.get("{base_url}")\n')
+            append('        # TODO: Add test steps\n')
 
-        script += '''
-    finally:
-        driver.quit()
-'''
+        append(_SEL_FOOTER)
 
-        return script, imports
+        return "".join(parts), imports
 
     def _generate_pytest_script(
         self,
         test_case: Dict[str, Any],
         app_profile: Optional[Dict[str, Any]],
-    ) -> tuple[str, List[str]]:
+        safe_name: str,
+    ) -> Tuple[str, Tuple[str, ...]]:
         """Generate pytest script (uses Playwright by default)"""
-        return self._generate_playwright_script(test_case, app_profile)
+        return self._generate_playwright_script(test_case, app_profile, safe_name)
 
     def _generate_robot_script(
         self,
         test_case: Dict[str, Any],
         app_profile: Optional[Dict[str, Any]],
-    ) -> tuple[str, List[str]]:
+    ) -> Tuple[str, Tuple[str, ...]]:
         """Generate Robot Framework test script"""
 
         test_name = test_case.get("name", "Test")
@@ -351,32 +602,19 @@ def test_{safe_name}():
         if app_profile:
             base_url = app_profile.get("base_url", "")
 
-        script = f'''*** Settings ***
-Library    SeleniumLibrary
-Suite Setup    Open Browser    {base_url}    chrome
-Suite Teardown    Close Browser
-
-*** Test Cases ***
-{test_name}
-    [Documentation]    {test_description}
-'''
+        parts: List[str] = [
+            _ROBOT_LIBRARY_BLOCK,
+            _ROBOT_SUITE_TMPL.format(
+                base_url=base_url,
+                test_name=test_name,
+                test_description=test_description,
+            ),
+        ]
+        append = parts.append
 
         if steps:
-            for step in steps:
-                action = step.get("action", "")
-                target = step.get("target", "")
-
-                if action == "navigate":
-                    script += f'    Go To    {target}\n'
-                elif action == "click":
-                    script += f'    Click Element    {target}\n'
-                elif action == "fill":
-                    script += f'    Input Text    {target}    test_value\n'
-                elif action == "verify":
-                    script += f'    Element Should Be Visible    {target}\n'
-                else:
-                    script += f'    # TODO: {action} on {target}\n'
+            append(_render_robot_steps(steps))
         else:
-            script += '    # TODO: Add test steps\n'
+            append('    # TODO: Add test steps\n')
 
-        return script, []
+        return "".join(parts), _ROBOT_IMPORTS
@@ -2,15 +2,34 @@
 Test Planning Tools
 
 Tools for test plan generation, test case extraction, and gap analysis.
+
+Tool modules are imported lazily: the classes load on first attribute access
+(PEP 562), and the registry imports them on first lookup by tool name.
 """
 
-from tools.planning.test_plan_generator import TestPlanGeneratorTool
-from tools.planning.test_case_extractor import TestCaseExtractorTool
-from tools.registry import register_tool
+import importlib
+
+from tools.base import ToolRegistry
+
+# Class name -> (tool name, defining module)
+_LAZY = {
+    "TestPlanGeneratorTool": ("test_plan_generator", "tools.planning.test_plan_generator"),
+    "TestCaseExtractorTool": ("test_case_extractor", "tools.planning.test_case_extractor"),
+}
 
 # Register tools
-register_tool(TestPlanGeneratorTool)
-register_tool(TestCaseExtractorTool)
+for _class_name, (_tool_name, _module_name) in _LAZY.items():
+    ToolRegistry.register_lazy(_tool_name, f"{_module_name}:{_class_name}")
+del _class_name, _tool_name, _module_name
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        tool_class = getattr(importlib.import_module(_LAZY[name][1]), name)
+        globals()[name] = tool_class
+        return tool_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "TestPlanGeneratorTool",
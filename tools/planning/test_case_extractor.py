@@ -5,9 +5,99 @@ Extracts structured test case information from LLM-generated test plans.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
-from utils.helpers import generate_test_id
+from utils.helpers import compile_linear, generate_test_id, generate_test_ids
+
+
+# Exception text kept in error results; the LLM response can end up in it
+_MAX_ERROR_CHARS = 500
+
+# Patterns are compiled once at import; extraction runs them per test case.
+# Section patterns are tried in priority order rather than as one alternation:
+# an earlier "Test Cases:" must not win over a later "## Test Cases", and each
+# literal prefix lets the regex engine skip ahead quickly when it is absent.
+_TC_SECTION_PATTERNS = tuple(
+    re.compile(p, re.DOTALL | re.IGNORECASE)
+    for p in (
+        r"(?:##\s*Test Cases|###\s*Test Cases)(.*?)(?=##|\Z)",
+        r"(?:Test Cases:)(.*?)(?=\n##|\Z)",
+        r"(?:2\.\s*\*\*Test Cases\*\*)(.*?)(?=\n\d+\.|\Z)",
+    )
+)
+# Test case headers start a line; each body is the slice up to the next header.
+# Lookaround-free patterns that scan whole responses or titles use RE2 when
+# it is installed (see compile_linear).
+_HEADER_RE = compile_linear(r"^(?:####\s+|###\s+|\d+\.\s+)(.+)\n", re.MULTILINE)
+_NUMBERED_RE = compile_linear(r"\d\.")
+_SKIP_TITLE_RE = compile_linear(r"coverage|gap|recommendation|strategy", re.IGNORECASE)
+# One scan locates every field key; values are then matched anchored at the
+# key so each field still resolves to its first successful occurrence.
+_FIELD_KEY_RE = re.compile(
+    r"(?:(?P<priority>priority)|(?P<type>type)|(?P<description>description)"
+    r"|(?P<preconditions>preconditions?)|(?P<steps>(?:test\s+)?steps)):",
+    re.IGNORECASE,
+)
+_WORD_VALUE_RE = re.compile(r"\s*(\w+)")
+_BLOCK_VALUE_RE = re.compile(r"\s*(.+?)(?=\n\w+:|\Z)", re.DOTALL)
+_FIELD_VALUE_RES = {
+    "priority": _WORD_VALUE_RE,
+    "type": _WORD_VALUE_RE,
+    "description": _BLOCK_VALUE_RE,
+    "preconditions": _BLOCK_VALUE_RE,
+    "steps": _BLOCK_VALUE_RE,
+}
+
+# (name, description, priority, type) for test cases used when none parse
+_DEFAULT_TEST_CASES = (
+    ("{feature} - Basic Functionality Test", "Verify basic functionality of {feature}", "high", "functional"),
+    ("{feature} - Error Handling Test", "Verify error handling in {feature}", "medium", "negative"),
+)
+
+
+def _compile_section_patterns(keyword: str) -> tuple:
+    """Compile the header and numbered-bold patterns for a section keyword"""
+    return (
+        re.compile(rf"(?:##\s*{keyword}.*?)(.*?)(?=##|\Z)", re.DOTALL | re.IGNORECASE),
+        re.compile(rf"(?:\d+\.\s*\*\*{keyword}.*?\*\*)(.*?)(?=\n\d+\.|\Z)", re.DOTALL | re.IGNORECASE),
+    )
+
+
+_SECTION_PATTERNS = {
+    kw: _compile_section_patterns(kw) for kw in ("coverage", "gap", "recommendation")
+}
+
+
+@lru_cache(maxsize=32)
+def _find_section(text: str, section_keyword: str) -> str:
+    """Find a section body, memoized so re-analysing a plan skips the scans"""
+    patterns = _SECTION_PATTERNS.get(section_keyword)
+    if patterns is None:
+        patterns = _compile_section_patterns(section_keyword)
+
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1).strip()
+
+    return ""
+
+
+def _list_items(text: str) -> List[str]:
+    """Split a bulleted block into items, dropping blank lines and "- " markers"""
+    return [line.strip("- ").strip() for line in text.strip().split("\n") if line.strip()]
+
+
+def _is_structured(text: str) -> bool:
+    """
+    Whether text can contain headers or sections
+
+    Every header and section pattern needs "##" or a numbered item; without
+    either, the scans are skipped and extraction falls through to the
+    defaults.
+    """
+    return "##" in text or _NUMBERED_RE.search(text) is not None
 
 
 class TestCaseExtractorTool(BaseTool):
@@ -75,6 +165,39 @@ class TestCaseExtractorTool(BaseTool):
             feature=feature,
         )
 
+    def iter_test_cases(
+        self,
+        llm_response: str,
+        app_name: str,
+        feature: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield test cases from an LLM response as they are parsed
+
+        Streaming counterpart of execute() for callers that handle one test
+        case at a time. Test cases are parsed as the iterator is consumed,
+        so parsing errors are raised from iteration rather than returned in
+        a ToolResult.
+
+        Args:
+            llm_response: LLM-generated test plan text
+            app_name: Application name
+            feature: Feature name
+
+        Returns:
+            Iterator over test case dictionaries, as in execute()
+
+        Raises:
+            ValueError: If llm_response is empty
+        """
+        if not llm_response or not llm_response.strip():
+            raise ValueError("llm_response cannot be empty")
+
+        test_cases_section = (
+            self._extract_test_cases_section(llm_response) if _is_structured(llm_response) else ""
+        )
+        return self._iter_test_cases(test_cases_section, app_name=app_name, feature=feature)
+
     def _extract(
         self,
         llm_response: str,
@@ -90,8 +213,12 @@ class TestCaseExtractorTool(BaseTool):
             )
 
         try:
+            structured = _is_structured(llm_response)
+
             # Extract test cases section
-            test_cases_section = self._extract_test_cases_section(llm_response)
+            test_cases_section = (
+                self._extract_test_cases_section(llm_response) if structured else ""
+            )
 
             # Parse individual test cases
             test_cases = self._parse_test_cases(
@@ -101,9 +228,12 @@ class TestCaseExtractorTool(BaseTool):
             )
 
             # Extract other sections for context
-            coverage = self._extract_section(llm_response, "coverage")
-            gaps = self._extract_section(llm_response, "gap")
-            recommendations = self._extract_section(llm_response, "recommendation")
+            if structured:
+                coverage = self._extract_section(llm_response, "coverage")
+                gaps = self._extract_section(llm_response, "gap")
+                recommendations = self._extract_section(llm_response, "recommendation")
+            else:
+                coverage = gaps = recommendations = ""
 
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -127,7 +257,7 @@ class TestCaseExtractorTool(BaseTool):
         except Exception as e:
             return ToolResult(
                 status=ToolStatus.ERROR,
-                error=f"Test case extraction failed: {str(e)}",
+                error=f"Test case extraction failed: {str(e)[:_MAX_ERROR_CHARS]}",
                 metadata={
                     "app_name": app_name,
                     "feature": feature,
@@ -138,14 +268,8 @@ class TestCaseExtractorTool(BaseTool):
     def _extract_test_cases_section(self, text: str) -> str:
         """Extract the test cases section from the response"""
         # Look for test cases section
-        patterns = [
-            r"(?:##\s*Test Cases|###\s*Test Cases)(.*?)(?=##|\Z)",
-            r"(?:Test Cases:)(.*?)(?=\n##|\Z)",
-            r"(?:2\.\s*\*\*Test Cases\*\*)(.*?)(?=\n\d+\.|\Z)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+        for pattern in _TC_SECTION_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
 
@@ -159,63 +283,74 @@ class TestCaseExtractorTool(BaseTool):
         feature: str
     ) -> List[Dict[str, Any]]:
         """Parse individual test cases from text"""
-        test_cases = []
+        return list(self._iter_test_cases(text, app_name=app_name, feature=feature))
 
-        # Try different patterns to find test cases
-        # Pattern 1: Numbered list with details
-        pattern1 = r"(?:####\s+|###\s+|\d+\.\s+)(.+?)\n(.*?)(?=####|###|\d+\.\s+|\Z)"
+    def _iter_test_cases(
+        self,
+        text: str,
+        app_name: str,
+        feature: str
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield test cases as they are parsed from text"""
+        found = False
+
+        # Numbered list or markdown headers, each followed by its details
+        headers = list(_HEADER_RE.finditer(text))
+        ends = [header.start() for header in headers[1:]]
+        ends.append(len(text))
 
-        matches = re.finditer(pattern1, text, re.DOTALL)
+        # One random read for every candidate's ID instead of one per test case
+        test_ids = generate_test_ids(len(headers))
 
-        for match in matches:
-            title = match.group(1).strip()
-            content = match.group(2).strip()
+        for header, end, test_id in zip(headers, ends, test_ids):
+            title = header.group(1).strip()
+            content = text[header.end():end].strip()
 
             # Skip if this looks like a section header not a test case
-            if any(skip in title.lower() for skip in ["coverage", "gap", "recommendation", "strategy"]):
+            if _SKIP_TITLE_RE.search(title):
                 continue
 
             test_case = self._parse_single_test_case(
                 title=title,
                 content=content,
                 app_name=app_name,
-                feature=feature
+                feature=feature,
+                test_id=test_id
             )
 
             if test_case:
-                test_cases.append(test_case)
+                found = True
+                yield test_case
 
         # If no test cases found, create default ones
-        if not test_cases:
-            test_cases = self._create_default_test_cases(app_name, feature)
-
-        return test_cases
+        if not found:
+            yield from self._create_default_test_cases(app_name, feature)
 
     def _parse_single_test_case(
         self,
         title: str,
         content: str,
         app_name: str,
-        feature: str
+        feature: str,
+        test_id: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """Parse a single test case"""
+        fields = self._scan_fields(content)
+
         # Extract priority
         priority = "medium"  # default
-        priority_match = re.search(r"priority:\s*(\w+)", content, re.IGNORECASE)
-        if priority_match:
-            priority = priority_match.group(1).lower()
+        if "priority" in fields:
+            priority = fields["priority"].lower()
 
         # Extract test type
         test_type = "functional"  # default
-        type_match = re.search(r"type:\s*(\w+)", content, re.IGNORECASE)
-        if type_match:
-            test_type = type_match.group(1).lower()
+        if "type" in fields:
+            test_type = fields["type"].lower()
 
         # Extract description
         description = ""
-        desc_match = re.search(r"description:\s*(.+?)(?=\n\w+:|\Z)", content, re.IGNORECASE | re.DOTALL)
-        if desc_match:
-            description = desc_match.group(1).strip()
+        if "description" in fields:
+            description = fields["description"].strip()
         elif len(content) < 200:
             description = content.strip()
         else:
@@ -223,21 +358,19 @@ class TestCaseExtractorTool(BaseTool):
 
         # Extract preconditions
         preconditions = []
-        precond_match = re.search(r"preconditions?:\s*(.+?)(?=\n\w+:|\Z)", content, re.IGNORECASE | re.DOTALL)
-        if precond_match:
-            precond_text = precond_match.group(1).strip()
-            preconditions = [p.strip("- ").strip() for p in precond_text.split("\n") if p.strip()]
+        if "preconditions" in fields:
+            preconditions = _list_items(fields["preconditions"])
 
         # Extract test steps
         steps = []
-        steps_match = re.search(r"(?:test\s+)?steps:\s*(.+?)(?=\n\w+:|\Z)", content, re.IGNORECASE | re.DOTALL)
-        if steps_match:
-            steps_text = steps_match.group(1).strip()
-            step_lines = [s.strip("- ").strip() for s in steps_text.split("\n") if s.strip()]
-            steps = [{"step_number": i+1, "action": step} for i, step in enumerate(step_lines)]
+        if "steps" in fields:
+            steps = [
+                {"step_number": i, "action": step}
+                for i, step in enumerate(_list_items(fields["steps"]), 1)
+            ]
 
         return {
-            "id": generate_test_id(),
+            "id": test_id or generate_test_id(),
             "name": title.strip("*").strip(),
             "description": description,
             "priority": priority,
@@ -248,6 +381,21 @@ class TestCaseExtractorTool(BaseTool):
             "steps": steps,
         }
 
+    @staticmethod
+    def _scan_fields(content: str) -> Dict[str, str]:
+        """Map each field name to the value of its first matching occurrence"""
+        fields: Dict[str, str] = {}
+        for key_match in _FIELD_KEY_RE.finditer(content):
+            name = key_match.lastgroup
+            if name in fields:
+                continue
+            value_match = _FIELD_VALUE_RES[name].match(content, key_match.end())
+            if value_match:
+                fields[name] = value_match.group(1)
+                if len(fields) == len(_FIELD_VALUE_RES):
+                    break
+        return fields
+
     def _create_default_test_cases(
         self,
         app_name: str,
@@ -256,39 +404,21 @@ class TestCaseExtractorTool(BaseTool):
         """Create default test cases when parsing fails"""
         return [
             {
-                "id": generate_test_id(),
-                "name": f"{feature} - Basic Functionality Test",
-                "description": f"Verify basic functionality of {feature}",
-                "priority": "high",
-                "type": "functional",
-                "application": app_name,
-                "feature": feature,
-                "preconditions": [],
-                "steps": [],
-            },
-            {
-                "id": generate_test_id(),
-                "name": f"{feature} - Error Handling Test",
-                "description": f"Verify error handling in {feature}",
-                "priority": "medium",
-                "type": "negative",
+                "id": test_id,
+                "name": name.format(feature=feature),
+                "description": description.format(feature=feature),
+                "priority": priority,
+                "type": test_type,
                 "application": app_name,
                 "feature": feature,
                 "preconditions": [],
                 "steps": [],
             }
+            for (name, description, priority, test_type), test_id in zip(
+                _DEFAULT_TEST_CASES, generate_test_ids(len(_DEFAULT_TEST_CASES))
+            )
         ]
 
     def _extract_section(self, text: str, section_keyword: str) -> str:
         """Extract a specific section from the text"""
-        patterns = [
-            rf"(?:##\s*{section_keyword}.*?)(.*?)(?=##|\Z)",
-            rf"(?:\d+\.\s*\*\*{section_keyword}.*?\*\*)(.*?)(?=\n\d+\.|\Z)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
-
-        return ""
+        return _find_section(text, section_keyword)
@@ -4,14 +4,78 @@ Test Plan Generator Tool
 Generates comprehensive test plans using LLM based on feature descriptions and context.
 """
 
-from typing import Dict, Any, Optional, List
-from langchain_core.prompts import PromptTemplate
+from typing import Dict, Any, Optional, List, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.prompts import ChatPromptTemplate
 
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
 from config.llm_config import get_smart_llm
 from utils.helpers import generate_test_id
 
 
+# Exception text kept in error results; the LLM response can end up in it
+_MAX_ERROR_CHARS = 500
+
+# Static prompt, sent to the chat model as a single human message
+_PLAN_PROMPT_TEMPLATE = """
+You are a test planning expert. Create a comprehensive test plan for the following feature.
+
+Feature Description:
+{feature_description}
+
+Application: {app_name}
+Application Type: {app_type}
+
+Discovery Information:
+{discovery_info}
+
+Similar Historical Tests:
+{similar_tests}
+
+{additional_context}
+
+Create a comprehensive test plan that includes:
+
+1. **Test Strategy**: Overall approach and methodology
+
+2. **Test Cases**: List of test cases with:
+   - Test case name
+   - Description
+   - Priority (critical, high, medium, low)
+   - Type (functional, negative, boundary, security, performance)
+   - Preconditions
+   - Test steps
+   - Expected results
+
+3. **Coverage Analysis**: Areas covered by the tests
+
+4. **Gap Analysis**: Identified gaps in testing coverage
+
+5. **Recommendations**: Suggestions for additional testing
+
+6. **Test Data Requirements**: Data needed for testing
+
+7. **Environment Requirements**: Testing environment needs
+
+Format your response with clear sections and structured information.
+Use markdown formatting for readability.
+"""
+
+_PLAN_PROMPT = ChatPromptTemplate.from_messages([("human", _PLAN_PROMPT_TEMPLATE)])
+
+# (discovery_info key, label) in prompt order
+_DISCOVERY_FIELDS = (
+    ("total_elements", "Elements"),
+    ("total_pages", "Pages"),
+    ("total_endpoints", "API Endpoints"),
+    ("element_types", "Element Types"),
+)
+
+_format_similar_test = "- **{name}** (similarity: {score:.2f}):\n  {content}...".format
+
+
 class TestPlanGeneratorTool(BaseTool):
     """
     Generates test plans using LLM
@@ -30,6 +94,11 @@ class TestPlanGeneratorTool(BaseTool):
     - Includes coverage and gap analysis
     """
 
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self._llm: Optional[BaseChatModel] = None
+        self._llm_model_name = "unknown"
+
     def _validate_config(self) -> None:
         """Validate tool configuration"""
         # app_profile is optional but helpful for context
@@ -117,10 +186,10 @@ class TestPlanGeneratorTool(BaseTool):
 
         try:
             # Get smart LLM for complex reasoning
-            llm = get_smart_llm()
+            llm, llm_model_name = self._get_llm()
 
-            # Build prompt
-            prompt = self._build_prompt(
+            # Build prompt messages
+            messages = self._build_prompt(
                 feature_description=feature_description,
                 app_name=app_name,
                 app_type=app_type,
@@ -130,7 +199,7 @@ class TestPlanGeneratorTool(BaseTool):
             )
 
             # Generate plan with LLM
-            response = llm.invoke(prompt)
+            response = llm.invoke(messages)
 
             # Generate plan ID
             plan_id = generate_test_id()
@@ -151,7 +220,7 @@ class TestPlanGeneratorTool(BaseTool):
                     "app_type": app_type,
                     "has_discovery_info": discovery_info is not None,
                     "similar_tests_count": len(similar_tests) if similar_tests else 0,
-                    "llm_model": getattr(llm, "model_name", "unknown"),
+                    "llm_model": llm_model_name,
                     "response_length": len(response.content),
                 }
             )
@@ -159,7 +228,7 @@ class TestPlanGeneratorTool(BaseTool):
         except Exception as e:
             return ToolResult(
                 status=ToolStatus.ERROR,
-                error=f"Test plan generation failed: {str(e)}",
+                error=f"Test plan generation failed: {str(e)[:_MAX_ERROR_CHARS]}",
                 metadata={
                     "feature": feature_description,
                     "app_name": app_name,
@@ -167,6 +236,14 @@ class TestPlanGeneratorTool(BaseTool):
                 }
             )
 
+    def _get_llm(self) -> Tuple[BaseChatModel, str]:
+        """Get the smart LLM and its model name, created once per tool instance"""
+        if self._llm is None:
+            llm = get_smart_llm()
+            self._llm_model_name = getattr(llm, "model_name", "unknown")
+            self._llm = llm
+        return self._llm, self._llm_model_name
+
     def _build_prompt(
         self,
         feature_description: str,
@@ -175,80 +252,30 @@ class TestPlanGeneratorTool(BaseTool):
         discovery_info: Optional[Dict[str, Any]],
         similar_tests: Optional[List[Dict[str, Any]]],
         additional_context: Optional[str],
-    ) -> str:
-        """Build the LLM prompt for test plan generation"""
-
-        prompt_template = PromptTemplate.from_template("""
-You are a test planning expert. Create a comprehensive test plan for the following feature.
-
-Feature Description:
-{feature_description}
-
-Application: {app_name}
-Application Type: {app_type}
-
-Discovery Information:
-{discovery_info}
-
-Similar Historical Tests:
-{similar_tests}
-
-{additional_context}
-
-Create a comprehensive test plan that includes:
-
-1. **Test Strategy**: Overall approach and methodology
-
-2. **Test Cases**: List of test cases with:
-   - Test case name
-   - Description
-   - Priority (critical, high, medium, low)
-   - Type (functional, negative, boundary, security, performance)
-   - Preconditions
-   - Test steps
-   - Expected results
-
-3. **Coverage Analysis**: Areas covered by the tests
-
-4. **Gap Analysis**: Identified gaps in testing coverage
-
-5. **Recommendations**: Suggestions for additional testing
-
-6. **Test Data Requirements**: Data needed for testing
-
-7. **Environment Requirements**: Testing environment needs
-
-Format your response with clear sections and structured information.
-Use markdown formatting for readability.
-""")
+    ) -> List[BaseMessage]:
+        """Build the LLM prompt messages for test plan generation"""
 
         # Format discovery info
         discovery_info_str = "No discovery data available"
         if discovery_info:
-            parts = []
-            if "total_elements" in discovery_info:
-                parts.append(f"- Elements: {discovery_info['total_elements']}")
-            if "total_pages" in discovery_info:
-                parts.append(f"- Pages: {discovery_info['total_pages']}")
-            if "total_endpoints" in discovery_info:
-                parts.append(f"- API Endpoints: {discovery_info['total_endpoints']}")
-            if "element_types" in discovery_info:
-                parts.append(f"- Element Types: {discovery_info['element_types']}")
-
+            parts = [
+                f"- {label}: {discovery_info[key]}"
+                for key, label in _DISCOVERY_FIELDS
+                if key in discovery_info
+            ]
             discovery_info_str = "\n".join(parts) if parts else "Discovery completed"
 
         # Format similar tests
         similar_tests_str = "No similar tests found"
         if similar_tests:
-            similar_tests_list = []
-            for test in similar_tests[:3]:  # Limit to top 3
-                test_name = test.get("metadata", {}).get("test_name", "Unknown")
-                content = test.get("content", "")[:150]  # Truncate
-                score = test.get("score", 0.0)
-                similar_tests_list.append(
-                    f"- **{test_name}** (similarity: {score:.2f}):\n  {content}..."
+            similar_tests_str = "\n".join(
+                _format_similar_test(
+                    name=test.get("metadata", {}).get("test_name", "Unknown"),
+                    score=test.get("score", 0.0),
+                    content=test.get("content", "")[:150],  # Truncate
                 )
-            similar_tests_str = "\n".join(similar_tests_list)
+                for test in similar_tests[:3]  # Limit to top 3
+            )
 
         # Format additional context
         additional_context_str = ""
@@ -256,7 +283,7 @@ Use markdown formatting for readability.
             additional_context_str = f"\nAdditional Context:\n{additional_context}"
 
         # Generate prompt
-        prompt = prompt_template.format(
+        return _PLAN_PROMPT.format_messages(
             feature_description=feature_description,
             app_name=app_name,
             app_type=app_type,
@@ -265,19 +292,19 @@ Use markdown formatting for readability.
             additional_context=additional_context_str,
         )
 
-        return prompt
-
     def _extract_summary(self, llm_response: str) -> Dict[str, Any]:
         """Extract summary information from LLM response"""
         # Simple extraction - in production, use structured output or parsing
+        text = llm_response.lower()
+        test_case_count = text.count("test case")
         summary = {
-            "has_test_strategy": "test strategy" in llm_response.lower(),
-            "has_test_cases": "test case" in llm_response.lower(),
-            "has_coverage": "coverage" in llm_response.lower(),
-            "has_gaps": "gap" in llm_response.lower(),
-            "has_recommendations": "recommendation" in llm_response.lower(),
+            "has_test_strategy": "test strategy" in text,
+            "has_test_cases": test_case_count > 0,
+            "has_coverage": "coverage" in text,
+            "has_gaps": "gap" in text,
+            "has_recommendations": "recommendation" in text,
             "response_length": len(llm_response),
-            "estimated_test_cases": llm_response.lower().count("test case"),
+            "estimated_test_cases": test_case_count,
         }
 
         return summary
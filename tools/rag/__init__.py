@@ -2,10 +2,27 @@
 RAG (Retrieval-Augmented Generation) Tools
 
 Tools for vector search and knowledge retrieval from the test knowledge base.
+
+Tool modules are imported lazily on first attribute access (PEP 562), so the
+vector store and embedding client only load when a RAG tool is used.
 """
 
-from tools.rag.vector_search import VectorSearchTool
-from tools.rag.pattern_retriever import TestPatternRetrieverTool
+import importlib
+
+# Class name -> defining module
+_LAZY = {
+    "VectorSearchTool": "tools.rag.vector_search",
+    "TestPatternRetrieverTool": "tools.rag.pattern_retriever",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        tool_class = getattr(importlib.import_module(_LAZY[name]), name)
+        globals()[name] = tool_class
+        return tool_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "VectorSearchTool",
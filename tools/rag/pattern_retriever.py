@@ -4,9 +4,29 @@ Test Pattern Retriever Tool
 Retrieves test patterns and historical test information from knowledge base.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
-from rag.retriever import TestKnowledgeRetriever
+
+if TYPE_CHECKING:
+    from rag.retriever import TestKnowledgeRetriever
+
+
+def __getattr__(name):
+    # rag.retriever pulls in the vector store and embedding stack, so it is
+    # only imported when a search actually runs
+    if name == "TestKnowledgeRetriever":
+        from rag.retriever import TestKnowledgeRetriever
+        globals()[name] = TestKnowledgeRetriever
+        return TestKnowledgeRetriever
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_retriever(collection_name: str) -> "TestKnowledgeRetriever":
+    """Get the shared retriever for a collection, opening its vector store once"""
+    from rag.retriever import get_shared_retriever
+
+    retriever_class = globals().get("TestKnowledgeRetriever") or __getattr__("TestKnowledgeRetriever")
+    return get_shared_retriever(collection_name, retriever_class)
 
 
 class TestPatternRetrieverTool(BaseTool):
@@ -75,16 +95,103 @@ class TestPatternRetrieverTool(BaseTool):
             k=k,
         )
 
-    def _retrieve(
+    def execute_batch(self, requests: List[Dict[str, Any]]) -> List[ToolResult]:
+        """
+        Retrieve patterns for several requests with one batched search
+
+        Each request takes the same keys as execute(). Valid requests are
+        sent to the knowledge base together in one search_batch call.
+
+        Args:
+            requests: Dicts with pattern_type, feature, error_message, k
+
+        Returns:
+            List of ToolResults, in the same order as requests
+        """
+        return self._wrap_batch_execution(self._retrieve_batch, len(requests), requests=requests)
+
+    def _retrieve_batch(self, requests: List[Dict[str, Any]]) -> List[ToolResult]:
+        """Internal batched retrieval logic"""
+        results: List[Optional[ToolResult]] = [None] * len(requests)
+        queries = []
+        pending = []
+
+        for i, request in enumerate(requests):
+            pattern_type = request.get("pattern_type", "feature")
+            feature = request.get("feature")
+            error_message = request.get("error_message")
+            k = request.get("k", 3)
+
+            invalid = self._validate_request(pattern_type, feature, error_message, k)
+            if invalid:
+                results[i] = invalid
+                continue
+
+            if pattern_type == "feature":
+                text = feature
+            elif pattern_type == "failure":
+                text = error_message
+            else:
+                text = feature or error_message or "test patterns"
+            queries.append((pattern_type, text, k))
+            pending.append((i, pattern_type, feature, error_message, text, k))
+
+        if queries:
+            try:
+                retriever = _get_retriever(self.config.get("collection_name", "test_knowledge"))
+                batched = retriever.search_batch(queries)
+                for (i, pattern_type, feature, error_message, text, k), patterns in zip(pending, batched):
+                    results[i] = self._build_result(pattern_type, patterns, feature, error_message, text, k)
+            except Exception as e:
+                for i, pattern_type, *_ in pending:
+                    results[i] = self._error_result(pattern_type, e)
+
+        return results
+
+    def execute_multi(
+        self,
+        feature: Optional[str] = None,
+        error_message: Optional[str] = None,
+        k: int = 3,
+    ) -> Dict[str, ToolResult]:
+        """
+        Retrieve every applicable pattern type in one round trip
+
+        Feature patterns need feature, failure insights need error_message,
+        and similar tests are always retrieved. The queries are sent through
+        execute_batch, so they run as one batched search.
+
+        Args:
+            feature: Feature name
+            error_message: Error message
+            k: Number of patterns to retrieve per type
+
+        Returns:
+            Dict mapping pattern_type to its ToolResult
+        """
+        requests = []
+        if feature:
+            requests.append({"pattern_type": "feature", "feature": feature, "k": k})
+        if error_message:
+            requests.append({"pattern_type": "failure", "error_message": error_message, "k": k})
+        requests.append({
+            "pattern_type": "similar",
+            "feature": feature,
+            "error_message": error_message,
+            "k": k,
+        })
+
+        results = self.execute_batch(requests)
+        return {request["pattern_type"]: result for request, result in zip(requests, results)}
+
+    def _validate_request(
         self,
         pattern_type: str,
         feature: Optional[str],
         error_message: Optional[str],
         k: int,
-    ) -> ToolResult:
-        """Internal retrieval logic"""
-
-        # Validate inputs based on pattern type
+    ) -> Optional[ToolResult]:
+        """Return a failure result for invalid inputs, or None if valid"""
         if pattern_type == "feature" and not feature:
             return ToolResult(
                 status=ToolStatus.FAILURE,
@@ -109,76 +216,88 @@ class TestPatternRetrieverTool(BaseTool):
                 error=f"k must be between 1 and 20, got {k}",
             )
 
+        return None
+
+    def _build_result(
+        self,
+        pattern_type: str,
+        patterns: List[Any],
+        feature: Optional[str],
+        error_message: Optional[str],
+        query: str,
+        k: int,
+    ) -> ToolResult:
+        """Wrap retrieved patterns in a success result"""
+        if pattern_type == "feature":
+            metadata = {"feature": feature, "k": k}
+        elif pattern_type == "failure":
+            metadata = {"error_message": error_message[:100], "k": k}  # Truncate for metadata
+        else:
+            metadata = {"query": query, "k": k}
+
+        return ToolResult(
+            status=ToolStatus.SUCCESS,
+            data={
+                "patterns": patterns,
+                "count": len(patterns),
+                "pattern_type": pattern_type,
+            },
+            metadata=metadata,
+        )
+
+    def _error_result(self, pattern_type: str, e: Exception) -> ToolResult:
+        """Wrap a retrieval exception in an error result"""
+        return ToolResult(
+            status=ToolStatus.ERROR,
+            error=f"Pattern retrieval failed: {str(e)}",
+            metadata={
+                "pattern_type": pattern_type,
+                "exception_type": type(e).__name__,
+            }
+        )
+
+    def _retrieve(
+        self,
+        pattern_type: str,
+        feature: Optional[str],
+        error_message: Optional[str],
+        k: int,
+    ) -> ToolResult:
+        """Internal retrieval logic"""
+
+        # Validate inputs based on pattern type
+        invalid = self._validate_request(pattern_type, feature, error_message, k)
+        if invalid:
+            return invalid
+
         try:
             # Get collection name from config or use default
             collection_name = self.config.get("collection_name", "test_knowledge")
 
-            # Initialize retriever
-            retriever = TestKnowledgeRetriever(collection_name=collection_name)
+            # Reuse the retriever for this collection across calls
+            retriever = _get_retriever(collection_name)
 
             # Retrieve patterns based on type
             if pattern_type == "feature":
                 patterns = retriever.get_test_patterns(feature=feature, k=k)
-
-                return ToolResult(
-                    status=ToolStatus.SUCCESS,
-                    data={
-                        "patterns": patterns,
-                        "count": len(patterns),
-                        "pattern_type": "feature",
-                    },
-                    metadata={
-                        "feature": feature,
-                        "k": k,
-                    }
-                )
+                query = feature
 
             elif pattern_type == "failure":
-                insights = retriever.get_failure_insights(
+                patterns = retriever.get_failure_insights(
                     error_message=error_message,
                     k=k
                 )
+                query = error_message
 
-                return ToolResult(
-                    status=ToolStatus.SUCCESS,
-                    data={
-                        "patterns": insights,
-                        "count": len(insights),
-                        "pattern_type": "failure",
-                    },
-                    metadata={
-                        "error_message": error_message[:100],  # Truncate for metadata
-                        "k": k,
-                    }
-                )
-
-            elif pattern_type == "similar":
+            else:
                 # Use vector search for similar tests
                 query = feature or error_message or "test patterns"
-                similar_tests = retriever.find_similar_tests(
+                patterns = retriever.find_similar_tests(
                     query=query,
                     k=k,
                 )
 
-                return ToolResult(
-                    status=ToolStatus.SUCCESS,
-                    data={
-                        "patterns": similar_tests,
-                        "count": len(similar_tests),
-                        "pattern_type": "similar",
-                    },
-                    metadata={
-                        "query": query,
-                        "k": k,
-                    }
-                )
+            return self._build_result(pattern_type, patterns, feature, error_message, query, k)
 
         except Exception as e:
-            return ToolResult(
-                status=ToolStatus.ERROR,
-                error=f"Pattern retrieval failed: {str(e)}",
-                metadata={
-                    "pattern_type": pattern_type,
-                    "exception_type": type(e).__name__,
-                }
-            )
+            return self._error_result(pattern_type, e)
@@ -4,9 +4,122 @@ Vector Search Tool
 Performs similarity search in the test knowledge base vector store.
 """
 
-from typing import Dict, Any, Optional, List
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
-from rag.retriever import TestKnowledgeRetriever
+
+if TYPE_CHECKING:
+    from rag.retriever import TestKnowledgeRetriever
+
+
+def __getattr__(name):
+    # rag.retriever pulls in the vector store and embedding stack, so it is
+    # only imported when a search actually runs
+    if name == "TestKnowledgeRetriever":
+        from rag.retriever import TestKnowledgeRetriever
+        globals()[name] = TestKnowledgeRetriever
+        return TestKnowledgeRetriever
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _get_retriever(collection_name: str) -> "TestKnowledgeRetriever":
+    """Get the shared retriever for a collection, opening its vector store once"""
+    from rag.retriever import get_shared_retriever
+
+    retriever_class = globals().get("TestKnowledgeRetriever") or __getattr__("TestKnowledgeRetriever")
+    return get_shared_retriever(collection_name, retriever_class)
+
+
+# Memoized search results, least recently used first. Keyed on
+# (collection, store version, query, k, doc_type, application, test_type), so
+# results cached before a write to the store are never served after it
+_SEARCH_CACHE_MAX = 512
+_search_cache: "OrderedDict[Tuple[Any, ...], Tuple[Dict[str, Any], ...]]" = OrderedDict()
+_search_cache_stats = {"hits": 0, "misses": 0}
+_search_cache_lock = threading.Lock()
+
+
+def _run_search(
+    retriever: "TestKnowledgeRetriever",
+    query: str,
+    k: int,
+    doc_type: Optional[str],
+    application: Optional[str],
+    test_type: Optional[str],
+) -> Tuple[Dict[str, Any], ...]:
+    """Run a search against the retriever"""
+    # Perform search based on doc_type
+    if doc_type == "test_case" or (not doc_type and (application or test_type)):
+        # Use find_similar_tests for test cases with filtering
+        return tuple(retriever.find_similar_tests(
+            query=query,
+            k=k,
+            application=application,
+            test_type=test_type
+        ))
+
+    # Use find_relevant_context for general search
+    docs = retriever.find_relevant_context(
+        query=query,
+        k=k,
+        doc_type=doc_type
+    )
+
+    # Convert to same format as find_similar_tests. A list comprehension
+    # sized by the interpreter beats both a generator and preallocation here
+    return tuple([
+        {
+            "content": doc.page_content,
+            "score": 0.0,  # find_relevant_context doesn't return scores
+            "metadata": doc.metadata
+        }
+        for doc in docs
+    ])
+
+
+def _cached_search(
+    retriever: "TestKnowledgeRetriever",
+    collection_name: str,
+    query: str,
+    k: int,
+    doc_type: Optional[str],
+    application: Optional[str],
+    test_type: Optional[str],
+) -> Tuple[Dict[str, Any], ...]:
+    """Run a search, reusing the results of an identical one on the same store version"""
+    key = (
+        collection_name, retriever.vector_store_manager.version,
+        query, k, doc_type, application, test_type,
+    )
+    with _search_cache_lock:
+        results = _search_cache.get(key)
+        if results is not None:
+            _search_cache.move_to_end(key)
+            _search_cache_stats["hits"] += 1
+            return results
+        _search_cache_stats["misses"] += 1
+
+    results = _run_search(retriever, query, k, doc_type, application, test_type)
+
+    # The vector store reports its own errors as empty results, so those
+    # are never stored
+    if results:
+        with _search_cache_lock:
+            _search_cache[key] = results
+            if len(_search_cache) > _SEARCH_CACHE_MAX:
+                _search_cache.popitem(last=False)
+    return results
+
+
+def _cache_info() -> Dict[str, int]:
+    """Hit, miss and size counts of the search cache"""
+    with _search_cache_lock:
+        return {
+            **_search_cache_stats,
+            "maxsize": _SEARCH_CACHE_MAX,
+            "currsize": len(_search_cache),
+        }
 
 
 class VectorSearchTool(BaseTool):
@@ -23,6 +136,18 @@ class VectorSearchTool(BaseTool):
     - Returns scored results
     """
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Drop all memoized search results
+
+        Not needed for correctness: results are keyed on the store version,
+        so changes to the knowledge base already bypass older entries.
+        """
+        with _search_cache_lock:
+            _search_cache.clear()
+            _search_cache_stats.update(hits=0, misses=0)
+
     def _validate_config(self) -> None:
         """Validate tool configuration"""
         # collection_name is optional, defaults to "test_knowledge"
@@ -80,6 +205,36 @@ class VectorSearchTool(BaseTool):
             test_type=test_type,
         )
 
+    def execute_batch(
+        self,
+        queries: List[str],
+        k: int = 5,
+        application: Optional[str] = None,
+        test_type: Optional[str] = None,
+    ) -> ToolResult:
+        """
+        Find similar test cases for several queries in one retriever call
+
+        All queries go to the vector store in one batched search, which
+        is cheaper than calling execute() once per query.
+
+        Args:
+            queries: Search query strings
+            k: Number of results to return per query
+            application: Filter by application name
+            test_type: Filter by test type
+
+        Returns:
+            ToolResult whose results are one list per query, in input order
+        """
+        return self._wrap_execution(
+            self._search_batch,
+            queries=queries,
+            k=k,
+            application=application,
+            test_type=test_type,
+        )
+
     def _search(
         self,
         query: str,
@@ -106,35 +261,17 @@ class VectorSearchTool(BaseTool):
             # Get collection name from config or use default
             collection_name = self.config.get("collection_name", "test_knowledge")
 
-            # Initialize retriever
-            retriever = TestKnowledgeRetriever(collection_name=collection_name)
-
-            # Perform search based on doc_type
-            if doc_type == "test_case" or (not doc_type and (application or test_type)):
-                # Use find_similar_tests for test cases with filtering
-                results = retriever.find_similar_tests(
-                    query=query,
-                    k=k,
-                    application=application,
-                    test_type=test_type
-                )
-            else:
-                # Use find_relevant_context for general search
-                docs = retriever.find_relevant_context(
-                    query=query,
-                    k=k,
-                    doc_type=doc_type
-                )
-
-                # Convert to same format as find_similar_tests
-                results = [
-                    {
-                        "content": doc.page_content,
-                        "score": 0.0,  # find_relevant_context doesn't return scores
-                        "metadata": doc.metadata
-                    }
-                    for doc in docs
-                ]
+            # Reuse the retriever for this collection across calls
+            retriever = _get_retriever(collection_name)
+
+            # Identical searches (common in agent retry loops) skip the
+            # embedding and ANN lookup entirely until the store changes
+            cached = _cached_search(
+                retriever, collection_name, query, k, doc_type, application, test_type
+            )
+
+            # Copy so callers can't mutate the cached entries
+            results = [dict(result, metadata=dict(result["metadata"])) for result in cached]
 
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -149,7 +286,8 @@ class VectorSearchTool(BaseTool):
                     "filters_applied": {
                         "application": application,
                         "test_type": test_type,
-                    }
+                    },
+                    "cache": _cache_info(),
                 }
             )
 
@@ -162,3 +300,67 @@ class VectorSearchTool(BaseTool):
                     "exception_type": type(e).__name__,
                 }
             )
+
+    def _search_batch(
+        self,
+        queries: List[str],
+        k: int,
+        application: Optional[str],
+        test_type: Optional[str],
+    ) -> ToolResult:
+        """Internal batched search logic"""
+
+        if not queries:
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                error="Queries cannot be empty",
+            )
+
+        if any(not query or not query.strip() for query in queries):
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                error="Query cannot be empty",
+            )
+
+        if k < 1 or k > 100:
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                error=f"k must be between 1 and 100, got {k}",
+            )
+
+        try:
+            collection_name = self.config.get("collection_name", "test_knowledge")
+            retriever = _get_retriever(collection_name)
+
+            results = retriever.find_similar_tests_batch(
+                queries=queries,
+                k=k,
+                application=application,
+                test_type=test_type
+            )
+
+            return ToolResult(
+                status=ToolStatus.SUCCESS,
+                data={
+                    "results": results,
+                    "count": sum(len(hits) for hits in results),
+                },
+                metadata={
+                    "queries": queries,
+                    "k": k,
+                    "filters_applied": {
+                        "application": application,
+                        "test_type": test_type,
+                    },
+                }
+            )
+
+        except Exception as e:
+            return ToolResult(
+                status=ToolStatus.ERROR,
+                error=f"Vector search failed: {str(e)}",
+                metadata={
+                    "queries": queries,
+                    "exception_type": type(e).__name__,
+                }
+            )
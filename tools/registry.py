@@ -8,19 +8,27 @@ from typing import List, Optional, Dict, Any
 from tools.base import BaseTool, ToolRegistry, ToolMetadata
 
 
-def register_tool(tool_class: type) -> None:
+def register_tool(tool_class: type) -> type:
     """
     Register a tool class
 
+    Registering a class that is already registered is a no-op, so package
+    imports can call this unconditionally.
+
     Args:
         tool_class: Tool class to register
 
+    Returns:
+        The tool class, so this works as a decorator
+
     Example:
         @register_tool
         class MyTool(BaseTool):
             ...
     """
-    ToolRegistry.register(tool_class)
+    if not ToolRegistry.is_registered(tool_class):
+        ToolRegistry.register(tool_class)
+    return tool_class
 
 
 def get_tool(tool_name: str, config: Optional[Dict[str, Any]] = None) -> BaseTool:
@@ -4,9 +4,221 @@ Report Generator Tool
 Generates test execution reports in multiple formats.
 """
 
+from collections import Counter
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from html import escape
+from typing import Dict, Any, Optional, List, Iterator, TextIO, Tuple
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
+from utils.helpers import dumps
+
+
+# Static parts of the HTML report, built once at import
+_HTML_STYLE = """    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+        .header h1 {
+            margin: 0 0 10px 0;
+            font-size: 2.5em;
+        }
+        .header p {
+            margin: 5px 0;
+            opacity: 0.9;
+        }
+        .summary {
+            background-color: white;
+            padding: 25px;
+            margin: 20px 0;
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        .summary h2 {
+            margin-top: 0;
+            color: #333;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
+            gap: 15px;
+            margin: 20px 0;
+        }
+        .stat-box {
+            text-align: center;
+            padding: 20px;
+            background-color: #f8f9fa;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+            transition: transform 0.2s;
+        }
+        .stat-box:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+        }
+        .stat-box h3 {
+            margin: 0;
+            font-size: 2em;
+            color: #333;
+        }
+        .stat-box p {
+            margin: 10px 0 0 0;
+            color: #666;
+            text-transform: uppercase;
+            font-size: 0.9em;
+            letter-spacing: 1px;
+        }
+        .stat-box.passed {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+        }
+        .stat-box.passed h3,
+        .stat-box.passed p {
+            color: white;
+        }
+        .stat-box.failed {
+            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+            color: white;
+        }
+        .stat-box.failed h3,
+        .stat-box.failed p {
+            color: white;
+        }
+        .test-results {
+            background-color: white;
+            padding: 25px;
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }
+        .test-results h2 {
+            margin-top: 0;
+            color: #333;
+        }
+        .test-item {
+            padding: 15px;
+            margin: 15px 0;
+            border-left: 5px solid #ddd;
+            border-radius: 5px;
+            background-color: #fafafa;
+            transition: all 0.2s;
+        }
+        .test-item:hover {
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            transform: translateX(5px);
+        }
+        .test-item.passed {
+            border-left-color: #667eea;
+            background-color: #f0f4ff;
+        }
+        .test-item.failed {
+            border-left-color: #f5576c;
+            background-color: #fff0f2;
+        }
+        .test-item.skipped {
+            border-left-color: #ffa726;
+            background-color: #fff8e1;
+        }
+        .test-item.error {
+            border-left-color: #ef5350;
+            background-color: #ffebee;
+        }
+        .test-item h3 {
+            margin: 0 0 10px 0;
+            color: #333;
+            font-size: 1.2em;
+        }
+        .test-item p {
+            margin: 5px 0;
+            color: #666;
+        }
+        .test-item .status {
+            display: inline-block;
+            padding: 4px 12px;
+            border-radius: 12px;
+            font-size: 0.85em;
+            font-weight: bold;
+            text-transform: uppercase;
+        }
+        .status.passed {
+            background-color: #667eea;
+            color: white;
+        }
+        .status.failed {
+            background-color: #f5576c;
+            color: white;
+        }
+        .status.skipped {
+            background-color: #ffa726;
+            color: white;
+        }
+        .status.error {
+            background-color: #ef5350;
+            color: white;
+        }
+        .error-message {
+            background-color: #fff5f5;
+            border: 1px solid #fc8181;
+            padding: 12px;
+            border-radius: 5px;
+            margin-top: 10px;
+            font-family: 'Courier New', monospace;
+            font-size: 0.9em;
+            color: #c53030;
+            white-space: pre-wrap;
+            word-wrap: break-word;
+        }
+        .duration {
+            color: #667eea;
+            font-weight: bold;
+        }
+    </style>
+"""
+
+_HTML_FOOTER = """
+    </div>
+</body>
+</html>
+"""
+
+# Markdown status icons
+_STATUS_ICONS = {
+    "passed": "✅",
+    "failed": "❌",
+    "skipped": "⏭️",
+    "error": "💥",
+}
+
+_HTML_ERROR = """
+            <div class="error-message">{}</div>
+"""
+
+
+def _html_row_parts(status: str) -> Tuple[str, str]:
+    """HTML for a result row around its test name, for an escaped status"""
+    return (
+        f"""
+        <div class="test-item {status}">
+            <h3>""",
+        f"""</h3>
+            <p><span class="status {status}">{status}</span></p>
+            <p><strong>Duration:</strong> <span class="duration">""",
+    )
+
+
+def _result_duration(result: Dict[str, Any]) -> float:
+    """Duration of a test result, from its metrics or top-level field"""
+    metrics = result.get("metrics")
+    if isinstance(metrics, dict):
+        return metrics.get("duration_seconds", 0.0)
+    return result.get("duration_seconds", 0.0)
 
 
 class ReportGeneratorTool(BaseTool):
@@ -75,6 +287,47 @@ class ReportGeneratorTool(BaseTool):
             include_stats=include_stats,
         )
 
+    def generate_to_stream(
+        self,
+        fh: TextIO,
+        test_results: List[Dict[str, Any]],
+        app_name: str,
+        format: str = "html",
+        include_stats: bool = True,
+    ) -> int:
+        """
+        Write a report straight into an open text file
+
+        HTML and Markdown reports are written one section at a time, so the
+        full report is never held in memory. JSON is written in one piece.
+
+        Args:
+            fh: Writable text file object
+            test_results: List of test result dictionaries
+            app_name: Application name
+            format: Report format (html, json, markdown)
+            include_stats: Include statistics in report
+
+        Returns:
+            Number of characters written
+
+        Raises:
+            ValueError: If format is not html, json, or markdown
+        """
+        if format not in ["html", "json", "markdown"]:
+            raise ValueError(f"Unsupported format: {format}. Must be html, json, or markdown")
+
+        statistics = self._calculate_statistics(test_results) if include_stats else {}
+
+        if format == "html":
+            sections = self._iter_html(test_results, app_name, statistics)
+        elif format == "markdown":
+            sections = self._iter_markdown(test_results, app_name, statistics)
+        else:
+            sections = [self._generate_json(test_results, app_name, statistics)]
+
+        return sum(map(fh.write, sections))
+
     def _generate_report(
         self,
         test_results: List[Dict[str, Any]],
@@ -148,18 +401,15 @@ class ReportGeneratorTool(BaseTool):
                 "total_duration": 0.0,
             }
 
-        passed = sum(1 for r in test_results if r.get("status") == "passed")
-        failed = sum(1 for r in test_results if r.get("status") == "failed")
-        skipped = sum(1 for r in test_results if r.get("status") == "skipped")
-        error = sum(1 for r in test_results if r.get("status") == "error")
+        # Single pass over the results for all status counts; a list feeds
+        # Counter's C loop faster than a generator
+        counts = Counter([r.get("status") for r in test_results])
+        passed = counts["passed"]
+        failed = counts["failed"]
+        skipped = counts["skipped"]
+        error = counts["error"]
 
-        # Calculate total duration
-        total_duration = 0.0
-        for r in test_results:
-            if "metrics" in r and isinstance(r["metrics"], dict):
-                total_duration += r["metrics"].get("duration_seconds", 0.0)
-            elif "duration_seconds" in r:
-                total_duration += r.get("duration_seconds", 0.0)
+        total_duration = sum(map(_result_duration, test_results), 0.0)
 
         pass_rate = (passed / total * 100) if total > 0 else 0
 
@@ -180,182 +430,25 @@ class ReportGeneratorTool(BaseTool):
         statistics: Dict[str, Any],
     ) -> str:
         """Generate HTML report"""
+        return "".join(self._iter_html(test_results, app_name, statistics))
+
+    def _iter_html(
+        self,
+        test_results: List[Dict[str, Any]],
+        app_name: str,
+        statistics: Dict[str, Any],
+    ) -> Iterator[str]:
+        """Yield HTML report sections in order"""
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        app_name = escape(app_name)
 
-        html = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html>
 <head>
     <title>Test Report - {app_name}</title>
     <meta charset="UTF-8">
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        }}
-        .header h1 {{
-            margin: 0 0 10px 0;
-            font-size: 2.5em;
-        }}
-        .header p {{
-            margin: 5px 0;
-            opacity: 0.9;
-        }}
-        .summary {{
-            background-color: white;
-            padding: 25px;
-            margin: 20px 0;
-            border-radius: 10px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .summary h2 {{
-            margin-top: 0;
-            color: #333;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
-            gap: 15px;
-            margin: 20px 0;
-        }}
-        .stat-box {{
-            text-align: center;
-            padding: 20px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-            transition: transform 0.2s;
-        }}
-        .stat-box:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-        }}
-        .stat-box h3 {{
-            margin: 0;
-            font-size: 2em;
-            color: #333;
-        }}
-        .stat-box p {{
-            margin: 10px 0 0 0;
-            color: #666;
-            text-transform: uppercase;
-            font-size: 0.9em;
-            letter-spacing: 1px;
-        }}
-        .stat-box.passed {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-        }}
-        .stat-box.passed h3,
-        .stat-box.passed p {{
-            color: white;
-        }}
-        .stat-box.failed {{
-            background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
-            color: white;
-        }}
-        .stat-box.failed h3,
-        .stat-box.failed p {{
-            color: white;
-        }}
-        .test-results {{
-            background-color: white;
-            padding: 25px;
-            border-radius: 10px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }}
-        .test-results h2 {{
-            margin-top: 0;
-            color: #333;
-        }}
-        .test-item {{
-            padding: 15px;
-            margin: 15px 0;
-            border-left: 5px solid #ddd;
-            border-radius: 5px;
-            background-color: #fafafa;
-            transition: all 0.2s;
-        }}
-        .test-item:hover {{
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            transform: translateX(5px);
-        }}
-        .test-item.passed {{
-            border-left-color: #667eea;
-            background-color: #f0f4ff;
-        }}
-        .test-item.failed {{
-            border-left-color: #f5576c;
-            background-color: #fff0f2;
-        }}
-        .test-item.skipped {{
-            border-left-color: #ffa726;
-            background-color: #fff8e1;
-        }}
-        .test-item.error {{
-            border-left-color: #ef5350;
-            background-color: #ffebee;
-        }}
-        .test-item h3 {{
-            margin: 0 0 10px 0;
-            color: #333;
-            font-size: 1.2em;
-        }}
-        .test-item p {{
-            margin: 5px 0;
-            color: #666;
-        }}
-        .test-item .status {{
-            display: inline-block;
-            padding: 4px 12px;
-            border-radius: 12px;
-            font-size: 0.85em;
-            font-weight: bold;
-            text-transform: uppercase;
-        }}
-        .status.passed {{
-            background-color: #667eea;
-            color: white;
-        }}
-        .status.failed {{
-            background-color: #f5576c;
-            color: white;
-        }}
-        .status.skipped {{
-            background-color: #ffa726;
-            color: white;
-        }}
-        .status.error {{
-            background-color: #ef5350;
-            color: white;
-        }}
-        .error-message {{
-            background-color: #fff5f5;
-            border: 1px solid #fc8181;
-            padding: 12px;
-            border-radius: 5px;
-            margin-top: 10px;
-            font-family: 'Courier New', monospace;
-            font-size: 0.9em;
-            color: #c53030;
-            white-space: pre-wrap;
-            word-wrap: break-word;
-        }}
-        .duration {{
-            color: #667eea;
-            font-weight: bold;
-        }}
-    </style>
-</head>
+{_HTML_STYLE}</head>
 <body>
     <div class="header">
         <h1>🧪 Test Execution Report</h1>
@@ -397,39 +490,26 @@ class ReportGeneratorTool(BaseTool):
         <h2>📋 Test Results</h2>
 """
 
-        for result in test_results:
-            test_name = result.get("test_name", "Unknown Test")
-            status = result.get("status", "unknown")
-            error_message = result.get("error_message")
-
-            # Get duration
-            duration = 0.0
-            if "metrics" in result and isinstance(result["metrics"], dict):
-                duration = result["metrics"].get("duration_seconds", 0.0)
-            elif "duration_seconds" in result:
-                duration = result.get("duration_seconds", 0.0)
+        # Row markup before and after the test name, specialized once per
+        # distinct status since suites only use a handful of them
+        row_parts: Dict[str, Tuple[str, str]] = {}
 
-            html += f"""
-        <div class="test-item {status}">
-            <h3>{test_name}</h3>
-            <p><span class="status {status}">{status}</span></p>
-            <p><strong>Duration:</strong> <span class="duration">{duration:.2f}s</span></p>
-"""
-
-            if error_message:
-                html += f"""
-            <div class="error-message">{error_message}</div>
-"""
+        for result in test_results:
+            status = str(result.get("status", "unknown"))
+            parts = row_parts.get(status)
+            if parts is None:
+                parts = row_parts[status] = _html_row_parts(escape(status))
 
-            html += "        </div>\n"
+            # Result fields are arbitrary text, so escape them before embedding
+            test_name = escape(str(result.get("test_name", "Unknown Test")))
+            error_message = result.get("error_message")
+            error_block = _HTML_ERROR.format(escape(str(error_message))) if error_message else ""
 
-        html += """
-    </div>
-</body>
-</html>
+            yield f"""{parts[0]}{test_name}{parts[1]}{_result_duration(result):.2f}s</span></p>
+{error_block}        </div>
 """
 
-        return html
+        yield _HTML_FOOTER
 
     def _generate_json(
         self,
@@ -439,8 +519,6 @@ class ReportGeneratorTool(BaseTool):
     ) -> str:
         """Generate JSON report"""
 
-        import json
-
         report_data = {
             "application": app_name,
             "generated_at": datetime.now().isoformat(),
@@ -448,7 +526,7 @@ class ReportGeneratorTool(BaseTool):
             "results": test_results,
         }
 
-        return json.dumps(report_data, indent=2, default=str)
+        return dumps(report_data, indent=True)
 
     def _generate_markdown(
         self,
@@ -457,10 +535,19 @@ class ReportGeneratorTool(BaseTool):
         statistics: Dict[str, Any],
     ) -> str:
         """Generate Markdown report"""
+        return "".join(self._iter_markdown(test_results, app_name, statistics))
+
+    def _iter_markdown(
+        self,
+        test_results: List[Dict[str, Any]],
+        app_name: str,
+        statistics: Dict[str, Any],
+    ) -> Iterator[str]:
+        """Yield Markdown report sections in order"""
 
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-        md = f"""# 🧪 Test Execution Report
+        yield f"""# 🧪 Test Execution Report
 
 **Application:** {app_name}
 **Generated:** {timestamp}
@@ -486,22 +573,11 @@ class ReportGeneratorTool(BaseTool):
             status = result.get("status", "unknown")
             error_message = result.get("error_message")
 
-            # Status icon
-            status_icon = {
-                "passed": "✅",
-                "failed": "❌",
-                "skipped": "⏭️",
-                "error": "💥",
-            }.get(status, "❓")
+            status_icon = _STATUS_ICONS.get(status, "❓")
 
-            # Get duration
-            duration = 0.0
-            if "metrics" in result and isinstance(result["metrics"], dict):
-                duration = result["metrics"].get("duration_seconds", 0.0)
-            elif "duration_seconds" in result:
-                duration = result.get("duration_seconds", 0.0)
+            duration = _result_duration(result)
 
-            md += f"""### {status_icon} {test_name}
+            yield f"""### {status_icon} {test_name}
 
 - **Status:** `{status.upper()}`
 - **Duration:** {duration:.2f}s
@@ -509,11 +585,9 @@ class ReportGeneratorTool(BaseTool):
 """
 
             if error_message:
-                md += f"""**Error:**
+                yield f"""**Error:**
 ```
 {error_message}
 ```
 
 """
-
-        return md
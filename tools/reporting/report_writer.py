@@ -4,10 +4,43 @@ Report Writer Tool
 Writes generated reports to disk with path validation.
 """
 
+import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Callable, Set, BinaryIO, Tuple
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
+from tools.reporting.report_generator import ReportGeneratorTool
+
+# File extension for each report format
+_FORMAT_EXTENSIONS = {
+    "html": "html",
+    "json": "json",
+    "markdown": "md",
+}
+
+# Large write buffer for streamed reports
+_STREAM_BUFFER_SIZE = 1 << 20
+
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+_TRUNCATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def _open_report(file_path: Path, overwrite: bool) -> Tuple[int, bool]:
+    """
+    Open a report file for writing without a separate exists() check
+
+    Returns:
+        (file descriptor, whether the file was newly created)
+
+    Raises:
+        FileExistsError: If the file exists and overwrite is False
+    """
+    try:
+        return os.open(file_path, _CREATE_FLAGS, 0o666), True
+    except FileExistsError:
+        if not overwrite:
+            raise
+    return os.open(file_path, _TRUNCATE_FLAGS, 0o666), False
 
 
 class ReportWriterTool(BaseTool):
@@ -27,6 +60,11 @@ class ReportWriterTool(BaseTool):
     - Overwrite protection (optional)
     """
 
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        # Directories already created by this instance
+        self._ensured_dirs: Set[Path] = set()
+
     def _validate_config(self) -> None:
         """Validate tool configuration"""
         if not self.config.get("output_dir"):
@@ -81,6 +119,43 @@ class ReportWriterTool(BaseTool):
             overwrite=overwrite,
         )
 
+    def execute_stream(
+        self,
+        test_results: List[Dict[str, Any]],
+        app_name: str,
+        format: str,
+        filename: Optional[str] = None,
+        overwrite: bool = False,
+        include_stats: bool = True,
+    ) -> ToolResult:
+        """
+        Generate a report and stream it straight to disk
+
+        Unlike generating with ReportGeneratorTool and passing the content to
+        execute(), HTML and Markdown sections are written as they are
+        produced, so the whole report is never held in memory.
+
+        Args:
+            test_results: List of test result dictionaries
+            app_name: Application name
+            format: Report format (html, json, markdown)
+            filename: Optional custom filename
+            overwrite: Allow overwriting existing files
+            include_stats: Include statistics in report
+
+        Returns:
+            ToolResult with file path
+        """
+        return self._wrap_execution(
+            self._stream_report,
+            test_results=test_results,
+            app_name=app_name,
+            format=format,
+            filename=filename,
+            overwrite=overwrite,
+            include_stats=include_stats,
+        )
+
     def _write_report(
         self,
         report_content: str,
@@ -102,32 +177,91 @@ class ReportWriterTool(BaseTool):
                 error=f"Unsupported format: {format}",
             )
 
-        try:
-            # Get output directory from config
-            output_dir = Path(self.config["output_dir"])
+        # Encode once and write the bytes straight through, skipping the
+        # text layer's chunked re-encoding
+        data = report_content.encode("utf-8")
 
-            # Create output directory if it doesn't exist
-            output_dir.mkdir(parents=True, exist_ok=True)
+        def write(f: BinaryIO) -> int:
+            f.write(data)
+            return len(report_content)
+
+        return self._write_file(format, filename, overwrite, write, binary=True)
+
+    def _stream_report(
+        self,
+        test_results: List[Dict[str, Any]],
+        app_name: str,
+        format: str,
+        filename: Optional[str],
+        overwrite: bool,
+        include_stats: bool,
+    ) -> ToolResult:
+        """Internal streaming write logic"""
+
+        if not app_name or not app_name.strip():
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                error="app_name cannot be empty",
+            )
+
+        if format not in ["html", "json", "markdown"]:
+            return ToolResult(
+                status=ToolStatus.FAILURE,
+                error=f"Unsupported format: {format}",
+            )
+
+        generator = ReportGeneratorTool()
+        return self._write_file(
+            format,
+            filename,
+            overwrite,
+            lambda f: generator.generate_to_stream(f, test_results, app_name, format, include_stats),
+            buffering=_STREAM_BUFFER_SIZE,
+        )
+
+    def _write_file(
+        self,
+        format: str,
+        filename: Optional[str],
+        overwrite: bool,
+        write: Callable[[Any], int],
+        buffering: int = -1,
+        binary: bool = False,
+    ) -> ToolResult:
+        """
+        Resolve the target path and write to it
+
+        write receives the open file (binary or UTF-8 text, per binary) and
+        returns the number of characters in the report.
+        """
+
+        # Get output directory from config
+        output_dir = Path(self.config["output_dir"])
+
+        try:
+            # Create output directory once per instance
+            if output_dir not in self._ensured_dirs:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                self._ensured_dirs.add(output_dir)
 
             # Generate filename if not provided
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                extension = {
-                    "html": "html",
-                    "json": "json",
-                    "markdown": "md",
-                }[format]
-                filename = f"report_{timestamp}.{extension}"
+                filename = f"report_{timestamp}.{_FORMAT_EXTENSIONS[format]}"
 
             # Construct full path
             file_path = output_dir / filename
 
-            # Check if file exists
-            file_exists = file_path.exists()
-            created = not file_exists
-
-            # Handle existing file
-            if file_exists and not overwrite:
+            # Create atomically so a concurrent writer can't be overwritten
+            # between an existence check and the open
+            try:
+                try:
+                    fd, created = _open_report(file_path, overwrite)
+                except FileNotFoundError:
+                    # Output dir was removed after we created it
+                    output_dir.mkdir(parents=True, exist_ok=True)
+                    fd, created = _open_report(file_path, overwrite)
+            except FileExistsError:
                 return ToolResult(
                     status=ToolStatus.FAILURE,
                     error=f"File already exists and overwrite=False: {file_path}",
@@ -135,8 +269,24 @@ class ReportWriterTool(BaseTool):
                 )
 
             # Write content to file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
+            try:
+                if binary:
+                    f = os.fdopen(fd, "wb", buffering=buffering)
+                else:
+                    f = os.fdopen(fd, "w", encoding="utf-8", buffering=buffering)
+            except BaseException:
+                # The descriptor has no file object to close it yet
+                os.close(fd)
+                file_path.unlink(missing_ok=True)
+                raise
+            try:
+                with f:
+                    file_size = write(f)
+            except BaseException:
+                # A partial report is useless, and left in place it would
+                # make a retry with overwrite=False fail
+                file_path.unlink(missing_ok=True)
+                raise
 
             return ToolResult(
                 status=ToolStatus.SUCCESS,
@@ -147,7 +297,7 @@ class ReportWriterTool(BaseTool):
                 },
                 metadata={
                     "format": format,
-                    "file_size": len(report_content),
+                    "file_size": file_size,
                     "output_dir": str(output_dir),
                 }
             )
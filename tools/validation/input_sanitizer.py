@@ -5,8 +5,58 @@ Sanitizes user inputs to prevent prompt injection and other security issues.
 """
 
 import re
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from tools.base import BaseTool, ToolResult, ToolStatus, ToolMetadata
+from utils.helpers import compile_linear, fold_case, fold_pattern
+
+
+def _compile_folded(pattern: str) -> "re.Pattern[str]":
+    """Compile a pattern for searching fold_case()d text"""
+    folded = fold_pattern(pattern)
+    if folded is None:
+        # Lowercasing would change what the pattern matches
+        return re.compile(pattern, re.IGNORECASE)
+    return re.compile(folded)
+
+
+# The pattern lists are compiled on first use and cached on their contents,
+# so subclass overrides and runtime edits to the lists take effect
+
+@lru_cache(maxsize=32)
+def _compile_folded_patterns(
+    patterns: Tuple[str, ...],
+) -> Tuple[Tuple[str, "re.Pattern[str]", "re.Pattern[str]"], ...]:
+    """
+    Compile prompt or SQL patterns
+
+    These stay on re: they rely on Unicode \\s, which RE2 limits to ASCII,
+    and they scan in linear time anyway. Each is compiled twice: for
+    searching the folded text, where a lowercased case-sensitive pattern
+    keeps re's literal-prefix fast path that IGNORECASE disables, and with
+    IGNORECASE for the substitution on the original text.
+    """
+    return tuple((p, _compile_folded(p), re.compile(p, re.IGNORECASE)) for p in patterns)
+
+
+@lru_cache(maxsize=32)
+def _compile_command_patterns(patterns: Tuple[str, ...]) -> Tuple[Tuple[str, Any], ...]:
+    """Compile command injection patterns, with RE2 when it is installed"""
+    return tuple((p, compile_linear(p)) for p in patterns)
+
+
+def _prefilter(
+    patterns: Tuple[str, ...],
+    declared: Tuple[Tuple[str, ...], Tuple[str, ...]],
+) -> Optional[Tuple[str, ...]]:
+    """Declared prefilter literals, or None when the patterns are not the ones declared for"""
+    declared_patterns, literals = declared
+    return literals if patterns == declared_patterns else None
+
+
+def _contains_any(text: str, literals: Optional[Tuple[str, ...]]) -> bool:
+    """Prefilter test; None means there is no prefilter and the text is always scanned"""
+    return literals is None or any(literal in text for literal in literals)
 
 
 class InputSanitizerTool(BaseTool):
@@ -35,6 +85,16 @@ class InputSanitizerTool(BaseTool):
         r"execute\s+the\s+following",
     ]
 
+    # Each category's prefilter: the default patterns above cannot match
+    # unless one of these literals is present (case-folded for the prompt
+    # and SQL patterns), so clean input skips the regex scans. Paired with
+    # the patterns they were written for; overridden or edited pattern
+    # lists are always scanned
+    _PROMPT_INJECTION_LEADS = (
+        tuple(PROMPT_INJECTION_PATTERNS),
+        ("ignore", "disregard", "forget", "you", "new", "system", "execute"),
+    )
+
     SQL_INJECTION_PATTERNS = [
         r"('\s*OR\s*'1'\s*=\s*'1)",
         r"(;\s*DROP\s+TABLE)",
@@ -43,12 +103,39 @@ class InputSanitizerTool(BaseTool):
         r"(--\s*$)",
     ]
 
+    _SQL_INJECTION_LEADS = (
+        tuple(SQL_INJECTION_PATTERNS),
+        ("'1'", "drop", "delete", "union", "--"),
+    )
+
     COMMAND_INJECTION_PATTERNS = [
         r"[;&|`$()]",  # Shell metacharacters
         r"\$\{.*\}",   # Variable substitution
         r"\$\(.*\)",   # Command substitution
     ]
 
+    _COMMAND_INJECTION_LEADS = (
+        tuple(COMMAND_INJECTION_PATTERNS),
+        (";", "&", "|", "`", "$", "(", ")"),
+    )
+
+    # Tags removed together with their content. These lazy .*? scans are
+    # quadratic on input full of unclosed tags under re, so they use RE2 when
+    # it is installed
+    _DANGEROUS_TAG_RES = {
+        tag: compile_linear(rf'<{tag}[^>]*>.*?</{tag}>', re.IGNORECASE | re.DOTALL)
+        for tag in ['script', 'style', 'iframe', 'object', 'embed', 'noscript']
+    }
+    _HTML_TAG_RE = compile_linear(r"<[^>]+>")
+
+    # Zero-width characters that could hide malicious content
+    _DANGEROUS_UNICODE = (
+        "\u200B",  # Zero-width space
+        "\u200C",  # Zero-width non-joiner
+        "\u200D",  # Zero-width joiner
+        "\uFEFF",  # Zero-width no-break space
+    )
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.max_length = self.config.get("max_length", 10000)
@@ -128,10 +215,14 @@ class InputSanitizerTool(BaseTool):
             warnings.append(f"Input exceeds max length ({self.max_length}). Truncating.")
             sanitized_text = sanitized_text[:self.max_length]
 
+        lowered = fold_case(sanitized_text)
+
         # Check for prompt injection
-        if check_prompt_injection:
-            for pattern in self.PROMPT_INJECTION_PATTERNS:
-                if re.search(pattern, sanitized_text, re.IGNORECASE):
+        patterns = tuple(self.PROMPT_INJECTION_PATTERNS)
+        leads = _prefilter(patterns, self._PROMPT_INJECTION_LEADS)
+        if check_prompt_injection and _contains_any(lowered, leads):
+            for pattern, search_re, sub_re in _compile_folded_patterns(patterns):
+                if search_re.search(lowered):
                     warnings.append(f"Potential prompt injection detected: pattern '{pattern}'")
                     if self.strict_mode:
                         return ToolResult(
@@ -140,12 +231,15 @@ class InputSanitizerTool(BaseTool):
                             metadata={"warnings": warnings, "pattern": pattern}
                         )
                     # In non-strict mode, sanitize by removing the pattern
-                    sanitized_text = re.sub(pattern, "[REMOVED]", sanitized_text, flags=re.IGNORECASE)
+                    sanitized_text = sub_re.sub("[REMOVED]", sanitized_text)
+                    lowered = fold_case(sanitized_text)
 
         # Check for SQL injection
-        if check_sql_injection:
-            for pattern in self.SQL_INJECTION_PATTERNS:
-                if re.search(pattern, sanitized_text, re.IGNORECASE):
+        patterns = tuple(self.SQL_INJECTION_PATTERNS)
+        leads = _prefilter(patterns, self._SQL_INJECTION_LEADS)
+        if check_sql_injection and _contains_any(lowered, leads):
+            for pattern, search_re, sub_re in _compile_folded_patterns(patterns):
+                if search_re.search(lowered):
                     warnings.append(f"Potential SQL injection detected: pattern '{pattern}'")
                     if self.strict_mode:
                         return ToolResult(
@@ -153,12 +247,15 @@ class InputSanitizerTool(BaseTool):
                             error="SQL injection detected in strict mode",
                             metadata={"warnings": warnings, "pattern": pattern}
                         )
-                    sanitized_text = re.sub(pattern, "[REMOVED]", sanitized_text, flags=re.IGNORECASE)
+                    sanitized_text = sub_re.sub("[REMOVED]", sanitized_text)
+                    lowered = fold_case(sanitized_text)
 
         # Check for command injection
-        if check_command_injection:
-            for pattern in self.COMMAND_INJECTION_PATTERNS:
-                if re.search(pattern, sanitized_text):
+        patterns = tuple(self.COMMAND_INJECTION_PATTERNS)
+        leads = _prefilter(patterns, self._COMMAND_INJECTION_LEADS)
+        if check_command_injection and _contains_any(sanitized_text, leads):
+            for pattern, command_re in _compile_command_patterns(patterns):
+                if command_re.search(sanitized_text):
                     warnings.append(f"Potential command injection detected: pattern '{pattern}'")
                     if self.strict_mode:
                         return ToolResult(
@@ -166,28 +263,26 @@ class InputSanitizerTool(BaseTool):
                             error="Command injection detected in strict mode",
                             metadata={"warnings": warnings, "pattern": pattern}
                         )
-                    sanitized_text = re.sub(pattern, "", sanitized_text)
+                    sanitized_text = command_re.sub("", sanitized_text)
 
         # Remove HTML tags if requested
-        if remove_html and not self.allow_html:
+        if remove_html and not self.allow_html and "<" in sanitized_text:
             # First, remove dangerous tags completely (including their content)
-            dangerous_tags = ['script', 'style', 'iframe', 'object', 'embed', 'noscript']
-            for tag in dangerous_tags:
-                pattern = rf'<{tag}[^>]*>.*?</{tag}>'
-                if re.search(pattern, sanitized_text, re.IGNORECASE | re.DOTALL):
+            for tag, compiled in self._DANGEROUS_TAG_RES.items():
+                if compiled.search(sanitized_text):
                     warnings.append(f"Dangerous <{tag}> tag detected and removed completely")
-                    sanitized_text = re.sub(pattern, '', sanitized_text, flags=re.IGNORECASE | re.DOTALL)
+                    sanitized_text = compiled.sub('', sanitized_text)
 
             # Then remove remaining HTML tags (but keep their content)
-            html_pattern = r"<[^>]+>"
-            if re.search(html_pattern, sanitized_text):
+            if self._HTML_TAG_RE.search(sanitized_text):
                 warnings.append("HTML tags detected and removed")
-                sanitized_text = re.sub(html_pattern, "", sanitized_text)
+                sanitized_text = self._HTML_TAG_RE.sub("", sanitized_text)
 
         # Remove potentially dangerous Unicode characters
         sanitized_text = self._remove_dangerous_unicode(sanitized_text)
 
-        # Normalize whitespace
+        # Normalize whitespace; split() covers every Unicode space and is
+        # faster than a translate table plus a space-run regex
         sanitized_text = " ".join(sanitized_text.split())
 
         return ToolResult(
@@ -203,13 +298,8 @@ class InputSanitizerTool(BaseTool):
 
     def _remove_dangerous_unicode(self, text: str) -> str:
         """Remove potentially dangerous Unicode characters"""
-        # Remove zero-width characters that could hide malicious content
-        dangerous_chars = [
-            "\u200B",  # Zero-width space
-            "\u200C",  # Zero-width non-joiner
-            "\u200D",  # Zero-width joiner
-            "\uFEFF",  # Zero-width no-break space
-        ]
-        for char in dangerous_chars:
+        # str.replace is a fast C scan that returns early when the character
+        # is absent; measured far faster than a single str.translate pass
+        for char in self._DANGEROUS_UNICODE:
             text = text.replace(char, "")
         return text
@@ -1,14 +1,35 @@
 """Helper utilities and common functions."""
 
 import json
+import os
 import re
+import threading
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import yaml
 
+try:
+    import orjson
+except ImportError:  # optional fast JSON encoder
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # optional linear-time regex engine
+    re2 = None
+
+# AGENTIC_USE_RE2=0 forces the standard re engine even when RE2 is installed
+if os.getenv("AGENTIC_USE_RE2", "1") != "1":
+    re2 = None
+
+# Leave datetimes and dataclasses to default=str so output matches json.dumps
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson is not None else 0
+
 
 def load_yaml(file_path: str) -> Dict[str, Any]:
     """
@@ -49,6 +70,8 @@ def load_json(file_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing JSON data
     """
+    # Stays on the stdlib parser: orjson silently turns integers beyond 64
+    # bits into floats, and these files are re-saved after edits
     with open(file_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
@@ -65,8 +88,48 @@ def save_json(data: Any, file_path: str, indent: int = 2) -> None:
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=indent, default=str)
+    # Stays on the stdlib encoder: orjson writes NaN and Infinity as null.
+    # Encoding to one string first is faster than json.dump's chunked writes
+    # and leaves the old file intact if a value cannot be encoded
+    content = json.dumps(data, indent=indent, default=str)
+
+    # Written to a sibling and renamed over the target, so other processes
+    # polling the file never read a partial write
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def dumps(data: Any, indent: bool = False) -> str:
+    """
+    Serialize data to a JSON string, using orjson when installed.
+
+    Values json can't encode natively are converted with str(), as with
+    json.dumps(default=str).
+
+    Args:
+        data: Data to serialize
+        indent: Indent with two spaces
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        try:
+            return orjson.dumps(data, default=str, option=option).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(data, indent=2 if indent else None, default=str)
 
 
 def generate_id(prefix: str = "") -> str:
@@ -85,11 +148,36 @@ def generate_id(prefix: str = "") -> str:
     return unique_id
 
 
+def generate_ids(count: int, prefix: str = "") -> List[str]:
+    """
+    Generate several unique identifiers from one random read.
+
+    IDs have the same form as generate_id(): 8 random uppercase hex digits.
+
+    Args:
+        count: Number of IDs to generate
+        prefix: Optional prefix for each ID
+
+    Returns:
+        List of unique identifier strings
+    """
+    raw = os.urandom(4 * count).hex().upper()
+    unique_ids = [raw[i:i + 8] for i in range(0, 8 * count, 8)]
+    if prefix:
+        return [f"{prefix}-{unique_id}" for unique_id in unique_ids]
+    return unique_ids
+
+
 def generate_test_id() -> str:
     """Generate a unique test case ID."""
     return generate_id("TEST")
 
 
+def generate_test_ids(count: int) -> List[str]:
+    """Generate several unique test case IDs."""
+    return generate_ids(count, "TEST")
+
+
 def generate_result_id() -> str:
     """Generate a unique test result ID."""
     return generate_id("RESULT")
@@ -142,6 +230,96 @@ def sanitize_filename(filename: str) -> str:
     return sanitized
 
 
+def compile_linear(pattern: str, flags: int = 0) -> Any:
+    """
+    Compile a regex with RE2 when it is installed and supports the pattern.
+
+    RE2 matches in linear time, so malformed or adversarial input cannot
+    trigger catastrophic backtracking. It has no lookaround or
+    backreferences, and its \\d, \\w and \\s classes are ASCII-only.
+    Patterns it rejects, or every pattern when RE2 is missing or disabled
+    with AGENTIC_USE_RE2=0, are compiled with the standard re module.
+
+    Args:
+        pattern: Regular expression
+        flags: re.IGNORECASE, re.MULTILINE and/or re.DOTALL
+
+    Returns:
+        Compiled pattern with the re.Pattern search/match/finditer API
+    """
+    if re2 is not None:
+        inline = "".join(
+            letter for flag, letter in ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"))
+            if flags & flag
+        )
+        try:
+            return re2.compile(f"(?{inline}){pattern}" if inline else pattern)
+        except Exception:
+            # Unsupported syntax; fall back to the backtracking engine
+            pass
+    return re.compile(pattern, flags)
+
+
+# Non-ASCII characters re.IGNORECASE matches against ASCII letters that
+# str.lower() alone does not turn into that letter
+_FOLD_EXTRA = (("\u0130", "i"), ("\u0131", "i"), ("\u017F", "s"))
+
+
+def fold_case(text: str) -> str:
+    """
+    Lowercase text for case-sensitive searches with lowercase ASCII patterns.
+
+    A lowercased pattern matches the folded text exactly where the same
+    pattern with re.IGNORECASE matches the original, but without
+    IGNORECASE re can use its fast literal-prefix scan. Positions line up
+    with the original, so anchors behave the same.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Folded text of the same length
+    """
+    if not text.isascii():
+        for char, letter in _FOLD_EXTRA:
+            text = text.replace(char, letter)
+    return text.lower()
+
+
+# Escapes whose meaning survives lowercasing: \s, \d and \w are already
+# lowercase, and \b is a word boundary (backspace inside a class)
+_FOLD_SAFE_ESCAPES = frozenset("sdwb")
+
+
+def fold_pattern(pattern: str) -> Optional[str]:
+    """
+    Lowercase a regex for case-sensitive searches of fold_case()d text.
+
+    Only literals can be lowercased safely. Escapes such as \\S, \\W, \\D,
+    \\B, \\A and \\Z, as well as numeric and named escapes, change meaning
+    when lowercased. Non-ASCII literals do not fold the way fold_case()
+    folds text. Patterns containing either are not folded.
+
+    Args:
+        pattern: Regular expression
+
+    Returns:
+        Lowercased pattern, or None when the pattern must be compiled with
+        re.IGNORECASE instead
+    """
+    if not pattern.isascii():
+        return None
+    escaped = False
+    for char in pattern:
+        if escaped:
+            if char.isalnum() and char not in _FOLD_SAFE_ESCAPES:
+                return None
+            escaped = False
+        elif char == "\\":
+            escaped = True
+    return pattern.lower()
+
+
 def parse_env_var(value: str, default: Optional[str] = None) -> str:
     """
     Parse environment variable reference in format ${VAR_NAME}.
@@ -9,7 +9,10 @@ This Flask application provides a web interface for:
 - Chat interface with the orchestrator
 """
 
+import json
 import os
+import queue
+import threading
 from pathlib import Path
 from flask import Flask, jsonify, send_from_directory
 from flask_cors import CORS
@@ -91,31 +94,66 @@ def websocket(ws):
         logger.info(f"WebSocket client disconnected. Total clients: {len(ws_clients)}")
 
 
+# Broadcast messages waiting to be sent; one daemon thread drains the queue
+# in order so request handlers never wait on slow WebSocket clients. Bounded
+# so a stalled client cannot make the backlog grow without limit
+_EVENT_QUEUE_MAX = 1000
+_event_queue: "queue.Queue[str]" = queue.Queue(maxsize=_EVENT_QUEUE_MAX)
+_broadcast_thread = None
+_broadcast_lock = threading.Lock()
+
+
+def _broadcast_worker():
+    """Send queued broadcast messages to every connected WebSocket client"""
+    while True:
+        message = _event_queue.get()
+
+        disconnected = set()
+        # Copy, as WebSocket handlers add and remove clients concurrently
+        for client in list(ws_clients):
+            try:
+                client.send(message)
+            except Exception as e:
+                logger.error(f"Failed to send to WebSocket client: {e}")
+                disconnected.add(client)
+
+        # Remove disconnected clients
+        ws_clients.difference_update(disconnected)
+
+
 def broadcast_event(event_type: str, data: dict):
     """
     Broadcast event to all connected WebSocket clients
 
+    The message is serialized immediately, so later changes to data are not
+    sent, and delivered by a background thread. When the queue is full the
+    event is dropped and logged rather than blocking the caller.
+
     Args:
         event_type: Type of event (approval_requested, workflow_stage_changed, etc.)
         data: Event data to send
     """
-    import json
+    global _broadcast_thread
 
     message = json.dumps({
         'type': event_type,
         'data': data
     })
 
-    disconnected = set()
-    for client in ws_clients:
-        try:
-            client.send(message)
-        except Exception as e:
-            logger.error(f"Failed to send to WebSocket client: {e}")
-            disconnected.add(client)
+    # Started on first use rather than at import, so forked workers each
+    # get their own sender
+    if _broadcast_thread is None or not _broadcast_thread.is_alive():
+        with _broadcast_lock:
+            if _broadcast_thread is None or not _broadcast_thread.is_alive():
+                _broadcast_thread = threading.Thread(
+                    target=_broadcast_worker, name="ws-broadcast", daemon=True
+                )
+                _broadcast_thread.start()
 
-    # Remove disconnected clients
-    ws_clients.difference_update(disconnected)
+    try:
+        _event_queue.put_nowait(message)
+    except queue.Full:
+        logger.warning(f"Broadcast queue full; dropping {event_type} event")
 
 
 # Make broadcast_event available globally
@@ -2,12 +2,13 @@
 Config Routes - API endpoints for configuration management
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 from models.app_profile import ApplicationProfile
 from config.settings import get_settings
-from utils.helpers import load_yaml
+from utils.helpers import dumps, load_yaml
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -15,6 +16,79 @@ logger = get_logger(__name__)
 config_bp = Blueprint('config', __name__)
 settings = get_settings()
 
+# (st_ino, st_mtime_ns, st_size) of the profiles file. The inode catches a
+# file atomically replaced by one of equal size within the mtime granularity
+_Signature = Tuple[int, int, int]
+
+# path -> (signature, applications, profile summaries); entries are shared
+# between requests and must not be mutated
+_profiles_cache: Dict[str, Tuple[_Signature, Dict[str, Any], List[Dict[str, Any]]]] = {}
+
+
+def _profiles_signature(profiles_path: Path) -> Optional[_Signature]:
+    """
+    Return the profiles file's signature, or None if it does not exist
+
+    One stat per request serves the existence check, the ETag and the
+    cache lookup.
+    """
+    try:
+        st = profiles_path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _signature_etag(signature: _Signature) -> str:
+    """Format a file signature as an ETag value"""
+    return "-".join(map(str, signature))
+
+
+def _not_modified(etag: str) -> Optional[Response]:
+    """Return an empty 304 response if the client already holds etag"""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    return _with_etag(Response(status=304), etag)
+
+
+def _with_etag(response: Response, etag: str) -> Response:
+    """Tag a profiles response so clients can revalidate it"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, must-revalidate'
+    return response
+
+
+def _load_profiles(
+    profiles_path: Path, signature: _Signature
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Return (applications, profile summaries), reparsing only when the file changes"""
+    key = str(profiles_path)
+    entry = _profiles_cache.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1], entry[2]
+
+    profiles_data = load_yaml(key)
+    applications = profiles_data.get('applications', {})
+
+    profiles_list = []
+    for app_name, app_config in applications.items():
+        profiles_list.append({
+            'name': app_name,
+            'app_type': app_config.get('app_type', 'N/A'),
+            'adapter': app_config.get('adapter', 'N/A'),
+            'base_url': app_config.get('base_url', 'N/A'),
+            'test_framework': app_config.get('test_framework', 'N/A'),
+            'description': app_config.get('description', 'N/A')
+        })
+
+    _profiles_cache[key] = (signature, applications, profiles_list)
+    return applications, profiles_list
+
+
+# Serialized /settings response; settings are loaded once per process, so it
+# is built on the first request and served as-is afterwards
+_settings_body: Optional[str] = None
+
 
 @config_bp.route('/profiles', methods=['GET'])
 def get_profiles():
@@ -22,31 +96,26 @@ def get_profiles():
     try:
         profiles_path = Path("config/app_profiles.yaml")
 
-        if not profiles_path.exists():
+        signature = _profiles_signature(profiles_path)
+        if signature is None:
             return jsonify({
                 'success': True,
                 'profiles': []
             })
 
-        profiles_data = load_yaml(str(profiles_path))
-        applications = profiles_data.get('applications', {})
-
-        profiles_list = []
-        for app_name, app_config in applications.items():
-            profiles_list.append({
-                'name': app_name,
-                'app_type': app_config.get('app_type', 'N/A'),
-                'adapter': app_config.get('adapter', 'N/A'),
-                'base_url': app_config.get('base_url', 'N/A'),
-                'test_framework': app_config.get('test_framework', 'N/A'),
-                'description': app_config.get('description', 'N/A')
-            })
+        # Repeat polls of an unchanged file skip the parse and serialization
+        etag = _signature_etag(signature)
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        _, profiles_list = _load_profiles(profiles_path, signature)
 
-        return jsonify({
+        return _with_etag(jsonify({
             'success': True,
             'count': len(profiles_list),
             'profiles': profiles_list
-        })
+        }), etag)
 
     except Exception as e:
         logger.error(f"Error getting profiles: {e}")
@@ -59,19 +128,24 @@ def get_profile(profile_name):
     try:
         profiles_path = Path("config/app_profiles.yaml")
 
-        if not profiles_path.exists():
+        signature = _profiles_signature(profiles_path)
+        if signature is None:
             return jsonify({'error': 'Profiles file not found'}), 404
 
-        profiles_data = load_yaml(str(profiles_path))
-        applications = profiles_data.get('applications', {})
+        etag = _signature_etag(signature)
+        not_modified = _not_modified(etag)
+        if not_modified is not None:
+            return not_modified
+
+        applications, _ = _load_profiles(profiles_path, signature)
 
         if profile_name not in applications:
             return jsonify({'error': 'Profile not found'}), 404
 
-        return jsonify({
+        return _with_etag(jsonify({
             'success': True,
             'profile': applications[profile_name]
-        })
+        }), etag)
 
     except Exception as e:
         logger.error(f"Error getting profile {profile_name}: {e}")
@@ -81,22 +155,26 @@ def get_profile(profile_name):
 @config_bp.route('/settings', methods=['GET'])
 def get_settings_info():
     """Get current framework settings (non-sensitive)"""
+    global _settings_body
     try:
-        return jsonify({
-            'success': True,
-            'settings': {
-                'llm_provider': settings.llm_provider,
-                'llm_model': settings.llm_model,
-                'vector_store': settings.vector_store,
-                'hitl_mode': settings.hitl_mode,
-                'approval_timeout': settings.approval_timeout,
-                'test_framework': settings.test_framework,
-                'parallel_execution': settings.parallel_execution,
-                'max_workers': settings.max_workers,
-                'headless_mode': settings.headless_mode,
-                'enable_web_interface': settings.enable_web_interface
-            }
-        })
+        if _settings_body is None:
+            _settings_body = dumps({
+                'success': True,
+                'settings': {
+                    'llm_provider': settings.llm_provider,
+                    'llm_model': settings.llm_model,
+                    'vector_store': settings.vector_store,
+                    'hitl_mode': settings.hitl_mode,
+                    'approval_timeout': settings.approval_timeout,
+                    'test_framework': settings.test_framework,
+                    'parallel_execution': settings.parallel_execution,
+                    'max_workers': settings.max_workers,
+                    'headless_mode': settings.headless_mode,
+                    'enable_web_interface': settings.enable_web_interface
+                }
+            })
+
+        return Response(_settings_body, mimetype='application/json')
 
     except Exception as e:
         logger.error(f"Error getting settings: {e}")
@@ -5,10 +5,12 @@ Feedback Routes - API endpoints for feedback submission
 from flask import Blueprint, jsonify, request, current_app
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
 
 from models.approval import Feedback
 from utils.helpers import save_json, load_json
 from utils.logger import get_logger
+from web_ui.services.json_index import JsonDirIndex
 
 logger = get_logger(__name__)
 
@@ -19,6 +21,23 @@ FEEDBACK_DIR = Path("feedback")
 FEEDBACK_DIR.mkdir(exist_ok=True)
 
 
+def _raise_load_error(path: Path, error: Exception) -> None:
+    # A bad feedback file fails the lookup, as the per-request scan did
+    raise error
+
+
+# Parsed feedback, re-read only for files changed since the last lookup
+_index: Optional[JsonDirIndex] = None
+
+
+def _feedback_index() -> JsonDirIndex:
+    """Return the parsed-feedback index for the current FEEDBACK_DIR"""
+    global _index
+    if _index is None or _index.directory != FEEDBACK_DIR:
+        _index = JsonDirIndex(FEEDBACK_DIR, on_error=_raise_load_error)
+    return _index
+
+
 @feedback_bp.route('/', methods=['POST'])
 def submit_feedback():
     """Submit feedback on a test result or approval"""
@@ -94,8 +113,7 @@ def get_feedback_for_item(item_id):
     try:
         feedback_list = []
 
-        for feedback_file in FEEDBACK_DIR.glob("*.json"):
-            feedback_data = load_json(str(feedback_file))
+        for feedback_data in _feedback_index().values():
             if feedback_data.get('item_id') == item_id:
                 feedback_list.append(feedback_data)
 
@@ -8,14 +8,18 @@ This service handles:
 - Statistics and reporting
 """
 
+import copy
+import heapq
 import os
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from models.approval import Approval, ApprovalStatus, ApprovalType
-from utils.helpers import load_json, save_json
+from utils.helpers import save_json
 from utils.logger import get_logger
+from web_ui.services.json_index import JsonDirIndex
 
 logger = get_logger(__name__)
 
@@ -23,6 +27,34 @@ logger = get_logger(__name__)
 APPROVALS_DIR = Path("approvals")
 APPROVALS_DIR.mkdir(exist_ok=True)
 
+# APPROVAL_CACHE=1 persists the parsed-approval index next to the approvals
+# so restarted workers skip re-reading unchanged files
+_SNAPSHOT_NAME = ".index_snapshot"
+
+_index: Optional[JsonDirIndex] = None
+
+# (index, index generation, statistics) of the last get_statistics() call
+_stats_cache: Optional[Tuple[JsonDirIndex, int, Dict[str, Any]]] = None
+
+
+def _approval_index() -> JsonDirIndex:
+    """Return the parsed-approval index for the current APPROVALS_DIR"""
+    global _index
+    if _index is None or _index.directory != APPROVALS_DIR:
+        _index = JsonDirIndex(
+            APPROVALS_DIR,
+            parse=lambda data: Approval(**data),
+            on_error=lambda path, e: logger.error(f"Error loading approval {path}: {e}"),
+            snapshot=APPROVALS_DIR / _SNAPSHOT_NAME if os.getenv("APPROVAL_CACHE") == "1" else None,
+        )
+    return _index
+
+
+def _save_approval(approval: Approval, approval_file: Path) -> None:
+    """Write an approval and drop its cached copy from the index"""
+    save_json(approval.dict(), str(approval_file))
+    _approval_index().invalidate(approval_file)
+
 
 class ApprovalService:
     """Service for managing approval operations"""
@@ -36,35 +68,36 @@ class ApprovalService:
             List of pending approval summaries
         """
         pending = []
+        # One clock read so every approval's remaining time uses the same instant
+        now = datetime.now()
 
-        for approval_file in APPROVALS_DIR.glob("*.json"):
+        for approval_file, approval in _approval_index().items():
             try:
-                approval_data = load_json(str(approval_file))
-                approval = Approval(**approval_data)
-
                 if approval.status == ApprovalStatus.PENDING:
                     # Calculate time remaining
-                    elapsed = (datetime.now() - approval.requested_at).total_seconds()
+                    elapsed = (now - approval.requested_at).total_seconds()
                     time_remaining = max(0, approval.timeout_seconds - elapsed)
 
-                    pending.append({
+                    pending.append((approval.requested_at, {
                         'id': approval.id,
                         'type': approval.approval_type.value,
                         'item_id': approval.item_id,
                         'summary': approval.item_summary,
-                        'status': approval.status.value,
+                        'status': ApprovalStatus.PENDING.value,
                         'requested_at': approval.requested_at.isoformat(),
                         'timeout_seconds': approval.timeout_seconds,
                         'time_remaining': int(time_remaining),
                         'is_expired': time_remaining <= 0
-                    })
+                    }))
             except Exception as e:
                 logger.error(f"Error loading approval {approval_file}: {e}")
 
-        # Sort by requested_at (newest first)
-        pending.sort(key=lambda x: x['requested_at'], reverse=True)
+        # Sort by requested_at (newest first) on the datetimes themselves;
+        # the elapsed-time arithmetic above already rejects any that cannot
+        # be compared with a naive datetime
+        pending.sort(key=lambda x: x[0], reverse=True)
 
-        return pending
+        return [summary for _, summary in pending]
 
     @staticmethod
     def get_approval(approval_id: str) -> Optional[Dict[str, Any]]:
@@ -77,15 +110,18 @@ class ApprovalService:
         Returns:
             Approval details or None if not found
         """
-        approval_file = APPROVALS_DIR / f"{approval_id}.json"
-
-        if not approval_file.exists():
+        try:
+            # Served from the approval index, so an unchanged file costs one
+            # stat. Deep-copied so callers never share item_data, context or
+            # the other mutable values with the index
+            approval = _approval_index().get(f"{approval_id}.json").model_copy(deep=True)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error loading approval {approval_id}: {e}")
             return None
 
         try:
-            approval_data = load_json(str(approval_file))
-            approval = Approval(**approval_data)
-
             # Calculate time remaining
             elapsed = (datetime.now() - approval.requested_at).total_seconds()
             time_remaining = max(0, approval.timeout_seconds - elapsed)
@@ -132,13 +168,17 @@ class ApprovalService:
         """
         approval_file = APPROVALS_DIR / f"{approval_id}.json"
 
-        if not approval_file.exists():
+        try:
+            # The indexed approval is shared, so it is only read here and
+            # updates are written from a model_copy()
+            approval = _approval_index().get(f"{approval_id}.json")
+        except FileNotFoundError:
             return {'error': 'Approval not found', 'status': 404}
+        except Exception as e:
+            logger.error(f"Error approving {approval_id}: {e}")
+            return {'error': str(e), 'status': 500}
 
         try:
-            approval_data = load_json(str(approval_file))
-            approval = Approval(**approval_data)
-
             # Check if already processed
             if approval.status != ApprovalStatus.PENDING:
                 return {
@@ -149,18 +189,20 @@ class ApprovalService:
             # Check if expired
             elapsed = (datetime.now() - approval.requested_at).total_seconds()
             if elapsed > approval.timeout_seconds:
-                approval.status = ApprovalStatus.TIMEOUT
-                save_json(approval.dict(), str(approval_file))
+                # Written once: the approval then fails the status check above
+                _save_approval(approval.model_copy(update={'status': ApprovalStatus.TIMEOUT}), approval_file)
                 return {'error': 'Approval expired', 'status': 400}
 
             # Update approval
-            approval.status = ApprovalStatus.APPROVED
-            approval.approved_by = approved_by
-            approval.approved_at = datetime.now()
-            approval.comments = comments
+            approval = approval.model_copy(update={
+                'status': ApprovalStatus.APPROVED,
+                'approved_by': approved_by,
+                'approved_at': datetime.now(),
+                'comments': comments,
+            })
 
             # Save updated approval
-            save_json(approval.dict(), str(approval_file))
+            _save_approval(approval, approval_file)
 
             logger.info(f"Approval {approval_id} approved by {approved_by}")
 
@@ -197,13 +239,17 @@ class ApprovalService:
         """
         approval_file = APPROVALS_DIR / f"{approval_id}.json"
 
-        if not approval_file.exists():
+        try:
+            # The indexed approval is shared, so it is only read here and
+            # updates are written from a model_copy()
+            approval = _approval_index().get(f"{approval_id}.json")
+        except FileNotFoundError:
             return {'error': 'Approval not found', 'status': 404}
+        except Exception as e:
+            logger.error(f"Error rejecting {approval_id}: {e}")
+            return {'error': str(e), 'status': 500}
 
         try:
-            approval_data = load_json(str(approval_file))
-            approval = Approval(**approval_data)
-
             # Check if already processed
             if approval.status != ApprovalStatus.PENDING:
                 return {
@@ -212,13 +258,15 @@ class ApprovalService:
                 }
 
             # Update approval
-            approval.status = ApprovalStatus.REJECTED
-            approval.approved_by = approved_by
-            approval.approved_at = datetime.now()
-            approval.rejection_reason = rejection_reason
+            approval = approval.model_copy(update={
+                'status': ApprovalStatus.REJECTED,
+                'approved_by': approved_by,
+                'approved_at': datetime.now(),
+                'rejection_reason': rejection_reason,
+            })
 
             # Save updated approval
-            save_json(approval.dict(), str(approval_file))
+            _save_approval(approval, approval_file)
 
             logger.info(f"Approval {approval_id} rejected by {approved_by}: {rejection_reason}")
 
@@ -258,13 +306,17 @@ class ApprovalService:
         """
         approval_file = APPROVALS_DIR / f"{approval_id}.json"
 
-        if not approval_file.exists():
+        try:
+            # The indexed approval is shared, so it is only read here and
+            # updates are written from a model_copy()
+            approval = _approval_index().get(f"{approval_id}.json")
+        except FileNotFoundError:
             return {'error': 'Approval not found', 'status': 404}
+        except Exception as e:
+            logger.error(f"Error modifying {approval_id}: {e}")
+            return {'error': str(e), 'status': 500}
 
         try:
-            approval_data = load_json(str(approval_file))
-            approval = Approval(**approval_data)
-
             # Check if already processed
             if approval.status != ApprovalStatus.PENDING:
                 return {
@@ -275,23 +327,23 @@ class ApprovalService:
             # Check if expired
             elapsed = (datetime.now() - approval.requested_at).total_seconds()
             if elapsed > approval.timeout_seconds:
-                approval.status = ApprovalStatus.TIMEOUT
-                save_json(approval.dict(), str(approval_file))
+                # Written once: the approval then fails the status check above
+                _save_approval(approval.model_copy(update={'status': ApprovalStatus.TIMEOUT}), approval_file)
                 return {'error': 'Approval expired', 'status': 400}
 
-            # Update approval
-            approval.status = ApprovalStatus.MODIFIED
-            approval.approved_by = approved_by
-            approval.approved_at = datetime.now()
-            approval.modifications = modifications
-            approval.comments = comments
-
-            # Apply modifications to create modified_item
-            approval.modified_item = approval.item_data.copy()
-            approval.modified_item.update(modifications)
+            # Update approval, applying modifications to create modified_item
+            approval = approval.model_copy(update={
+                'status': ApprovalStatus.MODIFIED,
+                'approved_by': approved_by,
+                'approved_at': datetime.now(),
+                'modifications': modifications,
+                'comments': comments,
+                # item_data's nested values belong to the indexed record
+                'modified_item': copy.deepcopy({**approval.item_data, **modifications}),
+            })
 
             # Save updated approval
-            save_json(approval.dict(), str(approval_file))
+            _save_approval(approval, approval_file)
 
             logger.info(f"Approval {approval_id} modified by {approved_by}")
 
@@ -315,9 +367,32 @@ class ApprovalService:
         """
         Get approval statistics
 
+        Statistics only depend on the stored approvals, so they are reused
+        until the approval index reports a change.
+
         Returns:
             Statistics dictionary
         """
+        global _stats_cache
+        index = _approval_index()
+        generation, items = index.scan()
+
+        if _stats_cache is not None and _stats_cache[0] is index and _stats_cache[1] == generation:
+            stats = _stats_cache[2]
+        else:
+            stats = ApprovalService._compute_statistics(items)
+            _stats_cache = (index, generation, stats)
+
+        # Callers get their own containers; the cached copy stays intact
+        return {
+            **stats,
+            'by_type': dict(stats['by_type']),
+            'recent_approvals': [dict(r) for r in stats['recent_approvals']],
+        }
+
+    @staticmethod
+    def _compute_statistics(items: List[Tuple[Path, Approval]]) -> Dict[str, Any]:
+        """Aggregate statistics over (path, approval) pairs from the index"""
         stats = {
             'total': 0,
             'pending': 0,
@@ -332,53 +407,45 @@ class ApprovalService:
 
         approval_times = []
         recent = []
+        status_counts = Counter()
+        type_counts = Counter()
 
-        for approval_file in APPROVALS_DIR.glob("*.json"):
+        for approval_file, approval in items:
             try:
-                approval_data = load_json(str(approval_file))
-                approval = Approval(**approval_data)
-
                 stats['total'] += 1
-
-                # Count by status
-                if approval.status == ApprovalStatus.PENDING:
-                    stats['pending'] += 1
-                elif approval.status == ApprovalStatus.APPROVED:
-                    stats['approved'] += 1
-                elif approval.status == ApprovalStatus.REJECTED:
-                    stats['rejected'] += 1
-                elif approval.status == ApprovalStatus.MODIFIED:
-                    stats['modified'] += 1
-                elif approval.status == ApprovalStatus.TIMEOUT:
-                    stats['timeout'] += 1
-
-                # Count by type
-                type_key = approval.approval_type.value
-                stats['by_type'][type_key] = stats['by_type'].get(type_key, 0) + 1
+                status_counts[approval.status] += 1
+                type_counts[approval.approval_type.value] += 1
 
                 # Calculate approval time
                 if approval.approved_at:
                     approval_time = (approval.approved_at - approval.requested_at).total_seconds()
                     approval_times.append(approval_time)
 
-                # Add to recent approvals
-                recent.append({
-                    'id': approval.id,
-                    'type': approval.approval_type.value,
-                    'status': approval.status.value,
-                    'requested_at': approval.requested_at.isoformat(),
-                    'approved_at': approval.approved_at.isoformat() if approval.approved_at else None
-                })
+                recent.append(approval)
 
             except Exception as e:
                 logger.error(f"Error processing approval {approval_file}: {e}")
 
+        # Count by status; every status has its own stats key
+        for status, count in status_counts.items():
+            stats[status.value] = count
+        stats['by_type'] = dict(type_counts)
+
         # Calculate average approval time
         if approval_times:
             stats['average_approval_time'] = sum(approval_times) / len(approval_times)
 
-        # Sort recent approvals by date (newest first) and limit to 10
-        recent.sort(key=lambda x: x['requested_at'], reverse=True)
-        stats['recent_approvals'] = recent[:10]
+        # 10 most recently requested (newest first); nlargest matches a stable
+        # reverse sort, so ties keep directory order
+        stats['recent_approvals'] = [
+            {
+                'id': approval.id,
+                'type': approval.approval_type.value,
+                'status': approval.status.value,
+                'requested_at': approval.requested_at.isoformat(),
+                'approved_at': approval.approved_at.isoformat() if approval.approved_at else None
+            }
+            for approval in heapq.nlargest(10, recent, key=lambda a: a.requested_at.isoformat())
+        ]
 
         return stats
@@ -0,0 +1,230 @@
+"""
+JSON Directory Index - In-process cache of parsed JSON records
+
+Approvals and feedback are stored one JSON file per record and listed by
+scanning their directory. The index keeps each parsed record in memory and
+only re-reads files whose inode, size or modification time changed (atomic
+writes replace the inode even when size and mtime match), so a listing
+costs one directory scan and a stat per file instead of an open, a JSON
+parse and a model validation per file.
+
+An optional snapshot file persists the raw records with their file
+signatures, so a freshly started worker reads one file instead of every
+record file and still re-reads only the files changed since.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.helpers import dumps, load_json
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# (st_ino, st_mtime_ns, st_size) of a file when it was parsed
+_Signature = Tuple[int, int, int]
+
+# (signature, raw data, parsed record, path) of one indexed file; the path is
+# kept because building a Path per file costs more than the stat
+_Entry = Tuple[_Signature, Dict[str, Any], Any, Path]
+
+_SNAPSHOT_VERSION = 2
+
+
+class JsonDirIndex:
+    """
+    Parsed ``*.json`` files of one directory, revalidated on every read
+
+    Files are matched like ``Path.glob("*.json")`` and returned in directory
+    order. Other processes may write the files in place, so every refresh
+    stats each file rather than trusting the directory mtime. Files that
+    fail to load or parse are passed to ``on_error`` on every refresh and
+    skipped, matching a plain scan.
+
+    The snapshot is plain JSON rather than pickle, so a writable record
+    directory cannot be turned into code execution; its name must not end
+    in ``.json``.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        parse: Callable[[Dict[str, Any]], Any] = lambda data: data,
+        on_error: Optional[Callable[[Path, Exception], None]] = None,
+        snapshot: Optional[Path] = None,
+    ):
+        self.directory = Path(directory)
+        self._parse = parse
+        self._on_error = on_error
+        self._snapshot = Path(snapshot) if snapshot is not None else None
+        self._snapshot_loaded = False
+        # file name -> (signature, raw data, parsed record, path)
+        self._entries: Dict[str, _Entry] = {}
+        # Bumped whenever a record is added, changed or dropped
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def items(self) -> List[Tuple[Path, Any]]:
+        """
+        Return (path, parsed record) pairs for every readable file
+
+        Returns:
+            List of pairs in directory order
+        """
+        return self.scan()[1]
+
+    def scan(self) -> Tuple[int, List[Tuple[Path, Any]]]:
+        """
+        Refresh the index and return its generation with its items
+
+        The generation only changes when the set of records does, so callers
+        can reuse anything they derived from an earlier scan with the same
+        generation.
+
+        Returns:
+            (generation, list of (path, parsed record) pairs)
+        """
+        with self._lock:
+            if self._snapshot is not None and not self._snapshot_loaded:
+                self._snapshot_loaded = True
+                self._entries = self._load_snapshot()
+
+            entries: Dict[str, _Entry] = {}
+            items = []
+            reparsed = False
+
+            try:
+                it = os.scandir(self.directory)
+            except FileNotFoundError:
+                # Same as globbing a missing directory
+                if self._entries:
+                    self._generation += 1
+                self._entries = entries
+                return self._generation, items
+
+            with it:
+                for entry in it:
+                    if not entry.name.endswith(".json"):
+                        continue
+
+                    cached = self._entries.get(entry.name)
+                    path = cached[3] if cached is not None else self.directory / entry.name
+                    try:
+                        st = entry.stat()
+                        signature = (entry.inode(), st.st_mtime_ns, st.st_size)
+                        if cached is not None and cached[0] == signature:
+                            _, data, record, _ = cached
+                        else:
+                            data = load_json(str(path))
+                            record = self._parse(data)
+                            reparsed = True
+                    except Exception as e:
+                        if self._on_error is not None:
+                            self._on_error(path, e)
+                        continue
+
+                    entries[entry.name] = (signature, data, record, path)
+                    items.append((path, record))
+
+            # Drop records whose files were removed
+            removed = any(name not in entries for name in self._entries)
+            self._entries = entries
+
+            if reparsed or removed:
+                self._generation += 1
+                if self._snapshot is not None:
+                    self._save_snapshot()
+
+            return self._generation, items
+
+    def get(self, name: str) -> Any:
+        """
+        Return the parsed record of one file, re-reading it only if it changed
+
+        Args:
+            name: File name within the directory
+
+        Returns:
+            Parsed record
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            Exception: Whatever loading or parsing the file raised
+        """
+        path = self.directory / name
+        if Path(name).name != name:
+            # Not a direct child of the directory, so never indexed
+            return self._parse(load_json(str(path)))
+
+        with self._lock:
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                if self._entries.pop(name, None) is not None:
+                    self._generation += 1
+                raise
+
+            signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+            cached = self._entries.get(name)
+            if cached is not None and cached[0] == signature:
+                return cached[2]
+
+            data = load_json(str(path))
+            record = self._parse(data)
+            self._entries[name] = (signature, data, record, path)
+            self._generation += 1
+            return record
+
+    def values(self) -> List[Any]:
+        """Return every readable parsed record in directory order"""
+        return [record for _, record in self.items()]
+
+    def invalidate(self, path: Path) -> None:
+        """Forget one file so the next read re-parses it"""
+        with self._lock:
+            if self._entries.pop(Path(path).name, None) is not None:
+                self._generation += 1
+
+    def _load_snapshot(self) -> Dict[str, _Entry]:
+        """Read the snapshot; a missing, stale-format or corrupt one is ignored"""
+        try:
+            snapshot = load_json(str(self._snapshot))
+            if snapshot.get("version") != _SNAPSHOT_VERSION:
+                return {}
+            raw_entries = snapshot["entries"]
+            if not isinstance(raw_entries, dict):
+                raise ValueError("entries is not an object")
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable index snapshot {self._snapshot}: {e}")
+            return {}
+
+        entries = {}
+        for name, raw in raw_entries.items():
+            try:
+                ino, mtime_ns, size, data = raw
+                entries[name] = ((ino, mtime_ns, size), data, self._parse(data), self.directory / name)
+            except Exception:
+                # Re-read from the record file, which reports the error
+                continue
+        return entries
+
+    def _save_snapshot(self) -> None:
+        """Write the snapshot atomically; failures only cost the next cold start"""
+        snapshot = {
+            "version": _SNAPSHOT_VERSION,
+            "entries": {
+                name: [*signature, data]
+                for name, (signature, data, _, _) in self._entries.items()
+            },
+        }
+        tmp_path = self._snapshot.with_name(f"{self._snapshot.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(dumps(snapshot))
+            os.replace(tmp_path, self._snapshot)
+        except OSError as e:
+            logger.warning(f"Could not write index snapshot {self._snapshot}: {e}")
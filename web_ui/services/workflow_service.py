@@ -8,8 +8,11 @@ This service handles:
 - Progress tracking
 """
 
+import threading
+import time
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from datetime import datetime
 
 from utils.helpers import load_json
@@ -77,6 +80,44 @@ WORKFLOW_STATE: Dict[str, Any] = {
 }
 
 
+# Stage names never change: update_status only merges into existing stages
+_VALID_STAGES = frozenset(WORKFLOW_STATE['stages'])
+
+# Serializes the mutators, which read-modify-write WORKFLOW_STATE across
+# several statements. Reads stay lock-free: they copy the top-level dict,
+# which is atomic
+_write_lock = threading.RLock()
+
+
+# start_time strings are written once and parsed on every status poll and
+# stage completion; keyed on the string, so values set via update_status
+# are still honoured
+_parse_time = lru_cache(maxsize=16)(datetime.fromisoformat)
+
+
+# (start_time string, perf_counter reading) taken by start_workflow, so a
+# running status poll measures elapsed time without reading the wall clock.
+# Only used while WORKFLOW_STATE still holds that start_time
+_run_clock: Optional[Tuple[str, float]] = None
+
+
+def _mutator(func: Callable) -> Callable:
+    """Run a WorkflowService mutator under the write lock"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _write_lock:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _running_elapsed(start_time: str) -> float:
+    """Return the seconds since start_time for the running workflow"""
+    clock = _run_clock
+    if clock is not None and clock[0] == start_time:
+        return time.perf_counter() - clock[1]
+    return (datetime.now() - _parse_time(start_time)).total_seconds()
+
+
 class WorkflowService:
     """Service for managing workflow monitoring"""
 
@@ -92,12 +133,12 @@ class WorkflowService:
 
         # Calculate elapsed time if workflow is running
         if status['status'] == 'in_progress' and status['start_time']:
-            start = datetime.fromisoformat(status['start_time'])
-            status['elapsed_time'] = (datetime.now() - start).total_seconds()
+            status['elapsed_time'] = _running_elapsed(status['start_time'])
 
         return status
 
     @staticmethod
+    @_mutator
     def update_status(updates: Dict[str, Any]) -> None:
         """
         Update workflow status
@@ -107,19 +148,21 @@ class WorkflowService:
         """
         global WORKFLOW_STATE
 
-        # Update top-level fields
-        for key, value in updates.items():
-            if key == 'stages':
-                # Merge stage updates
-                for stage_name, stage_data in value.items():
-                    if stage_name in WORKFLOW_STATE['stages']:
-                        WORKFLOW_STATE['stages'][stage_name].update(stage_data)
-            else:
-                WORKFLOW_STATE[key] = value
+        # Update top-level fields in one call
+        if 'stages' not in updates:
+            WORKFLOW_STATE.update(updates)
+        else:
+            WORKFLOW_STATE.update({key: value for key, value in updates.items() if key != 'stages'})
+
+            # Merge stage updates
+            for stage_name, stage_data in updates['stages'].items():
+                if stage_name in _VALID_STAGES:
+                    WORKFLOW_STATE['stages'][stage_name].update(stage_data)
 
         logger.debug(f"Workflow status updated: {updates}")
 
     @staticmethod
+    @_mutator
     def start_workflow(app_name: str, feature_description: str) -> None:
         """
         Mark workflow as started
@@ -128,13 +171,16 @@ class WorkflowService:
             app_name: Application name
             feature_description: Feature being tested
         """
-        global WORKFLOW_STATE
+        global WORKFLOW_STATE, _run_clock
+
+        start_time = datetime.now().isoformat()
+        _run_clock = (start_time, time.perf_counter())
 
         WORKFLOW_STATE.update({
             'status': 'in_progress',
             'current_stage': 'discovery',
             'completed_stages': [],
-            'start_time': datetime.now().isoformat(),
+            'start_time': start_time,
             'elapsed_time': 0,
             'app_name': app_name,
             'feature_description': feature_description
@@ -151,6 +197,7 @@ class WorkflowService:
         logger.info(f"Workflow started for {app_name}: {feature_description}")
 
     @staticmethod
+    @_mutator
     def start_stage(stage_name: str) -> None:
         """
         Mark a stage as started
@@ -158,7 +205,7 @@ class WorkflowService:
         Args:
             stage_name: Name of the stage
         """
-        if stage_name in WORKFLOW_STATE['stages']:
+        if stage_name in _VALID_STAGES:
             WORKFLOW_STATE['current_stage'] = stage_name
             WORKFLOW_STATE['stages'][stage_name].update({
                 'status': 'in_progress',
@@ -168,6 +215,7 @@ class WorkflowService:
             logger.info(f"Stage started: {stage_name}")
 
     @staticmethod
+    @_mutator
     def complete_stage(stage_name: str, results: Dict[str, Any]) -> None:
         """
         Mark a stage as completed
@@ -176,27 +224,25 @@ class WorkflowService:
             stage_name: Name of the stage
             results: Stage results to store
         """
-        if stage_name in WORKFLOW_STATE['stages']:
+        if stage_name in _VALID_STAGES:
             end_time = datetime.now()
             stage = WORKFLOW_STATE['stages'][stage_name]
 
             # Calculate duration
             if stage['start_time']:
-                start = datetime.fromisoformat(stage['start_time'])
+                start = _parse_time(stage['start_time'])
                 duration = (end_time - start).total_seconds()
             else:
                 duration = 0
 
-            # Update stage
+            # Update stage; stage-specific results may override any field
             stage.update({
                 'status': 'completed',
                 'end_time': end_time.isoformat(),
-                'duration': duration
+                'duration': duration,
+                **results
             })
 
-            # Update stage-specific results
-            stage.update(results)
-
             # Add to completed stages
             if stage_name not in WORKFLOW_STATE['completed_stages']:
                 WORKFLOW_STATE['completed_stages'].append(stage_name)
@@ -204,6 +250,7 @@ class WorkflowService:
             logger.info(f"Stage completed: {stage_name} (duration: {duration:.2f}s)")
 
     @staticmethod
+    @_mutator
     def fail_stage(stage_name: str, error: str) -> None:
         """
         Mark a stage as failed
@@ -212,13 +259,13 @@ class WorkflowService:
             stage_name: Name of the stage
             error: Error message
         """
-        if stage_name in WORKFLOW_STATE['stages']:
+        if stage_name in _VALID_STAGES:
             end_time = datetime.now()
             stage = WORKFLOW_STATE['stages'][stage_name]
 
             # Calculate duration
             if stage['start_time']:
-                start = datetime.fromisoformat(stage['start_time'])
+                start = _parse_time(stage['start_time'])
                 duration = (end_time - start).total_seconds()
             else:
                 duration = 0
@@ -237,18 +284,20 @@ class WorkflowService:
             logger.error(f"Stage failed: {stage_name} - {error}")
 
     @staticmethod
+    @_mutator
     def complete_workflow() -> None:
         """Mark workflow as completed"""
         WORKFLOW_STATE['status'] = 'completed'
 
         # Calculate total duration
         if WORKFLOW_STATE['start_time']:
-            start = datetime.fromisoformat(WORKFLOW_STATE['start_time'])
+            start = _parse_time(WORKFLOW_STATE['start_time'])
             WORKFLOW_STATE['elapsed_time'] = (datetime.now() - start).total_seconds()
 
         logger.info(f"Workflow completed (duration: {WORKFLOW_STATE['elapsed_time']:.2f}s)")
 
     @staticmethod
+    @_mutator
     def reset_workflow() -> None:
         """Reset workflow to initial state"""
         global WORKFLOW_STATE